@@ -0,0 +1,213 @@
+import numpy as np
+
+from .constants import Constants
+
+EMPTY, PLAYER_MAN, PLAYER_KING, OPPONENT_MAN, OPPONENT_KING = 0, 1, 2, 3, 4
+DIRECTIONS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+def positions_from_boards(boards):
+    """
+    Converts boards to the array form used by the BatchMoveGenerator class.
+
+    Parameters:
+        boards: list
+            List of Board type objects of the same size.
+
+    Output:
+        positions: numpy array of shape (len(boards), ROWS, COLS) and type int8
+            Element [i, row, col] is the code of the piece on square (row, col) of boards[i], see the get_code()
+            method of the Piece class, and 0 for empty squares.
+    """
+    positions = np.zeros((len(boards), Constants.ROWS, Constants.COLS), dtype=np.int8)
+    for idx, board in enumerate(boards):
+        for color in board.piece_squares:
+            for piece in board.get_pieces(color):
+                positions[idx, piece.row, piece.col] = piece.get_code()
+    return positions
+
+
+class BatchMoveGenerator:
+    """
+    Initialized through BatchMoveGenerator.for_size().
+
+    The BatchMoveGenerator class generates the valid steps and single skips of many positions at once with NumPy
+    array operations, and applies one chosen step or skip per position. It is meant for advancing thousands of
+    games in lockstep, e.g. for self-play, and follows the same rules as the get_valid_moves() method of the Board
+    class.
+
+    Positions are numpy arrays of shape (N, ROWS, COLS) as returned by positions_from_boards(). Moves are given per
+    origin square and direction, where the directions are numbered as in DIRECTIONS: 0 up-left, 1 up-right,
+    2 down-left and 3 down-right.
+    """
+    _generators = {}
+
+    def __init__(self, board_size):
+        """
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Instance variables initialized:
+            self.rows, self.cols: int, int
+                Amount of rows and columns of the board.
+            self.step_masks: numpy array of shape (4, ROWS, COLS) and type bool
+                Element [d, row, col] is True if a step from (row, col) in direction d stays on the board.
+            self.skip_masks: numpy array of shape (4, ROWS, COLS) and type bool
+                Element [d, row, col] is True if a skip from (row, col) in direction d stays on the board.
+            self.king_rows: numpy array of shape (ROWS,) and type bool
+                True for the rows where a piece is promoted to king.
+        """
+        self.rows, self.cols = board_size
+        rows, cols = np.indices(board_size)
+        self.step_masks = np.zeros((4, self.rows, self.cols), dtype=bool)
+        self.skip_masks = np.zeros((4, self.rows, self.cols), dtype=bool)
+        for direction, (row_step, col_step) in enumerate(DIRECTIONS):
+            for distance, masks in [(1, self.step_masks), (2, self.skip_masks)]:
+                target_rows, target_cols = rows + distance * row_step, cols + distance * col_step
+                masks[direction] = (target_rows >= 0) & (target_rows < self.rows) & (target_cols >= 0) & (target_cols < self.cols)
+        self.king_rows = np.zeros(self.rows, dtype=bool)
+        self.king_rows[[0, self.rows - 1]] = True
+
+    @classmethod
+    def for_size(cls, board_size):
+        """
+        Returns the generator of the given board size. The masks of a board size are only built the first time
+        it is used.
+
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Output:
+            generator: BatchMoveGenerator object
+        """
+        if board_size not in cls._generators:
+            cls._generators[board_size] = cls(board_size)
+        return cls._generators[board_size]
+
+    def _pad(self, squares):
+        """
+        Returns squares with a border of two False squares around the board, to be read with self._look().
+        """
+        padded = np.zeros((len(squares), self.rows + 4, self.cols + 4), dtype=bool)
+        padded[:, 2:-2, 2:-2] = squares
+        return padded
+
+    def _look(self, padded, row_step, col_step):
+        """
+        Returns a view where element [i, row, col] is element [i, row + row_step, col + col_step] of the squares
+        padded by self._pad(), so False outside the board.
+        """
+        return padded[:, 2 + row_step:2 + row_step + self.rows, 2 + col_step:2 + col_step + self.cols]
+
+    def generate(self, positions, player_to_move):
+        """
+        Generates the valid steps and single skips of every position.
+
+        Parameters:
+            positions: numpy array of shape (N, ROWS, COLS)
+                Positions to generate moves for.
+            player_to_move: numpy array of shape (N,) and type bool
+                True for the positions where it is the player's turn and False where it is the opponent's.
+
+        Output:
+            steps, skips: numpy arrays of shape (N, 4, ROWS, COLS) and type bool
+                Element [i, d, row, col] is True if the piece on (row, col) of position i can step respectively
+                skip in direction d. For any piece, the True elements are the keys of the dictionary returned
+                by Board.get_valid_moves() for that piece.
+        """
+        player = np.asarray(player_to_move, dtype=bool)[:, None, None]
+        own = np.where(player, (positions == PLAYER_MAN) | (positions == PLAYER_KING), (positions == OPPONENT_MAN) | (positions == OPPONENT_KING))
+        opponents = self._pad((positions != EMPTY) & ~own)
+        kings = (positions == PLAYER_KING) | (positions == OPPONENT_KING)
+        empty = self._pad(positions == EMPTY)
+        steps = np.zeros((len(positions), 4) + positions.shape[1:], dtype=bool)
+        skips = np.zeros_like(steps)
+        for direction, (row_step, col_step) in enumerate(DIRECTIONS):
+            forward = player if row_step == -1 else ~player
+            movers = own & (kings | forward)
+            steps[:, direction] = movers & self.step_masks[direction] & self._look(empty, row_step, col_step)
+            skips[:, direction] = movers & self.skip_masks[direction] & self._look(opponents, row_step, col_step) & self._look(empty, 2 * row_step, 2 * col_step)
+        return steps, skips
+
+    def generate_legal(self, positions, player_to_move, only=None):
+        """
+        Generates the moves the participant to move may make in every position. If a position has any valid skip,
+        only skips are legal there, as a participant who can skip has to skip.
+
+        Parameters:
+            positions, player_to_move: see self.generate()
+            only: numpy array of shape (N, ROWS, COLS) and type bool
+                OPTIONAL. Default value: None. If given, only pieces on True squares may move and only skips are
+                legal. Used to continue a skip sequence with the piece that made the previous skip.
+
+        Output:
+            moves: numpy array of shape (N, 4, ROWS, COLS) and type bool
+                Legal moves, indexed as in self.generate().
+            is_skip: numpy array of shape (N,) and type bool
+                True for the positions where the legal moves are skips.
+        """
+        steps, skips = self.generate(positions, player_to_move)
+        if only is not None:
+            skips &= only[:, None]
+            steps[:] = False
+        is_skip = skips.reshape(len(positions), -1).any(axis=1)
+        moves = np.where(is_skip[:, None, None, None], skips, steps)
+        return moves, is_skip
+
+    def sample(self, moves, generator):
+        """
+        Picks one move uniformly at random per position.
+
+        Parameters:
+            moves: numpy array of shape (N, 4, ROWS, COLS) and type bool
+                Legal moves as returned by self.generate_legal().
+            generator: numpy.random.Generator
+                Source of randomness.
+
+        Output:
+            has_move: numpy array of shape (N,) and type bool
+                False for the positions without any legal move. The other outputs are 0 for them.
+            rows, cols, directions: numpy arrays of shape (N,)
+                Origin square and direction of the picked move of every position.
+        """
+        flat = moves.reshape(len(moves), -1)
+        picks = np.argmax(generator.random(flat.shape) * flat, axis=1)
+        has_move = flat.any(axis=1)
+        directions, rows, cols = np.unravel_index(picks, moves.shape[1:])
+        return has_move, rows, cols, directions
+
+    def apply(self, positions, rows, cols, directions, is_skip, active=None):
+        """
+        Applies one step or skip per position in place. The moving piece is promoted if it lands on the first or
+        last row and the skipped piece is removed, as in the move() and remove() methods of the Board class.
+
+        Parameters:
+            positions: numpy array of shape (N, ROWS, COLS)
+                Positions to modify.
+            rows, cols, directions: numpy arrays of shape (N,)
+                Origin square and direction of the move of every position.
+            is_skip: numpy array of shape (N,) and type bool
+                True for the positions where the move is a skip and False where it is a step.
+            active: numpy array of shape (N,) and type bool
+                OPTIONAL. Default value: None. If given, only positions where it is True are modified.
+
+        Output:
+            target_rows, target_cols: numpy arrays of shape (N,)
+                Square every moved piece landed on.
+        """
+        boards = np.arange(len(positions)) if active is None else np.flatnonzero(active)
+        rows, cols, directions, is_skip = rows[boards], cols[boards], directions[boards], is_skip[boards]
+        steps = np.asarray(DIRECTIONS)[directions]
+        distance = np.where(is_skip, 2, 1)
+        target_rows, target_cols = rows + distance * steps[:, 0], cols + distance * steps[:, 1]
+        codes = positions[boards, rows, cols]
+        promoted = self.king_rows[target_rows] & ((codes == PLAYER_MAN) | (codes == OPPONENT_MAN))
+        positions[boards, rows, cols] = EMPTY
+        positions[boards, target_rows, target_cols] = codes + promoted
+        skipped = boards[is_skip]
+        positions[skipped, rows[is_skip] + steps[is_skip, 0], cols[is_skip] + steps[is_skip, 1]] = EMPTY
+        all_target_rows, all_target_cols = np.zeros(len(positions), dtype=np.intp), np.zeros(len(positions), dtype=np.intp)
+        all_target_rows[boards], all_target_cols[boards] = target_rows, target_cols
+        return all_target_rows, all_target_cols
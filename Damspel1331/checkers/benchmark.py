@@ -0,0 +1,168 @@
+"""
+Benchmark of the move generator. Reports nodes per second for steps, single skips and recursive skips, both as
+used by the Game class (get_valid_moves() per piece) and as complete turns (get_capture_sequences() and perft()),
+for every board implementation.
+
+Run from the Damspel1331 directory, e.g.
+
+    python -m checkers.benchmark --size 10 --games 20
+"""
+import argparse
+import random
+import time
+
+from .constants import Constants, get_other_color
+from .game import Game
+from .perft import perft, TEST_POSITIONS
+
+BACKENDS = ['matrix', 'bitboard', 'compact']
+
+
+def collect_positions(board_size, games, seed):
+    """
+    Plays random games and collects every position reached, together with the stored test positions of the
+    board size. Positions are collected as layouts, which means that they can be set up on any board
+    implementation.
+
+    Parameters:
+        board_size: tuple
+            Board size in format (ROWS, COLUMNS).
+        games: int
+            Amount of random games to play.
+        seed: int
+            Seed of the random generator, to benchmark the same positions every run.
+
+    Output:
+        positions: list
+            List of tuples (layout, color to move).
+    """
+    Constants.set_board_size(board_size)
+    generator = random.Random(seed)
+    positions = []
+    for name, (size, side, layout, _) in TEST_POSITIONS.items():
+        if size == board_size and layout is not None:
+            positions.append((layout, Constants.PLAYER_COLOR if side == 'player' else Constants.OPPONENT_COLOR))
+    for _ in range(games):
+        board = Game.create_board()
+        color = Constants.PLAYER_COLOR
+        while not board.winner():
+            moves = board.get_all_moves(color)
+            if not moves:
+                break
+            positions.append((board.get_layout(), color))
+            board.make_move(generator.choice(moves))
+            color = get_other_color(color)
+    return positions
+
+
+def count_steps(board, color):
+    """
+    Generates the valid steps of every piece of the color and returns their amount.
+    """
+    return sum(len(board.get_valid_steps(piece)) for piece in board.get_pieces(color))
+
+
+def count_skips(board, color):
+    """
+    Generates the valid single skips of every piece of the color and returns their amount.
+    """
+    return sum(len(board.get_valid_skips(piece)) for piece in board.get_pieces(color))
+
+
+def count_recursive_skips(board, color):
+    """
+    Generates the valid skips of every piece of the color with recursive skipping, as the BotMover class
+    originally did, and returns their amount.
+    """
+    return sum(len(board.get_valid_moves(piece, get_steps=False, recursive_skipping=True)) for piece in board.get_pieces(color))
+
+
+def count_capture_sequences(board, color):
+    """
+    Generates the complete skip sequences of every piece of the color and returns their amount.
+    """
+    return sum(len(board.get_capture_sequences(piece)) for piece in board.get_pieces(color))
+
+
+def count_all_moves(board, color):
+    """
+    Generates the complete turns of the color and returns their amount.
+    """
+    return len(board.get_all_moves(color))
+
+
+MEASUREMENTS = {
+    'steps': count_steps,
+    'single skips': count_skips,
+    'recursive skips': count_recursive_skips,
+    'capture sequences': count_capture_sequences,
+    'complete turns': count_all_moves,
+}
+
+
+def measure(function, boards, min_seconds):
+    """
+    Calls function(board, color) for every board, repeatedly until at least min_seconds have passed.
+
+    Parameters:
+        function: function
+            Function returning the amount of nodes it generated.
+        boards: list
+            List of tuples (board, color to move).
+        min_seconds: float
+            Least amount of time to measure for.
+
+    Output:
+        nodes_per_second: float
+    """
+    nodes = 0
+    start_time = time.perf_counter()
+    while True:
+        for board, color in boards:
+            nodes += function(board, color)
+        seconds = time.perf_counter() - start_time
+        if seconds >= min_seconds:
+            return nodes / seconds
+
+
+def measure_perft(backend, board_size, depth):
+    """
+    Returns the nodes per second of perft() from the starting position.
+    """
+    Constants.BOARD_BACKEND = backend
+    board = Game.create_board()
+    start_time = time.perf_counter()
+    nodes = perft(board, Constants.PLAYER_COLOR, depth)
+    return nodes / (time.perf_counter() - start_time)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure move generator speed in nodes per second.')
+    parser.add_argument('--size', type=int, default=8, choices=[8, 10, 12], help='board size')
+    parser.add_argument('--games', type=int, default=10, help='amount of random games to collect positions from')
+    parser.add_argument('--seed', type=int, default=1331, help='seed of the random games')
+    parser.add_argument('--seconds', type=float, default=1.0, help='least time to spend on each measurement')
+    parser.add_argument('--perft-depth', type=int, default=4, help='depth of the perft measurement')
+    parser.add_argument('--backends', nargs='+', default=BACKENDS, choices=BACKENDS, help='board implementations to measure')
+    args = parser.parse_args(argv)
+
+    board_size = (args.size, args.size)
+    positions = collect_positions(board_size, args.games, args.seed)
+    print(f'{args.size}x{args.size}, {len(positions)} positions, nodes per second:')
+    print(f'{"":20}' + ''.join(f'{backend:>12}' for backend in args.backends))
+
+    results = {}
+    for backend in args.backends:
+        Constants.BOARD_BACKEND = backend
+        boards = [(Game.create_board(layout), color) for (layout, color) in positions]
+        for name, function in MEASUREMENTS.items():
+            results[name, backend] = measure(function, boards, args.seconds)
+        results[f'perft {args.perft_depth}', backend] = measure_perft(backend, board_size, args.perft_depth)
+
+    for name in list(MEASUREMENTS) + [f'perft {args.perft_depth}']:
+        print(f'{name:20}' + ''.join(f'{results[name, backend]:12.0f}' for backend in args.backends))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
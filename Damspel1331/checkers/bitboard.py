@@ -0,0 +1,264 @@
+from .board import Board
+from .constants import Constants
+from .move import Move
+
+
+class BitLayout:
+    """
+    Initialized through BitLayout.for_size() from the constructor of the BitBoard class.
+
+    The BitLayout class maps the squares of a board of a given size to bits of a Python integer and holds the masks
+    and shift offsets the BitBoard class generates moves with. Square (row, col) is stored in bit number
+    row * (COLS + 1) + col. The extra column on each row is never part of the board, which means that a diagonal
+    shift running off the left or right edge lands in it and is removed by the dark square mask instead of
+    wrapping around to the other side of the board.
+    """
+    _layouts = {}
+
+    def __init__(self, board_size):
+        """
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Instance variables initialized:
+            self.rows, self.cols: int, int
+                Amount of rows and columns of the board.
+            self.width: int
+                Amount of bits used for each row of the board, padding column included.
+            self.bits: list (matrix of size rows x cols)
+                Single bit integer for every square of the board.
+            self.dark_squares: int
+                Mask of all squares that pieces can stand on.
+            self.directions: list
+                List of tuples (row_step, col_step, offset) for the four diagonal directions, where offset is how many
+                bits a piece is shifted when it steps once in that direction. The order is the same as the order
+                in which Board.explore_valid_moves() examines the diagonals.
+        """
+        self.rows, self.cols = board_size
+        self.width = self.cols + 1
+        self.bits = [[1 << (row * self.width + col) for col in range(self.cols)] for row in range(self.rows)]
+        self.dark_squares = 0
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if col % 2 == ((row + 1) % 2):
+                    self.dark_squares |= self.bits[row][col]
+        self.directions = [(row_step, col_step, row_step * self.width + col_step) for row_step in [-1, 1] for col_step in [-1, 1]]
+
+    @classmethod
+    def for_size(cls, board_size):
+        """
+        Returns the layout of the given board size. Layouts are only built the first time a board size is used
+        and are then reused by every following BitBoard instance of that size.
+
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Output:
+            layout: BitLayout object
+        """
+        if board_size not in cls._layouts:
+            cls._layouts[board_size] = cls(board_size)
+        return cls._layouts[board_size]
+
+    def shift(self, bits, offset):
+        """
+        Shifts every set bit of bits one diagonal step. Bits that leave the board are removed.
+
+        Parameters:
+            bits: int
+                Set of squares.
+            offset: int
+                Offset of the direction to shift in, see self.directions.
+
+        Output:
+            int
+                Set of squares one diagonal step away from the input squares.
+        """
+        if offset > 0:
+            return (bits << offset) & self.dark_squares
+        return (bits >> -offset) & self.dark_squares
+
+    def square(self, bit):
+        """
+        Inverse of self.bits. Returns the row and column of a single bit integer.
+        """
+        return divmod(bit.bit_length() - 1, self.width)
+
+    def squares(self, bits):
+        """
+        Returns a list of (row, col) of every set bit of bits, lowest bit first.
+        """
+        squares = []
+        while bits:
+            bit = bits & -bits
+            squares.append(self.square(bit))
+            bits ^= bit
+        return squares
+
+
+class BitBoard(Board):
+    """
+    Initialized from _set_starting_attributes() method in Game class instance when Constants.BOARD_BACKEND is
+    'bitboard'.
+
+    A Board that in addition to the matrix of Piece objects keeps the position as integer bitmasks, one per color
+    and one for kings, and generates steps and skips with shifts and masks instead of indexing the matrix.
+    It has the same methods as the Board class and can be used wherever a Board is expected.
+    """
+    def __init__(self, layout=None):
+        """
+        Parameters:
+            layout: list
+                OPTIONAL. Default value: None. See the constructor of the Board class.
+
+        Instance variables initialized in addition to those of the Board class:
+            self.bit_layout: BitLayout object
+                Bit layout of the current board size.
+            self.color_bits: dictionary
+                Key is a piece color and value is the mask of the squares holding pieces of that color.
+            self.king_bits: int
+                Mask of the squares holding kings of any color.
+        """
+        self.bit_layout = BitLayout.for_size(Constants.BOARD_SIZE)
+        super().__init__(layout)
+
+    def create_board(self, layout=None):
+        """
+        Creates the matrix representation of the board as in the Board class. The bitmasks are filled as the
+        pieces are placed.
+        """
+        self.color_bits = {Constants.PLAYER_COLOR: 0, Constants.OPPONENT_COLOR: 0}
+        self.king_bits = 0
+        super().create_board(layout)
+
+    def _set_square(self, row, col, value):
+        """
+        Writes value into the board matrix as in the Board class and updates the bitmasks of the square
+        accordingly.
+        """
+        bit = self.bit_layout.bits[row][col]
+        old_value = self.board[row][col]
+        if old_value != 0:
+            self.color_bits[old_value.color] &= ~bit
+            self.king_bits &= ~bit
+        super()._set_square(row, col, value)
+        if value != 0:
+            self.color_bits[value.color] |= bit
+            if value.king:
+                self.king_bits |= bit
+
+    def get_occupied(self):
+        """
+        Returns the mask of all squares holding a piece.
+        """
+        occupied = 0
+        for bits in self.color_bits.values():
+            occupied |= bits
+        return occupied
+
+    def get_movable_directions(self, color, king):
+        """
+        Returns the directions of self.bit_layout.directions a piece of the given color and king status may move in.
+        """
+        direction = -1 if color == Constants.PLAYER_COLOR else 1
+        return [(row_step, col_step, offset) for (row_step, col_step, offset) in self.bit_layout.directions if king or row_step == direction]
+
+    def get_skipping_pieces(self, color):
+        """
+        Returns the mask of all pieces of the given color that can make a valid skip. All pieces of the color
+        are examined at once, one shift per direction.
+
+        Parameters:
+            color: tuple
+                Color of the pieces to examine.
+
+        Output:
+            skippers: int
+                Mask of the squares of the pieces that can skip.
+        """
+        occupied = self.get_occupied()
+        empty = self.bit_layout.dark_squares & ~occupied
+        opponents = occupied & ~self.color_bits[color]
+        skippers = 0
+        for king in [False, True]:
+            pieces = self.color_bits[color] & (self.king_bits if king else ~self.king_bits)
+            for (_, _, offset) in self.get_movable_directions(color, king):
+                landing = self.bit_layout.shift(self.bit_layout.shift(pieces, offset) & opponents, offset) & empty
+                skippers |= self.bit_layout.shift(self.bit_layout.shift(landing, -offset), -offset) & pieces
+        return skippers
+
+    def get_stepping_pieces(self, color):
+        """
+        Returns the mask of all pieces of the given color that can make a valid step. All pieces of the color are
+        examined at once, one shift per direction.
+
+        Parameters:
+            color: tuple
+                Color of the pieces to examine.
+
+        Output:
+            steppers: int
+                Mask of the squares of the pieces that can step.
+        """
+        empty = self.bit_layout.dark_squares & ~self.get_occupied()
+        steppers = 0
+        for king in [False, True]:
+            pieces = self.color_bits[color] & (self.king_bits if king else ~self.king_bits)
+            for (_, _, offset) in self.get_movable_directions(color, king):
+                steppers |= self.bit_layout.shift(self.bit_layout.shift(pieces, offset) & empty, -offset) & pieces
+        return steppers
+
+    def get_all_moves(self, color) -> list[Move]:
+        """
+        Bitmask version of Board.get_all_moves() with the same parameters and output, in another order. Which
+        pieces can skip is found for all pieces at once with self.get_skipping_pieces(), so only those pieces
+        are searched for skip sequences. If no piece can skip, the steps of all pieces are read directly from
+        the shifted masks without visiting the pieces one by one.
+        """
+        skippers = self.get_skipping_pieces(color)
+        moves = []
+        if skippers:
+            for (row, col) in self.bit_layout.squares(skippers):
+                moves.extend(self.get_capture_sequences(self.board[row][col]))
+            return moves
+        empty = self.bit_layout.dark_squares & ~self.get_occupied()
+        for king in [False, True]:
+            pieces = self.color_bits[color] & (self.king_bits if king else ~self.king_bits)
+            for (row_step, col_step, offset) in self.get_movable_directions(color, king):
+                for (row, col) in self.bit_layout.squares(self.bit_layout.shift(pieces, offset) & empty):
+                    moves.append(Move((row - row_step, col - col_step), ((row, col),), ()))
+        return moves
+
+    def explore_valid_moves(self, piece, current_row, current_col, step_size, skip_path=[], recursive_skipping=False):
+        """
+        Bitmask version of Board.explore_valid_moves() with the same parameters and output. The diagonals are
+        examined in the same order, which means that the returned dictionaries are equal to those of the Board
+        class, recursive skipping included.
+        """
+        origin = self.bit_layout.bits[current_row][current_col]
+        occupied = self.get_occupied()
+        empty = self.bit_layout.dark_squares & ~occupied
+        valid_moves = {}
+        if step_size == 1:
+            for (row_step, col_step, offset) in self.get_movable_directions(piece.color, piece.king):
+                if self.bit_layout.shift(origin, offset) & empty:
+                    valid_moves[current_row + row_step, current_col + col_step] = []
+            return valid_moves
+
+        skip_path_bits = 0
+        for skipped_piece in skip_path:
+            skip_path_bits |= self.bit_layout.bits[skipped_piece.row][skipped_piece.col]
+        opponents = occupied & ~self.color_bits[piece.color] & ~skip_path_bits
+        for (row_step, col_step, offset) in self.get_movable_directions(piece.color, piece.king):
+            skipped = self.bit_layout.shift(origin, offset) & opponents
+            if not skipped or not self.bit_layout.shift(skipped, offset) & empty:
+                continue
+            target_row, target_col = current_row + 2 * row_step, current_col + 2 * col_step
+            new_skip_path = skip_path.copy()
+            new_skip_path.append(self.board[current_row + row_step][current_col + col_step])
+            valid_moves[(target_row, target_col)] = new_skip_path
+            if recursive_skipping == True:
+                valid_moves.update(self.explore_valid_moves(piece, target_row, target_col, 2, new_skip_path, recursive_skipping=True))
+        return valid_moves
@@ -1,73 +1,135 @@
-import pygame
 from .constants import Constants
 from .piece import Piece
+from .movetables import MoveTables
+from .zobrist import ZobristKeys
+from .move import Move, UndoRecord
 
 class Board():
     """
     Initialized from _set_starting_attributes() method in Game class instance. 
     
-    The Board class creates and operates the board data structure. 
+    The Board class creates and operates the board data structure. It does not depend on Pygame, drawing
+    the board is done by the Renderer class.
     """
-    def __init__(self):
+    def __init__(self, layout=None):
         """
+        Parameters:
+            layout: list
+                OPTIONAL. Default value: None. Position to set up instead of the starting position, in
+                the format described in self.create_board().
+
         Instance variables initialized and methods called in constructor:
-            self.player_left: int
-                Number of pieces of the player's color left in the game.
-            self.opponent_left: int
-                Number of pieces of the opponent's color left in the game.
+            self.tables: MoveTables object
+                Precomputed step and skip targets of every square for the current board size.
+            self.zobrist_keys: ZobristKeys object
+                Random keys that self.hash is built from for the current board size.
             self.create_board()
                 Creates matrix representation of the board.
         """
-        self.create_board()
-        self.player_left = self.opponent_left = (Constants.COLS//2) * (Constants.ROWS//2-1)
+        self.tables = MoveTables.for_size(Constants.BOARD_SIZE)
+        self.zobrist_keys = ZobristKeys.for_size(Constants.BOARD_SIZE)
+        self.create_board(layout)
+
+    @property
+    def player_left(self):
+        """
+        Number of pieces of the player's color left in the game.
+        """
+        return len(self.piece_squares[Constants.PLAYER_COLOR])
+
+    @property
+    def opponent_left(self):
+        """
+        Number of pieces of the opponent's color left in the game.
+        """
+        return len(self.piece_squares[Constants.OPPONENT_COLOR])
     
-    def create_board(self):
+    def create_board(self, layout=None):
         """
         Creates the matrix representation of the board. Pieces are initialized and placed in
         a checker board pattern. An element of the matrix representing a square with a 
         piece has its value set to an object of the class Piece. The value of an empty square  
         is set to zero.
+
+        Parameters:
+            layout: list
+                OPTIONAL. Default value: None. List of Constants.ROWS strings of Constants.COLS
+                characters each, one string per row. 'p' is a man and 'P' a king of the player's
+                color, 'o' is a man and 'O' a king of the opponent's color and any other character
+                an empty square. If None, the starting position is set up.
         
         Instance variables created or modified:
             self.board: list (matrix of size Constants.ROWS x Constants.COLS)
                 Data structure representation of board with elements either set to zero or a
                 Piece-object.
+            self.piece_squares: dictionary
+                Key is a piece color and value is the set of squares (row, col) holding pieces of that
+                color. Kept up to date by self._set_square() and used by self.get_pieces() so that the
+                pieces of a color can be found without scanning the whole board.
+            self.hash: int
+                64-bit Zobrist hash of the position, side to move included. Kept up to date by
+                self._set_square() and self.switch_side_to_move(), which means that it can be used as a
+                dictionary key for the position at any time.
+            self.undo_stack: list
+                UndoRecord objects of the moves made with self.make_move() that are yet to be unmade.
         """
-        self.board = []
+        self.board = [[0] * Constants.COLS for _ in range(Constants.ROWS)]
+        self.hash = 0
+        self.undo_stack = []
+        self.piece_squares = {Constants.PLAYER_COLOR: set(), Constants.OPPONENT_COLOR: set()}
+        if layout is None:
+            layout = self.get_starting_layout()
         for row in range(Constants.ROWS):
-            self.board.append([])
             for col in range(Constants.COLS):
-                if col % 2 == ((row + 1) % 2):
-                    if row < Constants.ROWS // 2 - 1:
-                        self.board[row].append(Piece(row, col, Constants.OPPONENT_COLOR))
-                    elif row > Constants.ROWS // 2:
-                        self.board[row].append(Piece(row, col, Constants.PLAYER_COLOR))
-                    else:
-                        self.board[row].append(0)
-                else:
-                    self.board[row].append(0)
+                character = layout[row][col]
+                if character in 'pP':
+                    self._set_square(row, col, Piece(row, col, Constants.PLAYER_COLOR, character == 'P'))
+                elif character in 'oO':
+                    self._set_square(row, col, Piece(row, col, Constants.OPPONENT_COLOR, character == 'O'))
 
-    def draw_squares(self, window):
+    def get_starting_layout(self):
         """
-        Draws the squares of the checker board on the Pygame window.
-
-        Parameters:
-            window: Pygame Surface object
-                Pygame window to draw checker board on.
+        Returns the starting position in the layout format of self.create_board(). Pieces are placed
+        on the dark squares of all rows but the two in the middle of the board.
         """
+        layout = []
         for row in range(Constants.ROWS):
-            for col in range(row % 2, Constants.COLS, 2):
-                pygame.draw.rect(window, Constants.RED, (col * Constants.SQUARE_SIZE, row * Constants.SQUARE_SIZE, Constants.SQUARE_SIZE, Constants.SQUARE_SIZE))
-            for col in range(row % 2 - 1, Constants.COLS, 2):
-                pygame.draw.rect(window, Constants.BLACK, (col * Constants.SQUARE_SIZE, row * Constants.SQUARE_SIZE, Constants.SQUARE_SIZE, Constants.SQUARE_SIZE))
+            characters = ''
+            for col in range(Constants.COLS):
+                if col % 2 == ((row + 1) % 2) and row < Constants.ROWS // 2 - 1:
+                    characters += 'o'
+                elif col % 2 == ((row + 1) % 2) and row > Constants.ROWS // 2:
+                    characters += 'p'
+                else:
+                    characters += '.'
+            layout.append(characters)
+        return layout
 
+    def get_layout(self):
+        """
+        Returns the current position in the layout format of self.create_board().
+        """
+        layout = []
+        for row in range(Constants.ROWS):
+            characters = ''
+            for col in range(Constants.COLS):
+                piece = self.get_piece(row, col)
+                if piece == 0:
+                    characters += '.'
+                elif piece.color == Constants.PLAYER_COLOR:
+                    characters += 'P' if piece.king else 'p'
+                else:
+                    characters += 'O' if piece.king else 'o'
+            layout.append(characters)
+        return layout
 
     def move(self, piece, row, col):
         """
-        'Moves' a Piece object by switching values of source and destination square of a moving piece.
+        'Moves' a Piece object by emptying the source square of a moving piece and placing it on the destination square.
         Eg. a piece moves from square A3 to the empty square B4. After the move, the square A3 is now
         an empty square and B4 is hosting a piece. If a piece moves into either the first or the last
-        row, it is promoted to king.
+        row, it is promoted to king. As the piece is placed on the destination square after the promotion,
+        self.hash gets the key of a king and not of a man there.
 
         Parameters:
             piece: object of class Piece
@@ -75,10 +137,55 @@ class Board():
             row, col: int, int
                 Row and column of the destination square.
         """
-        self.board[piece.row][piece.col], self.board[row][col] = self.board[row][col], self.board[piece.row][piece.col]
+        self._set_square(piece.row, piece.col, 0)
         piece.update_position(row, col)
         if row == Constants.ROWS-1 or row == 0:
             piece.make_king()
+        self._set_square(row, col, piece)
+
+    def _set_square(self, row, col, value):
+        """
+        Writes value into the row:th row and the col:th column of the board matrix and updates
+        self.piece_squares and self.hash accordingly. Every method that changes the content of a square
+        goes through here, so that subclasses keeping other representations of the position (see the
+        bitboard module) can mirror the change.
+
+        Parameters:
+            row, col: int, int
+                Row and column of the square to write.
+            value: Piece object or int
+                Piece to place on the square, or 0 to empty it.
+        """
+        old_value = self.board[row][col]
+        if old_value != 0:
+            self.piece_squares[old_value.color].discard((row, col))
+            self.hash ^= self.zobrist_keys.get_key(old_value, row, col)
+        self.board[row][col] = value
+        if value != 0:
+            self.piece_squares[value.color].add((row, col))
+            self.hash ^= self.zobrist_keys.get_key(value, row, col)
+
+    def switch_side_to_move(self):
+        """
+        Includes or excludes the side to move key in self.hash. Called from the change_turn() method of
+        the Game class every time the turn passes to the other participant.
+        """
+        self.hash ^= self.zobrist_keys.side_to_move_key
+
+    def get_pieces(self, color):
+        """
+        Returns a list of all pieces of the given color. Only the squares known to hold pieces of
+        that color are visited.
+
+        Parameters:
+            color: tuple
+                Color of the pieces to return.
+
+        Output:
+            pieces: list
+                List of Piece objects.
+        """
+        return [self.board[row][col] for (row, col) in self.piece_squares[color]]
 
 
     def get_piece(self, row, col):
@@ -88,40 +195,74 @@ class Board():
         return self.board[row][col]
 
     
-    def draw(self, win):
-        """
-        Draws the board by calling self.draw_squares() and the pieces by iterating over all values
-        of the board matrix and calling the self.piece.draw() method for every element which contains a
-        piece.
-        
-        Parameters:
-            window: Pygame Surface object
-                Pygame window to draw checker board and pieces on.
-        """ 
-        self.draw_squares(win)
-        for row in range(Constants.ROWS):
-            for col in range(Constants.COLS):
-                piece = self.get_piece(row, col)
-                if piece != 0:
-                    piece.draw(win)
-
     def remove(self, skipped_pieces):
         """
-        Sets the value of skipped pieces' host squares to zero in the board matrix. The counter
-        of how many pieces the corresponding participant has left is updated there after.
+        Sets the value of skipped pieces' host squares to zero in the board matrix. The number of
+        pieces the corresponding participant has left follows from self.piece_squares.
 
         Parameters:
             skipped_pieces: list
                 List of skipped piece objects. 
         """
         for piece in skipped_pieces:
-            self.board[piece.row][piece.col] = 0
-            if piece != 0:
-                if piece.color == Constants.PLAYER_COLOR:
-                    self.player_left -= 1
-                elif piece.color == Constants.OPPONENT_COLOR:
-                    self.opponent_left -= 1
+            self._set_square(piece.row, piece.col, 0)
     
+    def make_move(self, move):
+        """
+        Makes a complete turn in place. The moving piece lands on every square of the move path in order,
+        is promoted if it reaches the first or last row on the way, and the skipped pieces are removed
+        as they are skipped, just as when a player makes the same turn in the game. The side to move of
+        self.hash is switched as well. No board or Piece object is copied, which means that a move can
+        be tried and taken back through self.unmake_move() at little cost.
+
+        Parameters:
+            move: Move
+                Turn to make, see the move module.
+
+        Output:
+            record: UndoRecord
+                Everything self.unmake_move() needs to restore the position. The record is also pushed
+                on self.undo_stack.
+        """
+        piece = self.get_piece(*move.origin)
+        was_king = piece.king
+        captured_pieces = []
+        for idx, (row, col) in enumerate(move.path):
+            self.move(piece, row, col)
+            if move.captured:
+                skipped_row, skipped_col = move.captured[idx]
+                captured_pieces.append(self.get_piece(skipped_row, skipped_col))
+                self._set_square(skipped_row, skipped_col, 0)
+        self.switch_side_to_move()
+        record = UndoRecord(move, piece, was_king, captured_pieces)
+        self.undo_stack.append(record)
+        return record
+
+    def unmake_move(self, record=None):
+        """
+        Takes back the latest move made with self.make_move() and restores the position exactly: the
+        moving piece is returned to its origin square with its king status before the move, captured
+        pieces are put back on their squares and the piece counts and self.hash are what they were
+        before the move. Moves have to be unmade in the reverse order they were made in, so a record
+        that is not on top of self.undo_stack raises ValueError.
+
+        Parameters:
+            record: UndoRecord
+                OPTIONAL. Default value: None. Record returned by self.make_move(). If None, the record
+                on top of self.undo_stack is used.
+        """
+        if record is not None and (not self.undo_stack or record is not self.undo_stack[-1]):
+            raise ValueError('the record is not of the latest move made')
+        record = self.undo_stack.pop()
+        piece = record.piece
+        self.switch_side_to_move()
+        self._set_square(piece.row, piece.col, 0)
+        piece.king = record.was_king
+        piece.update_position(*record.move.origin)
+        self._set_square(piece.row, piece.col, piece)
+        for captured_piece in reversed(record.captured_pieces):
+            self._set_square(captured_piece.row, captured_piece.col, captured_piece)
+
     def winner(self):
         """
         If one of the participants doesn't have any pieces left the other one wins. The winner is
@@ -133,20 +274,6 @@ class Board():
             return "PLAYER WINS"
         return None
 
-    def print_winner(self, window):
-        """
-        Prints the winner on the middle of the Pygame window.
-
-        Parameters:
-            window: Pygame Surface object
-                Pygame window to draw checker board and pieces on.
-        """
-        font = pygame.font.Font('freesansbold.ttf', 60)
-        text = font.render(self.winner(), True, Constants.YELLOW)
-        textRect = text.get_rect()
-        textRect.center = (Constants.WIDTH//2, Constants.HEIGHT//2)
-        window.blit(text, textRect)
-
     def get_valid_steps(self, piece) -> dict[tuple: list]:
         """
         Given a piece and with respect to the current state of the board, returns dictionary of its valid steps 
@@ -185,6 +312,82 @@ class Board():
         return valid_skips
       
   
+    def get_capture_sequences(self, piece) -> list[Move]:
+        """
+        Returns every complete skip sequence the input piece can make during one turn, each as a Move with
+        the ordered squares the piece lands on and the squares of the pieces it skips over. A sequence is
+        complete when the piece has no further valid skip. Skips are tried on the board itself, hop by hop
+        with self.make_move() and self.unmake_move(), which means that skipped pieces are removed and the
+        piece is promoted along the way exactly as when a player makes the same skips in the game. Every
+        sequence is returned once. Sequences that reach the same square along different paths are
+        separate moves.
+
+        Parameters:
+            piece: Piece object
+                The piece we want to find skip sequences for.
+
+        Output:
+            sequences: list
+                List of Move objects. Empty if the piece has no valid skip.
+        """
+        sequences = []
+        self._explore_capture_sequences((piece.row, piece.col), (piece.row, piece.col), [], [], sequences)
+        return sequences
+
+    def _explore_capture_sequences(self, origin, current_square, path, captured, sequences):
+        """
+        Depth first search of the skip sequences of the piece on current_square, see
+        self.get_capture_sequences().
+
+        Parameters:
+            origin: tuple
+                Square the piece started the turn on.
+            current_square: tuple
+                Square the piece is currently standing on.
+            path, captured: list, list
+                Squares landed on and squares skipped over so far during the turn.
+            sequences: list
+                List that complete sequences are appended to.
+        """
+        valid_skips = self.get_valid_skips(self.get_piece(*current_square))
+        if not valid_skips:
+            if path:
+                sequences.append(Move(origin, tuple(path), tuple(captured)))
+            return
+        for target_square, skipped_pieces in valid_skips.items():
+            skipped_square = (skipped_pieces[0].row, skipped_pieces[0].col)
+            self.make_move(Move(current_square, (target_square,), (skipped_square,)))
+            path.append(target_square)
+            captured.append(skipped_square)
+            self._explore_capture_sequences(origin, target_square, path, captured, sequences)
+            path.pop()
+            captured.pop()
+            self.unmake_move()
+
+    def get_all_moves(self, color) -> list[Move]:
+        """
+        Returns every complete turn the participant of the given color can make. As a participant who can
+        skip has to skip, these are the skip sequences of all pieces if any piece can skip, and otherwise
+        all steps.
+
+        Parameters:
+            color: tuple
+                Color of the participant to move.
+
+        Output:
+            moves: list
+                List of Move objects. Empty if the participant can not move.
+        """
+        moves = []
+        for piece in self.get_pieces(color):
+            moves.extend(self.get_capture_sequences(piece))
+        if moves:
+            return moves
+        for piece in self.get_pieces(color):
+            for target_square in self.get_valid_steps(piece):
+                moves.append(Move((piece.row, piece.col), (target_square,), ()))
+        return moves
+
     def get_valid_moves(self, piece, get_steps=True, get_skips=True, recursive_skipping=False) -> dict[tuple: list]:
         """
         Returns a dictionary whose keys are all possible destination squares (row, col) and intermediary squares
@@ -217,8 +420,10 @@ class Board():
     def explore_valid_moves(self, piece, current_row, current_col, step_size, skip_path=[], recursive_skipping=False):
         """
         Explores valid moves for a piece by examining its four surrounding diagonal squares at a sitance of [step_size]
-        diagnonal squares away. If consecutive moves during the same turn is to be examined, the method calls itself
-        recursively. 
+        diagnonal squares away. The squares are looked up in self.tables instead of being calculated. If consecutive
+        moves during the same turn is to be examined, the method calls itself recursively. The BitBoard class of the
+        default 'bitboard' backend overrides this method, so the tables only speed up the 'matrix' and 'compact'
+        backends.
 
         Parameters:
             piece: Piece object
@@ -244,67 +449,25 @@ class Board():
         """
 
 
-        up, down, left, right = [x + y * step_size for x in [current_row, current_col] for y in [-1, 1]]
-
         valid_moves = {}
 
-        for target_row in [up, down]:
-            for target_col in [left, right]:
-                if not self.is_valid_move(piece, current_row, current_col, target_row, target_col, step_size):
-                    continue
-                else:
-                    if step_size == 1:
-                        valid_moves[target_row, target_col] = []
-                    else: # If step_size is not 1, step_size is 2. Then we check for skip moves. 
-                        skipped_row = (current_row + target_row) // 2
-                        skipped_col = (current_col + target_col) // 2
-                        if self.get_piece(skipped_row, skipped_col) in skip_path:
-                            continue
-                        new_skip_path = skip_path.copy()
-                        new_skip_path.append(self.get_piece(skipped_row, skipped_col))
-                        valid_moves[(target_row, target_col)] = new_skip_path
-                        if recursive_skipping == True: # Recursive skipping is used by BotMover instance for calculating longest possible move.
-                            valid_moves.update(self.explore_valid_moves(piece, target_row, target_col, 2, new_skip_path, recursive_skipping=True))
+        for (row_step, step_target, skip_target, skipped_square) in self.tables.directions[current_row][current_col]:
+            if not (piece.king or row_step == piece.direction):
+                # invalid direction
+                continue
+            if step_size == 1:
+                if self.board[step_target[0]][step_target[1]] == 0:
+                    valid_moves[step_target] = []
+                continue
+            # If step_size is not 1, step_size is 2. Then we check for skip moves.
+            if skip_target is None or self.board[skip_target[0]][skip_target[1]] != 0:
+                continue
+            skipped_piece = self.get_piece(*skipped_square)
+            if skipped_piece == 0 or skipped_piece.color == piece.color or skipped_piece in skip_path:
+                continue
+            new_skip_path = skip_path.copy()
+            new_skip_path.append(skipped_piece)
+            valid_moves[skip_target] = new_skip_path
+            if recursive_skipping == True: # Recursive skipping is used by BotMover instance for calculating longest possible move.
+                valid_moves.update(self.explore_valid_moves(piece, skip_target[0], skip_target[1], 2, new_skip_path, recursive_skipping=True))
         return valid_moves
- 
-    def is_valid_move(self, piece, current_row, current_col, target_row, target_col, step_size) -> bool:
-        """
-        Set of logical conditions that has to be met in order for the move from current row and column to target
-        row and column to be valid.
-
-        Parameters:
-            piece: Piece Object
-                Piece to find valid moves for.
-            current_row, current_col: int, int
-                Current row and column where the piece is residing during the move. When the explore_valid_moves() 
-                method is called recursively, current row and column is in most cases not equivalent with the piece
-                object attributes piece.row and piece.col but a previous target row and target column.
-            target_row, target_col: int, int
-                Target row and column of the move being examined.
-            step_size: int
-                Distance a piece moves vertically respectively horisontally during a single move. A step has a step size
-                of 1 whereas a skip has a step size of 2.
-        
-        Output:
-            bool
-                True if move is valid. False if it is not.
-
-        """
-
-        if not (piece.king or target_row == current_row + piece.direction * step_size):
-            # invalid direction
-            return False
-        if not (0 <= target_row < Constants.ROWS and 0 <= target_col < Constants.COLS):
-            return False
-        target_square = self.get_piece(target_row, target_col)
-        if target_square != 0:
-            # target_square not empty
-            return False
-        # all base obstacle conditions are overcome, the skipping case logic remains:
-        if step_size == 2:
-            skipped_row = (current_row + target_row) // 2
-            skipped_col = (current_col + target_col) // 2
-            skipped_piece = self.get_piece(skipped_row, skipped_col)
-            if skipped_piece == 0 or skipped_piece.color == piece.color:
-                return False
-        return True
@@ -0,0 +1,221 @@
+"""
+Opening book. The positions of the first plies of the game are searched offline and the best move of every
+position is written to a book file per board size. The SearchMover class looks the current position up in the
+book before searching.
+
+A book file is a header followed by fixed size records sorted by the hash of their position, see the
+ZobristKeys class. The file is memory mapped and searched with binary search, so a lookup reads O(log n)
+records and the file is never loaded as a whole.
+
+Run from the Damspel1331 directory to build the books, e.g.
+
+    python -m checkers.book --size 10 --plies 6 --depth 8
+"""
+import argparse
+import mmap
+import os
+import struct
+import time
+
+from .constants import Constants, get_other_color
+from .game import Game
+
+BOOK_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'books')
+MAGIC = b'CKBK'
+VERSION = 1
+HEADER = struct.Struct('<4sHBBI')  # magic, version, rows, cols, amount of records
+RECORD = struct.Struct('<QHhB')  # position hash, move index, score, depth
+
+
+def get_book_path(board_size):
+    """
+    Returns the path of the book file of the given board size.
+    """
+    rows, cols = board_size
+    return os.path.join(BOOK_DIRECTORY, f'{rows}x{cols}.book')
+
+
+def get_book_moves(board, color) -> list:
+    """
+    Returns the moves of the participant of the given color in an order that does not depend on the board
+    implementation. Moves are stored in the book as their index in this list.
+    """
+    return sorted(board.get_all_moves(color))
+
+
+class OpeningBook:
+    """
+    Initialized through OpeningBook.for_size().
+
+    The OpeningBook class looks up positions in the book file of a board size. If there is no book file for the
+    board size, every lookup returns None.
+    """
+    _books = {}
+
+    def __init__(self, board_size, path=None):
+        """
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+            path: str
+                OPTIONAL. Default value: None. Path of the book file, None for the path returned by
+                get_book_path().
+
+        Instance variables initialized:
+            self.board_size: see board_size parameter.
+            self.data: mmap object or NoneType
+                Memory map of the book file, None if there is no book file.
+            self.size: int
+                Amount of records in the book.
+        """
+        self.board_size = board_size
+        self.data = None
+        self.size = 0
+        path = get_book_path(board_size) if path is None else path
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as book_file:
+            data = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, rows, cols, size = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION or (rows, cols) != tuple(board_size):
+            raise ValueError(f'{path} is not a version {VERSION} opening book of size {board_size}')
+        self.data = data
+        self.size = size
+
+    @classmethod
+    def for_size(cls, board_size):
+        """
+        Returns the book of the given board size. The book file is only opened the first time it is used.
+
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Output:
+            book: OpeningBook object
+        """
+        if board_size not in cls._books:
+            cls._books[board_size] = cls(board_size)
+        return cls._books[board_size]
+
+    def find(self, key):
+        """
+        Returns the record of the position with the given hash as a tuple (hash, move index, score, depth), or
+        None if the position is not in the book. Binary search over the sorted records.
+        """
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            record = RECORD.unpack_from(self.data, HEADER.size + middle * RECORD.size)
+            if record[0] < key:
+                low = middle + 1
+            elif record[0] > key:
+                high = middle
+            else:
+                return record
+        return None
+
+    def probe(self, board, color):
+        """
+        Returns the book move of the position, or None if the position is not in the book.
+
+        Parameters:
+            board: Board type object
+                Position to look up. Its hash has to have the side to move of color.
+            color: tuple
+                Color of the participant to move.
+
+        Output:
+            move: Move or NoneType
+        """
+        if self.data is None:
+            return None
+        record = self.find(board.hash)
+        if record is None:
+            return None
+        moves = get_book_moves(board, color)
+        return moves[record[1]] if record[1] < len(moves) else None
+
+
+def collect_book_positions(board, color, plies, positions):
+    """
+    Collects every position reached within the given amount of plies, where a ply is a complete turn, as a
+    dictionary from the hash of the position to a tuple (layout, color to move). Positions with a single valid
+    move are left out, as the bot does not have to search them.
+    """
+    moves = board.get_all_moves(color)
+    if plies == 0 or not moves:
+        return
+    if len(moves) > 1 and board.hash not in positions:
+        positions[board.hash] = (board.get_layout(), color)
+    for move in moves:
+        board.make_move(move)
+        collect_book_positions(board, get_other_color(color), plies - 1, positions)
+        board.unmake_move()
+
+
+def build_book(board_size, plies, depth, path=None, verbose=False):
+    """
+    Searches every position within the first plies of the game of the given board size to the given depth and
+    writes the best moves to a book file.
+
+    Parameters:
+        board_size: tuple
+            Board size in format (ROWS, COLUMNS).
+        plies: int
+            Amount of complete turns from the starting position to include positions from.
+        depth: int
+            Depth in turns to search every position to.
+        path: str
+            OPTIONAL. Default value: None. Path to write to, None for the path returned by get_book_path().
+        verbose: bool
+            OPTIONAL. Default value: False. Print progress.
+
+    Output:
+        size: int
+            Amount of positions written.
+    """
+    from .search import Searcher  # The search module looks moves up in the book, so it imports this module.
+
+    Constants.set_board_size(board_size)
+    positions = {}
+    collect_book_positions(Game.create_board(), Constants.PLAYER_COLOR, plies, positions)
+    searcher = Searcher(time_limit=None, max_depth=depth)
+    records = []
+    start_time = time.perf_counter()
+    for idx, (key, (layout, color)) in enumerate(sorted(positions.items())):
+        board = Game.create_board(layout)
+        if color == Constants.OPPONENT_COLOR:
+            board.switch_side_to_move()
+        move = searcher.search(board, color)
+        score = max(min(searcher.score, 32767), -32768)
+        records.append(RECORD.pack(key, get_book_moves(board, color).index(move), score, searcher.depth))
+        if verbose and (idx + 1) % 100 == 0:
+            print(f'{idx + 1}/{len(positions)} positions, {time.perf_counter() - start_time:.0f} s')
+
+    path = get_book_path(board_size) if path is None else path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as book_file:
+        book_file.write(HEADER.pack(MAGIC, VERSION, board_size[0], board_size[1], len(records)))
+        book_file.write(b''.join(records))
+    OpeningBook._books.pop(tuple(board_size), None)
+    return len(records)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the opening books of the bot.')
+    parser.add_argument('--size', type=int, nargs='+', default=[8, 10, 12], choices=[8, 10, 12], help='board sizes to build books for')
+    parser.add_argument('--plies', type=int, default=6, help='amount of turns from the starting position to include')
+    parser.add_argument('--depth', type=int, default=8, help='depth in turns to search every position to')
+    args = parser.parse_args(argv)
+
+    for size in args.size:
+        board_size = (size, size)
+        start_time = time.perf_counter()
+        records = build_book(board_size, args.plies, args.depth, verbose=True)
+        print(f'{get_book_path(board_size)}: {records} positions in {time.perf_counter() - start_time:.0f} s')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
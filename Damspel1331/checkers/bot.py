@@ -1,145 +1,147 @@
 import random
-import pygame
 
-from .piece import Piece
-from .constants import Constants
+from .move import Move
 
 class BotMover:
     """
-    BotMover instances are initialized in the while-loop of the main function if the bot has been activated in the 
-    in-game menu, it is the opponent's turn and the game is yet to have a winner. 
+    BotMover instances are initialized in the while-loop of the main function if the bot has been activated in the
+    in-game menu, it is the opponent's turn and the game is yet to have a winner.
 
-    BotMover looks at the current state of the board and executes the longest move possible. 
+    BotMover looks at the current state of the board and executes the longest move possible. Bots that choose
+    their move in another way subclass BotMover and override self.choose_move(), see the search module.
     """
-    def __init__(self, game):
+    def __init__(self, game, renderer=None, stop_event=None):
         """
         Parameters:
             game: Game object
-                The current state of the game is passed to the constructor upon initializing 
+                The current state of the game is passed to the constructor upon initializing
                 a BotMover instance.
+            renderer: Renderer object
+                OPTIONAL. Default value: None. Renderer to pause and redraw the window with between
+                the skips of a move. Without a renderer the move is made at once, which is how the bot
+                runs without Pygame.
+            stop_event: threading.Event
+                OPTIONAL. Default value: None. Bots that think for a while stop thinking and return the best
+                move found so far when it is set, see the botworker module.
         Instance variables initialized:
             self.game: see game parameter.
+            self.renderer: see renderer parameter.
+            self.stop_event: see stop_event parameter.
+            self.chosen_move: Move or NoneType
+                The move the bot made, None if it could not move.
+            self.stats: SearchStats object or NoneType
+                Statistics of how the move was chosen, see the stats module. None for bots that do not search.
         """
         self.game = game
-        self.move_longest_possible()
-        
-
-    def move_longest_possible(self):
+        self.renderer = renderer
+        self.stop_event = stop_event
+        self.stats = None
+        self.chosen_move = self.choose_move()
+        if self.chosen_move is not None:
+            self.move(self.chosen_move)
+
+    def choose_move(self) -> Move:
         """
         Finds the piece/pieces that can make the longest possible moves. If there are multiple pieces that can
         make equally long moves, a single piece is randomized out of these. If the chosen piece can make multiple
-        moves of the same longest length, a single move is randomized out of these. Finally, this move is executed. 
+        moves of the same longest length, a single move is randomized out of these. This move is returned to be
+        executed by the constructor.
+
+        Output:
+            chosen_move: Move or NoneType
+                Move to execute, None if the bot cannot move.
         """
-        longest_path_pieces = self.get_longest_path_pieces()
-        piece_to_move = self.randomize_piece_to_move(longest_path_pieces)
-        longest_move = self.randomize_longest_move(piece_to_move)
-        self.move(piece_to_move, longest_move)
+        longest_moves = self.get_longest_moves()
+        if not longest_moves:
+            return None
+        piece_to_move = self.randomize_piece_to_move(longest_moves)
+        return self.randomize_longest_move(piece_to_move, longest_moves)
 
-    def get_longest_path_pieces(self) -> list:
+    def get_longest_moves(self) -> list[Move]:
         """
-        Given the current state of the board, returns a list of the opponent teams' pieces that can make the longest
-        possible moves.
+        Given the current state of the board, returns the complete moves of the bot's color that skip the most
+        pieces. If no piece can skip, these are all valid steps.
 
         Output:
-            longest_path_pieces: list
-                List of the opponent teams' pieces that can make the longest possible moves. 
+            longest_moves: list
+                List of Move objects, see the move module.
         """
-        longest_path_pieces = []
-        longest_move_length = 0 # measured in amound of pieces skipped during the move
-        for row in range(Constants.ROWS):
-            for col in range(Constants.COLS):
-                piece = self.game.board.get_piece(row, col)
-                if piece != 0 and piece.color == Constants.OPPONENT_COLOR:
-                        moves_of_current_piece = self.game.board.get_valid_moves(piece, recursive_skipping=True)
-                        if not moves_of_current_piece:
-                            continue
-                        for (target_row, target_col) in moves_of_current_piece:
-                            if len(moves_of_current_piece[target_row, target_col]) == longest_move_length and piece not in longest_path_pieces:
-                                longest_path_pieces.append(piece)
-                            elif len(moves_of_current_piece[target_row, target_col]) > longest_move_length:
-                                longest_path_pieces = [piece]
-                                longest_move_length = len(moves_of_current_piece[target_row, target_col])
-        return longest_path_pieces
-
-    def randomize_piece_to_move(self, longest_path_pieces) -> Piece:
+        valid_moves = self.game.board.get_all_moves(self.game.turn)
+        if not valid_moves:
+            return []
+        longest_move_length = max(len(move.captured) for move in valid_moves) # measured in amount of pieces skipped during the move
+        longest_moves = [move for move in valid_moves if len(move.captured) == longest_move_length]
+        return longest_moves
+
+    def randomize_piece_to_move(self, longest_moves) -> tuple[int, int]:
         """
         Randomizes which piece to move out of the pieces that can make move the longest possible.
 
         Parameters:
-            longest_path_pieces: list
-                List of the opponent teams' pieces that can make the longest possible moves.
+            longest_moves: list
+                List of the longest possible moves.
 
         Output:
-            piece_to_move: Piece
-                Randomized piece valid to make the longest possible move.
+            piece_to_move: tuple[int, int]
+                Square of the randomized piece valid to make the longest possible move.
 
         """
-        amount_valid_pieces = len(longest_path_pieces)
-        randomized_piece_index = random.randint(0, amount_valid_pieces-1)
-        piece_to_move = longest_path_pieces[randomized_piece_index]
+        longest_path_pieces = []
+        for move in longest_moves:
+            if move.origin not in longest_path_pieces:
+                longest_path_pieces.append(move.origin)
+        piece_to_move = random.choice(longest_path_pieces)
         return piece_to_move
 
-    def randomize_longest_move(self, piece_to_move) -> dict[tuple[int, int]: list[Piece]]:
+    def randomize_longest_move(self, piece_to_move, longest_moves) -> Move:
         """
-        Randomizes a single longest moves out of possible longest moves. 
-        
-        Example: 
-        If the randomized piece can make multiple longest moves, one of these moves is returned at
-        random.
+        Randomizes a single longest moves out of possible longest moves of the randomized piece.
 
         Parameters:
-            piece_to_move: Piece
-                Randomized piece valid to make the longest possible move.
+            piece_to_move: tuple[int, int]
+                Square of the randomized piece valid to make the longest possible move.
+            longest_moves: list
+                List of the longest possible moves.
 
         Output:
-            longest_move: dict[tuple[int, int]: list[Piece]]
-                Longest possible move the parameter piece can make. Randomized if multiple options.
-        
-        """
-        # Finds longest moves. Note that this can be multiple moves as more than one valid move can 
-        # be of a certain length.
-        valid_moves = self.game.board.get_valid_moves(piece_to_move, recursive_skipping=True)
-        longest_moves = {}
-        longest_move_length = 0
-        for (target_row, target_col) in valid_moves:
-            if len(valid_moves[(target_row, target_col)]) == longest_move_length:
-                longest_moves.update({(target_row, target_col): valid_moves[target_row, target_col]})
-            elif len(valid_moves[target_row, target_col]) > longest_move_length:
-                longest_moves = {(target_row, target_col): valid_moves[target_row, target_col]}
-                longest_move_length = len(valid_moves[target_row, target_col])
-        # Randomizes a move out of the possible longest moves
-        amount_longest_moves = len(longest_moves)
-        randomized_move_index = random.randint(0, amount_longest_moves-1)
-        for idx, (target_row, target_col) in enumerate(longest_moves):
-            if idx == randomized_move_index:
-                randomized_move = {(target_row, target_col): longest_moves[target_row, target_col]}
-        longest_move = randomized_move
+            longest_move: Move
+                Longest possible move the randomized piece can make. Randomized if multiple options.
 
+        """
+        longest_move = random.choice([move for move in longest_moves if move.origin == piece_to_move])
         return longest_move
 
-    def move(self, piece_to_move, longest_move):
+    def move(self, chosen_move):
+        """
+        Calls board class methods for moving piece on the board and removing any skipped pieces. The move is
+        executed in a single pass over the squares of its path.
+
+        Parameters:
+            chosen_move: Move
+                Move to execute.
+        """
+        for idx in range(len(chosen_move.path)):
+            if self.renderer:
+                self.renderer.pause(1000)
+            self.make_hop(self.game.board, chosen_move, idx)
+            if chosen_move.captured and self.renderer:
+                self.renderer.update()
+
+    @staticmethod
+    def make_hop(board, chosen_move, idx):
         """
-        Calls board class methods for moving piece on the board and removing any skipped pieces.
+        Moves the piece of a move to the idx:th square of its path and removes the piece it skipped over, if
+        any. The hops before it have to be made first.
 
         Parameters:
-            piece_to_move: Piece
-            longest_move: dict[tuple[int, int]: list[Piece]]
-                Dictionary where key represents target square and value is a list of skipped pieces.
+            board: Board type object
+                Board to make the hop on.
+            chosen_move: Move
+                Move the hop is part of.
+            idx: int
+                Index of the hop in the path of the move.
         """
-        
-        target_row, target_col = list(longest_move.keys())[0]
-        if len(longest_move[target_row, target_col]) == 0:
-            pygame.time.delay(1000)
-            self.game.board.move(piece_to_move, target_row, target_col)
-            skipped_piece = longest_move[target_row, target_col]
-            if skipped_piece:
-                self.game.board.remove(skipped_piece)
-        else:
-            for _, skipped_piece in enumerate(longest_move[target_row, target_col]):
-                pygame.time.delay(1000)
-                valid_skips = self.game.board.get_valid_skips(piece_to_move)
-                skip_target_row, skip_target_col = list(valid_skips.keys())[list(valid_skips.values()).index([skipped_piece])]
-                self.game.board.move(piece_to_move, skip_target_row, skip_target_col)
-                self.game.board.remove([skipped_piece])
-
-                self.game.update()
+        piece_to_move = board.get_piece(*(chosen_move.path[idx - 1] if idx else chosen_move.origin))
+        board.move(piece_to_move, *chosen_move.path[idx])
+        if chosen_move.captured:
+            board.remove([board.get_piece(*chosen_move.captured[idx])])
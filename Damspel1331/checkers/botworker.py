@@ -0,0 +1,195 @@
+import concurrent.futures
+import threading
+import time
+
+from .bot import BotMover
+from .constants import Constants
+from .ponder import Ponderer
+from .search import SearchMover
+from .stats import SearchStats
+
+
+class BotWorker:
+    """
+    Initialized in the main function of the main file.
+
+    The BotWorker class lets the bot think in a background thread, so that the while-loop of the main function
+    keeps handling events and drawing the window while the bot chooses its move. The bot thinks on a copy of the
+    game, see the copy() method of the Game class. When it has chosen, the move is made on the real game one hop
+    at a time with self.hop_delay seconds between the hops, from self.update() which is called every iteration
+    of the while-loop.
+
+    A move chosen for a game that has since been restarted is thrown away, which is detected through the
+    generation attribute of the Game class.
+
+    If Constants.PONDER is True, bots that search also think during the human's turn, see the ponder module.
+    """
+    def __init__(self, game, hop_delay=1.0):
+        """
+        Parameters:
+            game: Game object
+                Game the bot plays in.
+            hop_delay: float
+                OPTIONAL. Default value: 1.0. Seconds to wait before every hop of the bot's move, such that they
+                can be followed on the window.
+
+        Instance variables initialized:
+            self.game, self.hop_delay: see parameters.
+            self.executor: ThreadPoolExecutor object
+                Runs the bot in a single background thread.
+            self.future: Future object or NoneType
+                Result of the bot that is thinking, None if it is not thinking.
+            self.stop_event: threading.Event or NoneType
+                Set to make the thinking bot return the best move found so far.
+            self.generation: int
+                Generation of the game the bot is thinking or moving in.
+            self.callback: function or NoneType
+                Called with the move once it has been made, see self.start().
+            self.chosen_move: Move or NoneType
+                Move being made on the game, None if no move is being made.
+            self.hop: int
+                Index of the next hop of self.chosen_move.
+            self.next_hop_time: float
+                Value of time.monotonic() at which the next hop is made.
+            self.ponderer: Ponderer object
+                Thinks on the human's time, see self.ponder().
+            self.stats: SearchStats object or NoneType
+                Statistics of the latest move of the bot, see the stats module. None if the bot does not search
+                or has not moved yet.
+        """
+        self.game = game
+        self.hop_delay = hop_delay
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='bot')
+        self.future = None
+        self.stop_event = None
+        self.generation = None
+        self.callback = None
+        self.chosen_move = None
+        self.hop = 0
+        self.next_hop_time = 0
+        self.ponderer = Ponderer()
+        self.stats = None
+
+    def is_busy(self):
+        """
+        Returns True if the bot is thinking or making its move.
+        """
+        return self.future is not None or self.chosen_move is not None
+
+    def start(self, mover_class, callback=None):
+        """
+        Starts the bot thinking about the current position of the game in the background. Pondering is
+        stopped first. If the position was pondered on with at least the time and node budget of the bot, the
+        pondered move is used and the future is done at once.
+
+        Parameters:
+            mover_class: class
+                BotMover or a subclass of it, see the movers module.
+            callback: function
+                OPTIONAL. Default value: None. Called as callback(move) from self.update() once the move has
+                been made on the game, with None if the bot could not move. Not called if the game is
+                restarted first.
+
+        Output:
+            future: Future object
+                Future of the BotMover type object that chose the move.
+        """
+        self.cancel()
+        self.generation = self.game.generation
+        self.callback = callback
+        pondered_move = self.ponderer.get_result(self.game, Constants.SEARCH_TIME, Constants.SEARCH_NODES)
+        if pondered_move is not None:
+            self.future = concurrent.futures.Future()
+            self.future.set_result(PonderedMove(pondered_move))
+        else:
+            game_copy = self.game.copy()
+            stop_event = threading.Event()
+            self.stop_event = stop_event
+            self.future = self.executor.submit(mover_class, game_copy, stop_event=stop_event)
+        self.next_hop_time = time.monotonic() + self.hop_delay
+        return self.future
+
+    def cancel(self):
+        """
+        Stops the thinking bot and the pondering and forgets any move not yet made. The background thread
+        finishes its search on its own and its result is thrown away.
+        """
+        self.ponderer.stop()
+        if self.stop_event is not None:
+            self.stop_event.set()
+        self.future = None
+        self.stop_event = None
+        self.callback = None
+        self.chosen_move = None
+
+    def ponder(self, mover_class):
+        """
+        Starts pondering on the current position of the game, where it is the human's turn, if the bot searches
+        with the Searcher class and Constants.PONDER is True. Nothing is started while the human is in the middle of a skip sequence.
+
+        Parameters:
+            mover_class: class
+                Class of the bot that is to answer the human's move, see the movers module.
+        """
+        if Constants.PONDER and issubclass(mover_class, SearchMover) and mover_class.PONDERS and not self.game.skipped_pieces:
+            self.ponderer.start(self.game)
+
+    def update(self):
+        """
+        Called every iteration of the while-loop of the main function. Cancels the bot if the game has been
+        restarted, takes the move once the bot has chosen it and makes its next hop when it is time to. After
+        the last hop, the turn is passed to the other participant. If the bot could not move, the turn is
+        passed at once.
+        """
+        if self.ponderer.is_running() and self.ponderer.key[0] != self.game.generation:
+            self.ponderer.stop()
+        if not self.is_busy():
+            return
+        if self.game.generation != self.generation:
+            self.cancel()
+            return
+        if self.future is not None:
+            if not self.future.done():
+                return
+            mover = self.future.result()
+            self.chosen_move, self.stats = mover.chosen_move, mover.stats
+            self.future = None
+            self.hop = 0
+            if self.chosen_move is None:
+                self.finish()
+                return
+        if time.monotonic() < self.next_hop_time:
+            return
+        BotMover.make_hop(self.game.board, self.chosen_move, self.hop)
+        self.hop += 1
+        self.next_hop_time = time.monotonic() + self.hop_delay
+        if self.hop == len(self.chosen_move.path):
+            self.finish()
+
+    def finish(self):
+        """
+        Passes the turn on after the bot's move and calls the callback given to self.start().
+        """
+        chosen_move, callback = self.chosen_move, self.callback
+        self.chosen_move = None
+        self.callback = None
+        self.stop_event = None
+        self.game.change_turn()
+        if callback is not None:
+            callback(chosen_move)
+
+
+class PonderedMove:
+    """
+    Stands in for the bot when the move was found by pondering, see BotWorker.start().
+    """
+    def __init__(self, chosen_move):
+        """
+        Instance variables initialized:
+            self.chosen_move: Move
+                The pondered move.
+            self.stats: SearchStats object
+                Statistics telling that the move was pondered.
+        """
+        self.chosen_move = chosen_move
+        self.stats = SearchStats('ponder')
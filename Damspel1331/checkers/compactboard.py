@@ -0,0 +1,75 @@
+from .board import Board
+from .piece import Piece
+from .constants import Constants
+
+
+class PieceView(Piece):
+    """
+    PieceView instances are returned by the get_piece() and get_pieces() methods of the CompactBoard class.
+
+    A flyweight stand-in for a Piece object on a board that stores pieces as integers. A view is only created when
+    a caller asks for a piece and is a snapshot of the square it was read from. It can be used wherever a Piece
+    object is expected. Moving a view with the move() method of the CompactBoard class moves the piece on the board,
+    and removing it removes the piece. Two views of the same piece compare equal, which makes lookups such as
+    `piece in valid_pieces` work as they do with Piece objects.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return isinstance(other, Piece) and self.row == other.row and self.col == other.col and self.color == other.color
+
+    def __hash__(self):
+        return hash((self.row, self.col))
+
+
+class CompactBoard(Board):
+    """
+    Initialized from _set_starting_attributes() method in Game class instance when Constants.BOARD_BACKEND is
+    'compact'.
+
+    A Board whose matrix holds small integers instead of Piece objects, see the get_code() method of the Piece class.
+    Copying or iterating such a board in bulk does not touch any Piece object. Callers still get pieces from
+    self.get_piece() and self.get_pieces(), in the form of PieceView objects.
+    """
+    def _set_square(self, row, col, value):
+        """
+        Writes value into the board matrix as an integer and updates self.piece_squares and self.hash
+        accordingly.
+
+        Parameters:
+            row, col: int, int
+                Row and column of the square to write.
+            value: Piece object or int
+                Piece to place on the square, or 0 to empty it.
+        """
+        old_code = self.board[row][col]
+        if old_code != 0:
+            self.piece_squares[self.get_code_color(old_code)].discard((row, col))
+            self.hash ^= self.zobrist_keys.piece_keys[old_code <= 2, old_code % 2 == 0][row][col]
+        code = value.get_code() if value != 0 else 0
+        self.board[row][col] = code
+        if code != 0:
+            self.piece_squares[value.color].add((row, col))
+            self.hash ^= self.zobrist_keys.piece_keys[code <= 2, code % 2 == 0][row][col]
+
+    def get_code_color(self, code):
+        """
+        Returns the color of the pieces stored as code.
+        """
+        return Constants.PLAYER_COLOR if code <= 2 else Constants.OPPONENT_COLOR
+
+    def get_piece(self, row, col):
+        """
+        Returns a PieceView of the piece on the square (row, col), or 0 if the square is empty.
+        """
+        code = self.board[row][col]
+        if code == 0:
+            return 0
+        return PieceView(row, col, self.get_code_color(code), code % 2 == 0)
+
+    def get_pieces(self, color):
+        """
+        Returns a list of PieceView objects of all pieces of the given color. Only the squares known to hold
+        pieces of that color are visited.
+        """
+        return [self.get_piece(row, col) for (row, col) in self.piece_squares[color]]
@@ -1,4 +1,5 @@
-import pygame
+import os
+
 
 class Constants:
     """
@@ -37,8 +38,41 @@ class Constants:
                 OPPONENT represents the player who starts the game with pieces on the upper rows of the board.
             self.BOT_ACITVE: boolean
                 Boolean representation of whether the bot is active or not. 
-            self.Crown: Pygame Surface (image)
-                Image to be printed on top of pieces when they are promoted to king.
+            self.BOT_ENGINE: str
+                Which bot plays when the bot is active, a key of MOVERS in the movers module. 'greedy' for the
+                BotMover class, which makes the longest move, 'search' for the SearchMover class, which
+                looks ahead, 'parallel' for the ParallelSearchMover class, which looks ahead with several
+                processes, and 'mcts' for the MCTSMover class, which plays random games out.
+            self.SEARCH_TIME: float
+                Seconds the SearchMover and MCTSMover classes may think per move, None for no time limit.
+            self.SEARCH_NODES: int
+                Amount of positions the SearchMover class may visit per move, None for no node limit.
+            self.MCTS_PLAYOUTS: int
+                Amount of playouts the MCTSMover class may make per move, None for no playout limit. If
+                SEARCH_TIME is None as well, the MCTSSearcher class falls back to its DEFAULT_PLAYOUTS.
+            self.MCTS_BATCH_SIZE: int
+                Amount of playouts the MCTSMover class makes at once.
+            self.SEARCH_WORKERS: int
+                Amount of worker processes of the ParallelSearchMover class. One less than the amount of
+                CPUs, so that the main process keeps a CPU of its own.
+            self.OPENING_BOOK: bool
+                Whether the bots that search play the moves of the opening book, see the book module.
+            self.ENDGAME_TABLEBASE: bool
+                Whether the bots that search play the moves of the endgame tablebase, see the tablebase module.
+            self.STATS_LOG: str
+                Path of a file to append the statistics of every move of the bots that search to, as JSON lines.
+                None for no log.
+            self.SHOW_STATS: bool
+                Whether the statistics of the latest move of the bot are drawn in the menu.
+            self.PONDER: bool
+                Whether the bots that search also think during the human's turn, see the ponder module.
+            self.FPS: int
+                Most frames per second the window is drawn at. The while-loop of the main function sleeps
+                between frames, see the scheduler module.
+            self.BOARD_BACKEND: str
+                Which board implementation the game is played on. 'matrix' for the Board class, 'bitboard' for
+                the BitBoard class, which generates moves with bitmasks, and 'compact' for the CompactBoard class,
+                which stores pieces as small integers.
         """
 
         self.RED = (255, 0, 0)
@@ -60,8 +94,43 @@ class Constants:
         self.OPPONENT_COLOR = self.RED
 
         self.BOT_ACTIVE = False
+        self.BOT_ENGINE = 'greedy'
+        self.SEARCH_TIME = 1.0
+        self.SEARCH_NODES = None
+        self.MCTS_PLAYOUTS = None
+        self.MCTS_BATCH_SIZE = 64
+        self.SEARCH_WORKERS = max((os.cpu_count() or 1) - 1, 1)
+        self.OPENING_BOOK = True
+        self.ENDGAME_TABLEBASE = True
+        self.STATS_LOG = None
+        self.SHOW_STATS = False
+        self.PONDER = False
+
+        self.FPS = 30
 
-        self.CROWN = pygame.transform.scale(pygame.image.load('assets/crown.png'), (45, 25))
+        self.BOARD_BACKEND = 'bitboard'
+
+    def set_board_size(self, board_size):
+        """
+        Sets the board size and the variables calculated from it.
+
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Modified instance variables:
+            self.BOARD_SIZE, self.ROWS, self.COLS, self.SQUARE_SIZE
+        """
+        self.BOARD_SIZE = board_size
+        self.ROWS, self.COLS = self.BOARD_SIZE
+        self.SQUARE_SIZE = self.WIDTH // self.COLS
         
 
-Constants = Constants()
\ No newline at end of file
+Constants = Constants()
+
+
+def get_other_color(color):
+    """
+    Returns the color of the other participant.
+    """
+    return Constants.OPPONENT_COLOR if color == Constants.PLAYER_COLOR else Constants.PLAYER_COLOR
@@ -0,0 +1,132 @@
+import numpy as np
+
+from .batch import BatchMoveGenerator, PLAYER_MAN, PLAYER_KING, OPPONENT_MAN, OPPONENT_KING, positions_from_boards
+from .constants import Constants
+
+
+class Evaluator:
+    """
+    Initialized through Evaluator.for_size().
+
+    The Evaluator class scores positions for the search. The score of a position is the sum of a piece-square
+    table value for every piece, which covers material, kings, advancement of the men towards promotion and men
+    guarding their own back rank, plus a mobility term: the difference in the amount of valid steps and skips of
+    the two participants.
+
+    Positions are scored in array form, see positions_from_boards() in the batch module, many at a time with
+    self.evaluate_batch(). A single board is scored with self.evaluate(), which reads the same tables from
+    Python lists and leaves out the mobility term, as generating the moves of both participants costs more than
+    the rest of the evaluation.
+    """
+    MAN_VALUE = 100
+    KING_VALUE = 160
+    ADVANCEMENT_VALUE = 2  # Per row a man has advanced from its back rank.
+    BACK_RANK_VALUE = 6  # For a man on its own back rank, where it keeps the other participant from promoting.
+    CENTER_VALUE = 4  # For a king on the middle squares of the board, at most.
+    MOBILITY_VALUE = 1  # Per valid step or skip.
+    _evaluators = {}
+
+    def __init__(self, board_size):
+        """
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Instance variables initialized:
+            self.rows, self.cols: int, int
+                Amount of rows and columns of the board.
+            self.tables: numpy array of shape (5, ROWS, COLS) and type int32
+                Element [code, row, col] is the value of a piece with the given code on square (row, col), see
+                the get_code() method of the Piece class, from the point of view of the player. Values of the
+                opponent's pieces are negative and element [0] is 0 for empty squares.
+            self.table_lists: list
+                self.tables as nested lists, for self.evaluate().
+            self.move_generator: BatchMoveGenerator object
+                Generates the moves counted by the mobility term.
+        """
+        self.rows, self.cols = board_size
+        rows = np.arange(self.rows)[:, None]
+        cols = np.arange(self.cols)[None, :]
+        man = self.MAN_VALUE + self.ADVANCEMENT_VALUE * (self.rows - 1 - rows) + self.BACK_RANK_VALUE * (rows == self.rows - 1)
+        man = np.broadcast_to(man, board_size)
+        row_distance = np.abs(2 * rows - (self.rows - 1)) / (self.rows - 1)
+        col_distance = np.abs(2 * cols - (self.cols - 1)) / (self.cols - 1)
+        king = self.KING_VALUE + np.rint(self.CENTER_VALUE * (1 - np.maximum(row_distance, col_distance)))
+        self.tables = np.zeros((5,) + tuple(board_size), dtype=np.int32)
+        self.tables[PLAYER_MAN] = man
+        self.tables[PLAYER_KING] = king
+        self.tables[OPPONENT_MAN] = -np.flipud(man)
+        self.tables[OPPONENT_KING] = -np.flipud(king)
+        self.table_lists = self.tables.tolist()
+        self.move_generator = BatchMoveGenerator.for_size(board_size)
+
+    @classmethod
+    def for_size(cls, board_size):
+        """
+        Returns the evaluator of the given board size. The tables of a board size are only built the first time
+        it is used.
+
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Output:
+            evaluator: Evaluator object
+        """
+        if board_size not in cls._evaluators:
+            cls._evaluators[board_size] = cls(board_size)
+        return cls._evaluators[board_size]
+
+    def evaluate_batch(self, positions, player_to_move):
+        """
+        Scores many positions at once.
+
+        Parameters:
+            positions: numpy array of shape (N, ROWS, COLS)
+                Positions to score, as returned by positions_from_boards().
+            player_to_move: numpy array of shape (N,) and type bool
+                True for the positions where it is the player's turn and False where it is the opponent's.
+
+        Output:
+            scores: numpy array of shape (N,) and type int32
+                Score of every position from the point of view of the participant to move.
+        """
+        player_to_move = np.asarray(player_to_move, dtype=bool)
+        rows = np.arange(self.rows)[None, :, None]
+        cols = np.arange(self.cols)[None, None, :]
+        scores = self.tables[positions.astype(np.intp), rows, cols].sum(axis=(1, 2), dtype=np.int32)
+        player_steps, player_skips = self.move_generator.generate(positions, np.ones(len(positions), dtype=bool))
+        opponent_steps, opponent_skips = self.move_generator.generate(positions, np.zeros(len(positions), dtype=bool))
+        player_moves = player_steps.sum(axis=(1, 2, 3)) + player_skips.sum(axis=(1, 2, 3))
+        opponent_moves = opponent_steps.sum(axis=(1, 2, 3)) + opponent_skips.sum(axis=(1, 2, 3))
+        scores += (self.MOBILITY_VALUE * (player_moves - opponent_moves)).astype(np.int32)
+        return np.where(player_to_move, scores, -scores)
+
+    def evaluate_boards(self, boards, colors):
+        """
+        Scores many boards at once, see self.evaluate_batch().
+
+        Parameters:
+            boards: list
+                Board type objects of the same size.
+            colors: list
+                Color of the participant to move on every board.
+
+        Output:
+            scores: numpy array of shape (len(boards),) and type int32
+        """
+        player_to_move = np.array([color == Constants.PLAYER_COLOR for color in colors], dtype=bool)
+        return self.evaluate_batch(positions_from_boards(boards), player_to_move)
+
+    def evaluate(self, board, color) -> int:
+        """
+        Scores a single board from the point of view of the participant of the given color, with every term
+        but mobility. Only the squares holding pieces are visited.
+        """
+        tables = self.table_lists
+        score = 0
+        for squares in board.piece_squares.values():
+            for (row, col) in squares:
+                score += tables[board.get_piece(row, col).get_code()][row][col]
+        return score if color == Constants.PLAYER_COLOR else -score
+
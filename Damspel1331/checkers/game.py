@@ -1,5 +1,6 @@
-import pygame
 from .board import Board
+from .bitboard import BitBoard
+from .compactboard import CompactBoard
 from .constants import Constants
 
 
@@ -9,29 +10,19 @@ class Game:
 
     The Game module manages higher-level attributes of the game. These include, but are not limited to, 
     keeping track of whose turn it is, which piece is selected and whether the selected piece has 
-    completed its move or not.
+    completed its move or not. It does not depend on Pygame, the game is drawn by the Renderer class.
     """
-    def __init__(self, window):
+    def __init__(self):
         """
         Instance variables initialized and methods called in constructor:
-            self.window: Pygame Surface object
-                Pygame window to draw valid moves, board and pieces on.
             self._set_start_attributes()
                 Sets initial values of attributes for a new game instance.
+            self.generation: int
+                Counts the games played on this instance. Increased by self.reset(), so that work started
+                for an earlier game, such as a bot thinking in the background, can tell that it is outdated.
         """
-        self.window = window
         self._set_starting_attributes()
-
-    def update(self):
-        """
-        Calls all draw methods for displaying the current state of the game on the Pygame window.
-        Thereafter calls Pygame method for updating Pygame display screen.
-        """
-        self.board.draw(self.window)
-        self.draw_valid_moves(self.valid_moves)
-        if self.board.winner():
-            self.board.print_winner(self.window)
-        pygame.display.update()
+        self.generation = 0
 
     def _set_starting_attributes(self):
         """
@@ -48,7 +39,8 @@ class Game:
                 Is set to true when a piece can not or is not allowed to move any further. Is condition
                 for changing turn.
             self.board: Board type object
-                See comments in the board module for further documentation.
+                Board, BitBoard or CompactBoard depending on Constants.BOARD_BACKEND. See comments in the board
+                module for further documentation.
             self.turn: tuple
                 In this implementation of checkers "PLAYER" always makes the first move.
             self.valid_moves: dictionary
@@ -58,15 +50,52 @@ class Game:
         self.selected_piece = None
         self.skipped_pieces = [] 
         self.has_completed_turn = False
-        self.board = Board()
+        self.board = self.create_board()
         self.turn = Constants.PLAYER_COLOR
         self.valid_moves = {}
 
+    @staticmethod
+    def create_board(layout=None):
+        """
+        Returns a new board of the implementation selected by Constants.BOARD_BACKEND.
+
+        Parameters:
+            layout: list
+                OPTIONAL. Default value: None. Position to set up instead of the starting position, see
+                the create_board() method of the Board class.
+
+        Output:
+            board: Board, BitBoard or CompactBoard object
+        """
+        if Constants.BOARD_BACKEND == 'bitboard':
+            return BitBoard(layout)
+        elif Constants.BOARD_BACKEND == 'compact':
+            return CompactBoard(layout)
+        return Board(layout)
+
     def reset(self):
         """
         This method is called from the restart button in the menu to reset the state of the game.  
         """
         self._set_starting_attributes()
+        self.generation += 1
+
+    def copy(self):
+        """
+        Returns a new Game object with a copy of the board and the same participant to move, sharing no Board or
+        Piece object with this game. Used to let a bot think about the position in the background while this
+        game is drawn and played on.
+
+        Output:
+            game: Game object
+        """
+        game = Game()
+        game.board = self.create_board(self.board.get_layout())
+        game.turn = self.turn
+        if self.turn == Constants.OPPONENT_COLOR:
+            game.board.switch_side_to_move()
+        game.generation = self.generation
+        return game
 
     def select_piece(self, row, col):
         """
@@ -96,7 +125,7 @@ class Game:
 
     def get_valid_pieces(self):
         """
-        Iterates through all squares of the board. Returns List of all pieces that can make valid skips.
+        Iterates through all pieces of the current turn's color. Returns List of all pieces that can make valid skips.
         If there are no such pieces, a list of all pieces that can make valid steps are returned
         instead. 
         
@@ -109,14 +138,11 @@ class Game:
         """
         valid_pieces_for_skip, valid_pieces_for_step = [], []
 
-        for row in range(Constants.ROWS):
-            for col in range(Constants.COLS):
-                piece = self.board.get_piece(row, col)
-                if piece != 0 and piece.color == self.turn:
-                    if self.board.get_valid_skips(piece):
-                        valid_pieces_for_skip.append(piece)
-                    if self.board.get_valid_steps(piece):
-                        valid_pieces_for_step.append(piece)
+        for piece in self.board.get_pieces(self.turn):
+            if self.board.get_valid_skips(piece):
+                valid_pieces_for_skip.append(piece)
+            if self.board.get_valid_steps(piece):
+                valid_pieces_for_step.append(piece)
         if valid_pieces_for_skip:
             return valid_pieces_for_skip
         else:
@@ -169,28 +195,15 @@ class Game:
             self.valid_moves: dictionary
                 Resets to empty dictionary such that the opponent player can not make a valid move into a
                 a valid move of the previous player.
+            self.board.hash: int
+                Side to move is part of the hash of the board and is switched as well.
         """
         if self.turn == Constants.PLAYER_COLOR:
             self.turn = Constants.OPPONENT_COLOR
         else:
             self.turn = Constants.PLAYER_COLOR
+        self.board.switch_side_to_move()
         self.selected_piece = None
         self.skipped_pieces = []
         self.has_completed_turn = False
         self.valid_moves = {}
-
-    def draw_valid_moves(self, moves):
-        
-        """
-        Retrieves row and column of a valid move stored as key in the self.valid.moves dictionary.
-        Draws a blue circle at the corresponding location on the Pygame window. 
-
-        Parameters:
-            moves: dictionary
-                Dictionary of valid moves (self.valid_moves).
-        """
-        for move in moves:
-            row, col = move
-            radius = int(Constants.SQUARE_SIZE//2 * .4)
-            pygame.draw.circle(self.window, Constants.BLUE, (col * Constants.SQUARE_SIZE + Constants.SQUARE_SIZE // 2, row * Constants.SQUARE_SIZE + Constants.SQUARE_SIZE // 2), radius=radius) 
-
@@ -0,0 +1,362 @@
+import math
+import time
+
+import numpy as np
+
+from .batch import BatchMoveGenerator
+from .constants import Constants, get_other_color
+from .evaluation import Evaluator
+from .move import Move
+from .search import SearchMover
+from .stats import SearchStats
+
+
+class MCTSNode:
+    """
+    Initialized by the MCTSSearcher class.
+
+    A node of the search tree of the MCTSSearcher class: a position reached by making self.move in the position
+    of self.parent. Children are only created when the node is expanded, the first time it is selected after it
+    has been played out from.
+    """
+    __slots__ = ['move', 'parent', 'children', 'visits', 'value', 'hash']
+
+    def __init__(self, move=None, parent=None):
+        """
+        Parameters:
+            move: Move or NoneType
+                OPTIONAL. Default value: None. Move leading from the parent's position to this one, None for the
+                root.
+            parent: MCTSNode object or NoneType
+                OPTIONAL. Default value: None. Node of the position the move is made in, None for the root.
+
+        Instance variables initialized:
+            self.move, self.parent: see parameters.
+            self.children: list or NoneType
+                Nodes of the positions after every valid move, None until the node is expanded.
+            self.visits: int
+                Amount of playouts made through the node, those still running included.
+            self.value: float
+                Sum of the results of the finished playouts through the node, from the point of view of the
+                participant who made self.move. A win counts 1, a draw 0.5 and a loss 0.
+            self.hash: int or NoneType
+                Hash of the position, see the ZobristKeys class. None until the node is first selected.
+        """
+        self.move = move
+        self.parent = parent
+        self.children = None
+        self.visits = 0
+        self.value = 0.0
+        self.hash = None
+
+    def find(self, key, depth):
+        """
+        Returns the node of the position with the given hash within depth turns below this node, or None if the
+        position has not been reached in the tree.
+        """
+        if self.hash == key:
+            return self
+        if depth == 0 or not self.children:
+            return None
+        for child in self.children:
+            node = child.find(key, depth - 1)
+            if node is not None:
+                return node
+        return None
+
+
+class MCTSSearcher:
+    """
+    Initialized by the MCTSMover class, or directly to analyse a position without the game.
+
+    The MCTSSearcher class chooses a move with Monte Carlo tree search. Every iteration descends the tree from the
+    root, choosing the child with the highest upper confidence bound (UCT), until a node that has not been
+    expanded, plays a random game out from there and adds the result to every node on the way. The move of the
+    most visited child of the root is returned.
+
+    Playouts are made in batches with the BatchMoveGenerator class: self.batch_size leaves are selected, every
+    selected node counting as a lost playout until its result is known so that the other selections of the batch
+    spread out over the tree, and the random games of all of them are advanced in lockstep one step or skip at a
+    time. A playout that has not ended after self.playout_hops hops is scored by the Evaluator class.
+
+    The tree is kept between searches. If the position searched is within two turns below the root of the
+    previous search, the bot's move and the reply to it, the subtree of that position becomes the new root
+    instead of starting over.
+    """
+    PLAYOUT_HOPS = 32
+    EXPLORATION = 1.4
+    EVALUATION_SCALE = 200  # Score difference, about two men, at which a playout counts as 73% won.
+    DEFAULT_PLAYOUTS = 20000  # Playout budget of a search without a time or playout limit.
+
+    def __init__(self, time_limit=1.0, playout_limit=None, batch_size=64, stop_event=None, seed=None):
+        """
+        Parameters:
+            time_limit: float
+                OPTIONAL. Default value: 1.0. Seconds the search may take, None for no time limit.
+            playout_limit: int
+                OPTIONAL. Default value: None. Amount of playouts the search may make, None for no playout
+                limit. If both time_limit and playout_limit are None, the search makes self.DEFAULT_PLAYOUTS
+                playouts.
+            batch_size: int
+                OPTIONAL. Default value: 64. Amount of playouts made at once.
+            stop_event: threading.Event
+                OPTIONAL. Default value: None. If given, the search stops after the running batch when it is set.
+            seed: int
+                OPTIONAL. Default value: None. Seed of the random playouts.
+
+        Instance variables initialized:
+            self.time_limit, self.playout_limit, self.batch_size, self.stop_event: see parameters.
+            self.playout_hops: int
+                Amount of steps and skips after which a playout is stopped and scored.
+            self.root: MCTSNode object or NoneType
+                Root of the tree of the latest search, None before the first search.
+            self.rng: numpy.random.Generator
+                Source of randomness of the playouts.
+            self.move_generator: BatchMoveGenerator object
+                Generates the moves of the playouts.
+            self.evaluator: Evaluator object
+                Scores the playouts that have not ended.
+            self.stats: SearchStats object
+                Statistics of the latest search, see the stats module.
+        """
+        self.time_limit = time_limit
+        self.playout_limit = playout_limit
+        self.batch_size = batch_size
+        self.stop_event = stop_event
+        self.playout_hops = self.PLAYOUT_HOPS
+        self.root = None
+        self.rng = np.random.default_rng(seed)
+        self.move_generator = BatchMoveGenerator.for_size(Constants.BOARD_SIZE)
+        self.evaluator = Evaluator.for_size(Constants.BOARD_SIZE)
+        self.stats = SearchStats('mcts')
+
+    def search(self, board, color) -> Move:
+        """
+        Searches the position until the time or playout budget is used up or self.stop_event is set and returns
+        the most visited move. The board is left in the position it had before the search. A single valid move is
+        returned without searching, with the source of self.stats set to 'forced'.
+
+        Parameters:
+            board: Board type object
+                Position to search. Its hash has to have the side to move of color.
+            color: tuple
+                Color of the participant to move.
+
+        Output:
+            best_move: Move or NoneType
+                Most visited move, None if the participant has no valid move.
+        """
+        self.stats = SearchStats('mcts')
+        start_time = time.perf_counter()
+        deadline = None if self.time_limit is None else start_time + self.time_limit
+        moves = board.get_all_moves(color)
+        if len(moves) <= 1:
+            self.root = None
+            if moves:
+                self.stats.source = 'forced'
+            self.stats.seconds = time.perf_counter() - start_time
+            return moves[0] if moves else None
+
+        self.set_root(board)
+        undo_depth = len(board.undo_stack)
+        playout_limit = self.playout_limit
+        if playout_limit is None and deadline is None:
+            playout_limit = self.DEFAULT_PLAYOUTS
+        positions = np.zeros((self.batch_size, Constants.ROWS, Constants.COLS), dtype=np.int8)
+        player_to_move = np.zeros(self.batch_size, dtype=bool)
+        while playout_limit is None or self.stats.playouts < playout_limit:
+            batch_size = self.batch_size
+            if playout_limit is not None:
+                batch_size = min(batch_size, playout_limit - self.stats.playouts)
+            leaves, results = [], []
+            for idx in range(batch_size):
+                leaf, leaf_color, result = self.select(board, color)
+                leaves.append(leaf)
+                results.append(result)
+                if result is None:
+                    self.write_position(board, positions[idx])
+                    player_to_move[idx] = leaf_color == Constants.PLAYER_COLOR
+                while len(board.undo_stack) > undo_depth:
+                    board.unmake_move()
+            playing = [idx for idx, result in enumerate(results) if result is None]
+            if playing:
+                played = self.playout(positions[playing], player_to_move[playing])
+                for idx, result in zip(playing, played):
+                    results[idx] = result
+            for leaf, result in zip(leaves, results):
+                self.backpropagate(leaf, result)
+            self.stats.playouts += batch_size
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            if self.stop_event is not None and self.stop_event.is_set():
+                break
+
+        best_child = max(self.root.children, key=lambda child: child.visits)
+        self.stats.score = round(100 * best_child.value / best_child.visits) if best_child.visits else 50
+        self.stats.seconds = time.perf_counter() - start_time
+        return best_child.move
+
+    def set_root(self, board):
+        """
+        Makes the node of the board's position the root of the tree. The subtree of the position is kept if it
+        is found within two turns below the previous root, otherwise a new tree is started.
+        """
+        node = None if self.root is None else self.root.find(board.hash, 2)
+        if node is None:
+            node = MCTSNode()
+            node.hash = board.hash
+        node.parent, node.move = None, None
+        self.root = node
+        self.stats.reused_visits = node.visits
+
+    def select(self, board, color):
+        """
+        Descends the tree from the root by the children with the highest UCT value, making their moves on the
+        board, and expands the first node reached that has been played out from before. Every node passed is
+        counted as visited. The moves are not unmade.
+
+        Output:
+            leaf: MCTSNode object
+                Node to play out from.
+            leaf_color: tuple
+                Color of the participant to move at the leaf.
+            result: float or NoneType
+                Result of the leaf from the point of view of the participant to move if the game has ended
+                there, None if it has to be played out.
+        """
+        node = self.root
+        node.visits += 1
+        depth = 0
+        while True:
+            if node.children is None and (node.visits > 1 or node is self.root):
+                node.children = [MCTSNode(move, node) for move in board.get_all_moves(color)]
+            if node.children is None:
+                return node, color, None
+            if not node.children:
+                return node, color, 0.0
+            node = self.choose_child(node)
+            board.make_move(node.move)
+            color = get_other_color(color)
+            node.hash = board.hash
+            node.visits += 1
+            depth += 1
+            self.stats.nodes += 1
+            self.stats.depth = max(self.stats.depth, depth)
+
+    def choose_child(self, node) -> MCTSNode:
+        """
+        Returns the child of the node with the highest UCT value. Children that have not been visited come
+        first, in the order of the moves.
+        """
+        log_visits = math.log(node.visits)
+        best_child, best_value = None, -1.0
+        for child in node.children:
+            if child.visits == 0:
+                return child
+            value = child.value / child.visits + self.EXPLORATION * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best_child, best_value = child, value
+        return best_child
+
+    @staticmethod
+    def backpropagate(leaf, result):
+        """
+        Adds the result of a playout, from the point of view of the participant to move at the leaf, to every
+        node from the leaf up to the root.
+        """
+        node = leaf
+        while node is not None:
+            result = 1.0 - result
+            node.value += result
+            node = node.parent
+
+    @staticmethod
+    def write_position(board, position):
+        """
+        Writes the board to position in the array form of the batch module, see positions_from_boards().
+        """
+        position[:] = 0
+        for squares in board.piece_squares.values():
+            for (row, col) in squares:
+                position[row, col] = board.get_piece(row, col).get_code()
+
+    def playout(self, positions, player_to_move):
+        """
+        Plays random games out from many positions at once. Every hop a random valid step or skip is made in
+        every game that has not ended. A skip is continued by the same piece for as long as it can skip, as in a
+        move of the game. A participant who cannot move has lost and games still running after
+        self.playout_hops hops are scored with the evaluation.
+
+        Parameters:
+            positions: numpy array of shape (N, ROWS, COLS)
+                Positions to play out from. Modified in place.
+            player_to_move: numpy array of shape (N,) and type bool
+                True for the positions where it is the player's turn and False where it is the opponent's.
+
+        Output:
+            results: numpy array of shape (N,) and type float
+                Result of every game from the point of view of the participant to move at its start.
+        """
+        generator = self.move_generator
+        starting_player = player_to_move.copy()
+        player = player_to_move.copy()
+        results = np.full(len(positions), 0.5)
+        active = np.ones(len(positions), dtype=bool)
+        continuing = np.zeros(len(positions), dtype=bool)
+        continuations = None
+        for _ in range(self.playout_hops):
+            moves, is_skip = generator.generate_legal(positions, player)
+            if continuing.any():
+                moves = np.where(continuing[:, None, None, None], continuations, moves)
+                is_skip |= continuing
+            has_move, rows, cols, directions = generator.sample(moves, self.rng)
+            ended = active & ~has_move
+            results[ended] = np.where(player[ended] == starting_player[ended], 0.0, 1.0)
+            active &= has_move
+            if not active.any():
+                break
+            target_rows, target_cols = generator.apply(positions, rows, cols, directions, is_skip, active)
+            skipped = np.flatnonzero(active & is_skip)
+            continuing[:] = False
+            if len(skipped):
+                only = np.zeros((len(skipped),) + positions.shape[1:], dtype=bool)
+                only[np.arange(len(skipped)), target_rows[skipped], target_cols[skipped]] = True
+                skipped_continuations, can_continue = generator.generate_legal(positions[skipped], player[skipped], only)
+                continuations = np.zeros_like(moves)
+                continuations[skipped] = skipped_continuations
+                continuing[skipped] = can_continue
+            player = np.where(continuing, player, ~player)
+
+        if active.any():
+            scores = self.evaluator.evaluate_batch(positions[active], player[active])
+            wins = 1 / (1 + np.exp(-scores / self.EVALUATION_SCALE))
+            results[active] = np.where(player[active] == starting_player[active], wins, 1 - wins)
+            self.stats.evaluations += int(active.sum())
+        return results
+
+
+class MCTSMover(SearchMover):
+    """
+    Initialized instead of BotMover when the MCTS bot is selected, see the movers module.
+
+    MCTSMover chooses its move with the MCTSSearcher class within the budget set by Constants.SEARCH_TIME and
+    Constants.MCTS_PLAYOUTS, and plays the moves of the opening book and endgame tablebase like SearchMover.
+    The searcher of every board size is kept between moves so that the tree of the previous move is reused.
+    MCTSMover does not ponder, as it keeps its tree anyway.
+    """
+    PONDERS = False
+    _searchers = {}
+
+    def create_searcher(self) -> MCTSSearcher:
+        """
+        Returns the searcher of the board size, with the budget of the current constants.
+        """
+        searcher = self._searchers.get(Constants.BOARD_SIZE)
+        if searcher is None:
+            searcher = MCTSSearcher()
+            self._searchers[Constants.BOARD_SIZE] = searcher
+        searcher.time_limit = Constants.SEARCH_TIME
+        searcher.playout_limit = Constants.MCTS_PLAYOUTS
+        searcher.batch_size = Constants.MCTS_BATCH_SIZE
+        searcher.stop_event = self.stop_event
+        return searcher
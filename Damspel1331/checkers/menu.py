@@ -3,6 +3,8 @@ import pygame
 from .highscore import HighscoreManager
 from .constants import Constants
 from .radiobuttons import RadioButtons
+from .textcache import TextCache
+from .movetables import MoveTables
  
 
 class Menu:
@@ -11,8 +13,12 @@ class Menu:
 
     The menu class serves as the user interface for selecting game options, displaying time and
     resetting the game during run time.
+
+    A widget of the menu is only drawn again when what it shows has changed, e.g. the timer once per second, see
+    self.is_changed(). The rectangles drawn on are returned by self.update() so that only they are pushed to the
+    display.
     """
-    def __init__(self, window, game, timer):
+    def __init__(self, window, game, timer, bot_worker=None):
         """
         Parameters:
             window: Pygame Surfance object
@@ -21,11 +27,15 @@ class Menu:
                 Game instance to be modified by selections in the menu.
             timer: Timer object
                 Timer instance to display and return time from
+            bot_worker: BotWorker object
+                OPTIONAL. Default value: None. Bot whose search statistics are drawn if Constants.SHOW_STATS
+                is True.
 
         Instance variables:
             self.window: [see window parameter]
             self.game: [see game parameter]
             self.timer [see timer parameter]
+            self.bot_worker: [see bot_worker parameter]
             self.board_size_options: dictionary
                 Dictionary of possible sizes for the board size.
             self.size_buttons: RadioButtons object
@@ -42,32 +52,45 @@ class Menu:
                 Functions as a logical gatekeeper for updating highscore.
             self.filename: str
                 Path to file where highscore data will be written
+            self.drawn: dictionary
+                Key is the name of a widget and value is what it showed when it was last drawn. Emptied to draw
+                the whole menu again.
+            self.time_rect: Pygame Rect object or NoneType
+                Area of the timer on the window, None before it is drawn.
         """
 
         self.window = window
         self.game = game
         self.timer = timer
+        self.bot_worker = bot_worker
         self.board_size_options = {'8x8': (8, 8), '10x10': (10, 10), '12x12': (12, 12)}
         self.size_buttons = RadioButtons(window=self.window, caption='Board size:', options=self.board_size_options, default=Constants.BOARD_SIZE, top_left=(5, Constants.WIDTH+10))
         self.color_options = {'White': Constants.WHITE, 'Red': Constants.RED}
         self.color_buttons = RadioButtons(window=self.window, caption='Player color:', options=self.color_options, default=self.color_options['White'], top_left=(160, Constants.WIDTH+10)) 
-        self.opponent_options = {'Friend': 'Friend', 'Bot': 'Bot'}
+        self.opponent_options = {'Friend': 'Friend', 'Bot': 'Bot', 'Smart bot': 'Smart bot'}
         self.opponent_buttons = RadioButtons(window=self.window, caption='Opponent:', options=self.opponent_options, default=self.opponent_options['Friend'], top_left=(450, Constants.WIDTH+10))
         self.has_updated_highscore = False
         self.filename = 'Damspel1331/checkers/highscore.txt'        
+        self.drawn = {}
+        self.time_rect = None
 
     def update(self):
         """
-        Calls method for drawing all menu widgets and updates Pygame display. If the game has a winner, the time
-        is written to a highscore txt file where times are sorted under each respective valid board size. 
+        Calls method for drawing the menu widgets that changed and returns the areas drawn on, to be pushed to
+        the Pygame display by the main function. If the game has a winner, the time is written to a highscore
+        txt file where times are sorted under each respective valid board size. 
+
+        Output:
+            dirty_rects: list
+                Pygame Rect objects of the areas drawn on, empty if nothing changed.
         """
-        self.draw_menu()
-        pygame.display.update()
+        dirty_rects = self.draw_menu()
         if self.game.board.winner():
             if self.has_updated_highscore == False:
                 new_score = self.set_time_format(self.timer.winner_time)
                 HighscoreManager(self.filename, self.size_buttons.selected, new_score)
                 self.has_updated_highscore = True            
+        return dirty_rects
 
     def select(self, pos):
         """
@@ -117,20 +140,41 @@ class Menu:
     def draw_menu(self):
         """
         Method for drawing widgets of menu on Pygame window. This is achieved by calling methods responsible for
-        drawing each seperate widget.
+        drawing each seperate widget. Every method returns the areas it drew on, which are returned together.
 
         For further documentation see comments for each called method. 
         """
-        self.draw_menu_boarders()
-        self.draw_timer()
-        self.draw_turn()
-        self.size_buttons.draw_buttons()
-        self.color_buttons.draw_buttons()
-        self.opponent_buttons.draw_buttons()
+        dirty_rects = []
+        dirty_rects += self.draw_menu_boarders()
+        dirty_rects += self.draw_timer()
+        dirty_rects += self.draw_turn()
+        for name, buttons in [('size', self.size_buttons), ('color', self.color_buttons), ('opponent', self.opponent_buttons)]:
+            if self.is_changed(name, buttons.selected):
+                dirty_rects.append(buttons.draw_buttons())
+        if Constants.SHOW_STATS:
+            dirty_rects += self.draw_stats()
+        return dirty_rects
+
+    def is_changed(self, widget, shown):
+        """
+        Returns True if the widget is to show something else than when it was last drawn, and remembers what it
+        shows from now on.
+
+        Parameters:
+            widget: str
+                Name of the widget.
+            shown: any
+                What the widget is to show, e.g. its text.
+        """
+        if widget in self.drawn and self.drawn[widget] == shown:
+            return False
+        self.drawn[widget] = shown
+        return True
 
     def draw_timer(self):
         """
-        Draws the timer and the timer caption on the Pygame window
+        Draws the timer and the timer caption on the Pygame window, each if it changed, and returns the areas
+        drawn on.
         """ 
         # draw timer
         if self.game.board.winner():        # If the game has a winner, the timer "freezes" on the window and 
@@ -139,20 +183,53 @@ class Menu:
         else:
             milliseconds = self.timer.dt
         time_string = self.set_time_format(milliseconds)
-        font_time = pygame.font.SysFont(None, 32)
-        counting_text = font_time.render(time_string, 1, Constants.YELLOW, Constants.GRAY)
+        dirty_rects = []
+        if self.is_changed('timer', time_string):
+            dirty_rects.append(self.draw_time(time_string))
+        if self.is_changed('caption', self.lower_boarder):
+            dirty_rects.append(self.draw_caption())
+        return dirty_rects
+
+    def draw_time(self, time_string):
+        """
+        Draws the time in format h:mm:ss centered under the upper boarder and returns the area drawn on. The
+        previous time is cleared first, as it may have been wider.
+        """
+        counting_text = TextCache.render(time_string, None, 32, Constants.YELLOW, Constants.GRAY)
         counting_rect = counting_text.get_rect(centerx = Constants.WIDTH//2, top=self.upper_boarder[1]+self.upper_boarder[3])
         # self.time_rect_meas is used to make timer interactive in self.timer_is_clicked()
         self.time_rect_meas = (counting_rect.topleft[0], counting_rect.topleft[1], counting_rect.bottomright[0], counting_rect.bottomright[1])
-        
+
+        dirty_rect = counting_rect
+        if self.time_rect is not None:
+            self.window.fill(Constants.BLACK, self.time_rect)
+            dirty_rect = counting_rect.union(self.time_rect)
         self.window.blit(counting_text, counting_rect)
+        self.time_rect = counting_rect
+        return dirty_rect
 
-        # draw caption
-        font_caption = pygame.font.SysFont(None, 25)
+    def draw_caption(self):
+        """
+        Draws the timer caption above the lower boarder and returns the area drawn on.
+        """
         caption_string = "Click timer to start new game with selected options!"
-        caption_text = font_caption.render(caption_string, 1, Constants.DARK_GRAY, Constants.GRAY)
+        caption_text = TextCache.render(caption_string, None, 25, Constants.DARK_GRAY, Constants.GRAY)
         caption_rect = caption_text.get_rect(centerx=Constants.WIDTH//2, bottom=self.lower_boarder[1])
         self.window.blit(caption_text, caption_rect)
+        return caption_rect
+
+    def draw_stats(self):
+        """
+        Draws a summary of the statistics of the bot's latest move under the timer, see the stats module, if it
+        changed and returns the areas drawn on.
+        """
+        stats = self.bot_worker.stats if self.bot_worker else None
+        if not self.is_changed('stats', (str(stats) if stats else '', self.time_rect_meas)):
+            return []
+        stats_text = TextCache.render(f'{str(stats) if stats else "":^60}', None, 18, Constants.GRAY, Constants.BLACK)
+        stats_rect = stats_text.get_rect(centerx=Constants.WIDTH//2, top=self.time_rect_meas[3]+4)
+        self.window.blit(stats_text, stats_rect)
+        return [stats_rect]
 
     def set_time_format(self, milliseconds):
         """
@@ -177,13 +254,17 @@ class Menu:
 
     def draw_menu_boarders(self):
         """
-        Draws boarders in the upper and lower ends of the menu area.
+        Draws boarders in the upper and lower ends of the menu area if they moved, and returns the areas drawn
+        on.
         """
         boarder_height = 5
         self.upper_boarder = (0, Constants.SQUARE_SIZE*Constants.ROWS, Constants.WIDTH, boarder_height)
         self.lower_boarder = (0, Constants.HEIGHT-boarder_height, Constants.WIDTH, boarder_height)
+        if not self.is_changed('boarders', self.upper_boarder):
+            return []
         pygame.draw.rect(self.window, Constants.GRAY, self.upper_boarder)
         pygame.draw.rect(self.window, Constants.GRAY, self.lower_boarder)
+        return [pygame.Rect(self.upper_boarder), pygame.Rect(self.lower_boarder)]
 
     def draw_turn(self):
         if self.game.turn == Constants.PLAYER_COLOR :
@@ -194,11 +275,13 @@ class Menu:
             turn_str_color = Constants.OPPONENT_COLOR
         if self.game.board.winner():
             turn_str_color = Constants.BLACK # 
-        turn_font = pygame.font.SysFont(None, 25)
-        turn_text = turn_font.render(turn_str, 1, turn_str_color, Constants.BLACK)
+        if not self.is_changed('turn', (turn_str, turn_str_color)):
+            return []
+        turn_text = TextCache.render(turn_str, None, 25, turn_str_color, Constants.BLACK)
         turn_text_rect = turn_text.get_rect(centerx=Constants.WIDTH//2, bottom=self.lower_boarder[1]-27)
 
         self.window.blit(turn_text, turn_text_rect)
+        return [turn_text_rect]
 
 
     def restart(self):
@@ -207,6 +290,8 @@ class Menu:
         """
         self.window.fill(Constants.BLACK) # Upon restart, window is cleared by filling with black to 
                                           # erase any remainder of a previous board in the background.
+        self.drawn = {}                   # Every widget is drawn again on the cleared window.
+        self.time_rect = None
         self.set_board_size()
         self.set_piece_colors()
         self.set_opponent()
@@ -226,10 +311,12 @@ class Menu:
                 Values for rows and columns of new board size.
             Constants.SQUARE_SIZE: int
                 Size of board squares.
+
+        The move tables of the selected size are built here if the size has not been played before. Every
+        following game of the same size reuses them.
         """
-        Constants.BOARD_SIZE = self.size_buttons.selected
-        Constants.ROWS, Constants.COLS = Constants.BOARD_SIZE
-        Constants.SQUARE_SIZE = Constants.WIDTH // Constants.COLS
+        Constants.set_board_size(self.size_buttons.selected)
+        MoveTables.for_size(Constants.BOARD_SIZE)
 
     def set_piece_colors(self):
         """
@@ -248,8 +335,22 @@ class Menu:
             Constants.OPPONENT_COLOR = Constants.RED
 
     def set_opponent(self):
+        """
+        Sets opponent for new game instance as selected in menu.
+
+        Modified instance variables:
+            Constants.BOT_ACTIVE: bool
+                False if playing against a friend.
+            Constants.BOT_ENGINE: str
+                'greedy' for the bot and 'search' or, on a computer with several CPUs, 'parallel' for the
+                smart bot, see the movers module.
+        """
         if self.opponent_buttons.selected == 'Bot':
             Constants.BOT_ACTIVE = True
+            Constants.BOT_ENGINE = 'greedy'
+        elif self.opponent_buttons.selected == 'Smart bot':
+            Constants.BOT_ACTIVE = True
+            Constants.BOT_ENGINE = 'parallel' if Constants.SEARCH_WORKERS > 1 else 'search'
         elif self.opponent_buttons.selected == 'Friend':
             Constants.BOT_ACTIVE = False
 
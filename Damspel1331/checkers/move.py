@@ -0,0 +1,60 @@
+from collections import namedtuple
+
+from .constants import Constants
+
+
+class Move(namedtuple('Move', ['origin', 'path', 'captured'])):
+    """
+    A complete turn of one piece, passed to the make_move() method of the Board class.
+
+    Attributes:
+        origin: tuple
+            Square (row, col) the moving piece starts on.
+        path: tuple
+            Squares (row, col) the piece lands on, in the order it lands on them. A step has a single
+            square in its path and a skip sequence has one square per skip.
+        captured: tuple
+            Squares (row, col) of the pieces skipped over. Element i is the piece skipped over when landing
+            on element i of path. Empty for a step.
+    """
+    __slots__ = ()
+
+    @property
+    def target(self):
+        """
+        Square (row, col) the moving piece ends the turn on.
+        """
+        return self.path[-1]
+
+    def __str__(self):
+        """
+        Returns the move in notation where a square is named by its column letter and its row number counted
+        from the bottom of the board, e.g. 'c3-d4' for a step and 'c3xe5xc7' for a sequence of two skips.
+        """
+        separator = 'x' if self.captured else '-'
+        return separator.join(self.get_square_name(square) for square in (self.origin,) + tuple(self.path))
+
+    @staticmethod
+    def get_square_name(square):
+        """
+        Returns the name of a square (row, col) in the notation of self.__str__().
+        """
+        row, col = square
+        return f"{chr(ord('a') + col)}{Constants.ROWS - row}"
+
+
+class UndoRecord(namedtuple('UndoRecord', ['move', 'piece', 'was_king', 'captured_pieces'])):
+    """
+    Returned by the make_move() method of the Board class and consumed by its unmake_move() method.
+
+    Attributes:
+        move: Move
+            Move that was made.
+        piece: Piece object
+            Piece that moved.
+        was_king: bool
+            Whether the piece was a king before the move, to be able to undo a promotion.
+        captured_pieces: list
+            Piece objects that were removed from the board, in the order they were removed.
+    """
+    __slots__ = ()
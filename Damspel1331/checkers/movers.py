@@ -0,0 +1,15 @@
+"""
+Registry of the bots that can play the opponent. Key is the value of Constants.BOT_ENGINE and value is the
+class that is initialized to make the bot's move, see the main function of the main file.
+"""
+from .bot import BotMover
+from .mcts import MCTSMover
+from .parallel import ParallelSearchMover
+from .search import SearchMover
+
+MOVERS = {
+    'greedy': BotMover,
+    'search': SearchMover,
+    'parallel': ParallelSearchMover,
+    'mcts': MCTSMover,
+}
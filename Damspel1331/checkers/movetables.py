@@ -0,0 +1,70 @@
+class MoveTables:
+    """
+    Initialized through MoveTables.for_size() from the constructor of the Board class and from set_board_size()
+    method of the Menu class.
+
+    The MoveTables class holds, for every square of a board of a given size, the squares a piece standing on it can
+    step to, skip to and skip over in each diagonal direction. The tables only depend on the board size and are
+    built once per size, which means that move generation in the Board class is reduced to lookups. The BitBoard
+    class of the default 'bitboard' backend generates its moves with bitmasks instead, so the tables are only
+    used by the 'matrix' and 'compact' backends.
+    """
+    _tables = {}
+
+    def __init__(self, board_size):
+        """
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Instance variables initialized:
+            self.rows, self.cols: int, int
+                Amount of rows and columns of the board.
+            self.directions: list (matrix of size rows x cols)
+                Element [row][col] is a list with one tuple (row_step, step_target, skip_target, skipped_square) for
+                every diagonal direction in which the square (row, col) has a neighbor. row_step is -1 for directions
+                going up and 1 for directions going down. step_target is the neighboring square, skip_target the
+                square behind it and skipped_square the square skipped over, which is the same square as
+                step_target. skip_target and skipped_square are None if the skip would leave the board. Directions
+                are ordered up-left, up-right, down-left, down-right, which is the order the moves of a piece are
+                found and returned in.
+        """
+        self.rows, self.cols = board_size
+        self.directions = []
+        for row in range(self.rows):
+            self.directions.append([])
+            for col in range(self.cols):
+                self.directions[row].append([])
+                for row_step in [-1, 1]:
+                    for col_step in [-1, 1]:
+                        if not self.is_on_board(row + row_step, col + col_step):
+                            continue
+                        step_target = (row + row_step, col + col_step)
+                        if self.is_on_board(row + 2 * row_step, col + 2 * col_step):
+                            skip_target, skipped_square = (row + 2 * row_step, col + 2 * col_step), step_target
+                        else:
+                            skip_target, skipped_square = None, None
+                        self.directions[row][col].append((row_step, step_target, skip_target, skipped_square))
+
+    @classmethod
+    def for_size(cls, board_size):
+        """
+        Returns the move tables of the given board size. Tables are only built the first time a board size is
+        used and are then reused by every following game of that size.
+
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Output:
+            tables: MoveTables object
+        """
+        if board_size not in cls._tables:
+            cls._tables[board_size] = cls(board_size)
+        return cls._tables[board_size]
+
+    def is_on_board(self, row, col) -> bool:
+        """
+        Returns True if (row, col) is a square of the board.
+        """
+        return 0 <= row < self.rows and 0 <= col < self.cols
@@ -0,0 +1,286 @@
+"""
+Parallel root search. The moves of the root position are split across the worker processes of a
+ProcessPoolExecutor, which is kept alive between moves so that the workers and their transposition tables are
+warm from the second move on.
+
+Run from the Damspel1331 directory to compare the depth reached with different amounts of workers, e.g.
+
+    python -m checkers.parallel --size 10 --seconds 2 --workers 1 2 4 8
+"""
+import argparse
+import concurrent.futures
+import multiprocessing
+import os
+import time
+
+from .constants import Constants, get_other_color
+from .game import Game
+from .search import EXACT, Searcher, SearchMover, SearchTimeout
+from .stats import SearchStats
+
+# State of a worker process, set by _initialize_worker() and _apply_settings().
+_worker_state = {'bound': None, 'stop': None, 'searcher': None, 'settings': None}
+
+
+class WorkerSearcher(Searcher):
+    """
+    Initialized once per board size in every worker process of the ParallelSearcher class.
+
+    The WorkerSearcher class searches a single move of the root position. It stops early when the main process
+    asks every worker to stop, and narrows its window with the best score found by any worker so far.
+    """
+    MAX_TRANSPOSITIONS = 2000000
+
+    def search_move(self, board, color, move, depth, alpha, beta, time_limit, node_limit):
+        """
+        Searches the position after move to depth - 1 turns and returns the score of move for the participant of
+        the given color, or None if the budget was used up first.
+
+        Parameters:
+            board: Board type object
+                Root position.
+            color: tuple
+                Color of the participant to move in the root position.
+            move: Move
+                Root move to search.
+            depth: int
+                Depth of the root search.
+            alpha, beta: int, int
+                Window of the root search when the move was handed out.
+            time_limit: float
+                Seconds left of the budget of the root search.
+            node_limit: int
+                Amount of positions left of the budget of the root search, None for no node limit.
+
+        Output:
+            score, stats, is_exact: int or NoneType, SearchStats object, bool
+                stats holds the statistics of the search of move. is_exact is False if the score is only an upper
+                bound of the score of move, as it was not better than the best score of the root search when the
+                move was searched.
+        """
+        if len(self.transpositions) > self.MAX_TRANSPOSITIONS:
+            self.transpositions.clear()
+        self.nodes = 0
+        self.stats = SearchStats()
+        self.deadline = None if time_limit is None else time.perf_counter() + time_limit
+        self.node_limit = node_limit
+        alpha = max(alpha, _worker_state['bound'].value)
+        board.make_move(move)
+        try:
+            score = -self.negamax(board, get_other_color(color), depth - 1, -beta, -alpha, 1)
+        except SearchTimeout:
+            score = None
+        finally:
+            board.unmake_move()
+        self.stats.nodes = self.nodes
+        if score is None:
+            return None, self.stats, False
+        with _worker_state['bound'].get_lock():
+            if score > _worker_state['bound'].value:
+                _worker_state['bound'].value = score
+        return score, self.stats, alpha < score < beta
+
+    def count_node(self):
+        """
+        Counts a visited position as in the Searcher class, and also raises SearchTimeout if the main process
+        has asked the workers to stop.
+        """
+        super().count_node()
+        if self.nodes % self.CHECK_INTERVAL == 0 and _worker_state['stop'].value:
+            raise SearchTimeout
+
+
+def _initialize_worker(bound, stop):
+    """
+    Stores the values shared with the main process when a worker process starts.
+    """
+    _worker_state['bound'] = bound
+    _worker_state['stop'] = stop
+
+
+def _apply_settings(settings):
+    """
+    Copies the settings of Constants of the main process that the board depends on into the worker process. The
+    searcher, and with it the transposition table, is only replaced when the board size changes.
+    """
+    if settings == _worker_state['settings']:
+        return
+    board_size, player_color, opponent_color, backend = settings
+    Constants.set_board_size(board_size)
+    Constants.PLAYER_COLOR, Constants.OPPONENT_COLOR = player_color, opponent_color
+    Constants.BOARD_BACKEND = backend
+    if _worker_state['settings'] is None or _worker_state['settings'][0] != board_size:
+        _worker_state['searcher'] = WorkerSearcher(time_limit=None)
+    _worker_state['settings'] = settings
+
+
+def _search_move(settings, layout, color, move, depth, alpha, beta, time_limit, node_limit):
+    """
+    Task run in a worker process. Sets up the root position and searches move, see WorkerSearcher.search_move().
+    """
+    _apply_settings(settings)
+    board = Game.create_board(layout)
+    if color == Constants.OPPONENT_COLOR:
+        board.switch_side_to_move()
+    return _worker_state['searcher'].search_move(board, color, move, depth, alpha, beta, time_limit, node_limit)
+
+
+def _warm_up():
+    """
+    Empty task submitted once per worker when the pool is created, so that the worker processes are started
+    before the first search.
+    """
+    return os.getpid()
+
+
+class ParallelSearcher(Searcher):
+    """
+    Initialized by the ParallelSearchMover class, or directly to analyse a position without the game.
+
+    The ParallelSearcher class searches like the Searcher class, but from self.PARALLEL_DEPTH on the root moves of
+    every iteration are searched in parallel by a pool of worker processes. The best move of the previous
+    iteration is first searched in the main process to get a good lower bound, then the other moves are handed
+    out to the workers. The best score found so far is shared with the workers through shared memory, so that
+    every worker searches with the narrowest window known when it starts a move.
+
+    The pool is shared by all ParallelSearcher objects with the same amount of workers and lives until the
+    program exits.
+    """
+    PARALLEL_DEPTH = 4  # Shallower iterations are faster to search in the main process.
+    POLL_INTERVAL = 0.02  # Seconds between checks of the budget while waiting for the workers.
+    _pools = {}
+
+    def __init__(self, workers=None, time_limit=1.0, node_limit=None, max_depth=64, stop_event=None):
+        """
+        Parameters:
+            workers: int
+                OPTIONAL. Default value: None. Amount of worker processes, None for Constants.SEARCH_WORKERS.
+            time_limit, node_limit, max_depth, stop_event: see the Searcher class. The node limit is the budget
+                of the whole search. Every move handed out to a worker may visit the positions left of it at that
+                moment, and the search stops once the positions of the main process and the finished moves of
+                the workers together are over it.
+
+        Instance variables initialized:
+            self.workers: see workers parameter.
+            self.executor, self.bound, self.stop: see self.get_pool(). None if there is a single worker, as the
+                search is then done in the main process.
+            Further instance variables as in the Searcher class.
+        """
+        super().__init__(time_limit, node_limit, max_depth, stop_event)
+        self.workers = Constants.SEARCH_WORKERS if workers is None else workers
+        self.executor, self.bound, self.stop = self.get_pool(self.workers) if self.workers > 1 else (None, None, None)
+
+    @classmethod
+    def get_pool(cls, workers):
+        """
+        Returns the pool with the given amount of workers. The pool is only created, and its worker processes
+        started, the first time it is used. As that may happen in the background thread of the bot, the worker
+        processes are spawned instead of forked, since forking a process with several threads is not safe.
+
+        Output:
+            executor: ProcessPoolExecutor object
+            bound: multiprocessing.Value
+                Best score of the root position found so far in the running iteration, shared with the workers.
+            stop: multiprocessing.Value
+                Set to 1 by the main process to make the workers stop searching.
+        """
+        if workers not in cls._pools:
+            context = multiprocessing.get_context('spawn')
+            bound = context.Value('i', 0)
+            stop = context.Value('b', 0)
+            executor = concurrent.futures.ProcessPoolExecutor(workers, mp_context=context, initializer=_initialize_worker, initargs=(bound, stop))
+            concurrent.futures.wait([executor.submit(_warm_up) for _ in range(workers)])
+            cls._pools[workers] = (executor, bound, stop)
+        return cls._pools[workers]
+
+    def search_root(self, board, color, depth, moves, previous_best):
+        """
+        Searches every move of the root position to the given depth, in parallel from self.PARALLEL_DEPTH on.
+        Raises SearchTimeout if the budget is used up before every move has been searched.
+
+        Output:
+            best_score, best_move: int, Move
+        """
+        if depth < self.PARALLEL_DEPTH or self.workers <= 1:
+            return super().search_root(board, color, depth, moves, previous_best)
+
+        ordered_moves = self.order_moves(moves, previous_best)
+        alpha, beta = -self.WIN_SCORE - 1, self.WIN_SCORE + 1
+        board.make_move(ordered_moves[0])
+        try:
+            best_score = -self.negamax(board, get_other_color(color), depth - 1, -beta, -alpha, 1)
+        finally:
+            board.unmake_move()
+        best_move = ordered_moves[0]
+
+        self.bound.value = best_score
+        self.stop.value = 0
+        settings = (Constants.BOARD_SIZE, Constants.PLAYER_COLOR, Constants.OPPONENT_COLOR, Constants.BOARD_BACKEND)
+        layout = board.get_layout()
+        time_limit = None if self.deadline is None else max(self.deadline - time.perf_counter(), 0)
+        node_limit = None if self.node_limit is None else max(self.node_limit - self.nodes, 0)
+        futures = {}
+        for move in ordered_moves[1:]:
+            future = self.executor.submit(_search_move, settings, layout, color, move, depth, best_score, beta, time_limit, node_limit)
+            futures[future] = move
+
+        finished = True
+        pending = set(futures)
+        while pending and finished:
+            done, pending = concurrent.futures.wait(pending, timeout=self.POLL_INTERVAL, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                score, stats, is_exact = future.result()
+                self.nodes += stats.nodes
+                self.stats.merge(stats)
+                if score is None:
+                    finished = False
+                elif is_exact and score > best_score:
+                    best_score, best_move = score, futures[future]
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                finished = False
+            if self.node_limit is not None and self.nodes > self.node_limit:
+                finished = False
+            if self.stop_event is not None and self.stop_event.is_set():
+                finished = False
+        if not finished:
+            self.stop.value = 1
+            for future in futures:
+                future.cancel()
+            concurrent.futures.wait(futures)
+            raise SearchTimeout
+        self.store(board.hash, depth, best_score, EXACT, best_move, 0)
+        return best_score, best_move
+
+
+class ParallelSearchMover(SearchMover):
+    """
+    Initialized instead of SearchMover when Constants.SEARCH_WORKERS is more than 1, see the movers module.
+
+    ParallelSearchMover searches with the ParallelSearcher class and Constants.SEARCH_WORKERS worker processes.
+    """
+    def create_searcher(self) -> Searcher:
+        """
+        Returns the searcher used to choose the move.
+        """
+        return ParallelSearcher(time_limit=Constants.SEARCH_TIME, node_limit=Constants.SEARCH_NODES, stop_event=self.stop_event)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare the search depth reached with different amounts of workers.')
+    parser.add_argument('--size', type=int, default=10, choices=[8, 10, 12], help='board size')
+    parser.add_argument('--seconds', type=float, default=2.0, help='time budget per search')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count() or 1], help='amounts of workers to compare')
+    args = parser.parse_args(argv)
+
+    Constants.set_board_size((args.size, args.size))
+    print(f'{args.size}x{args.size}, {args.seconds} s per search from the starting position:')
+    for workers in args.workers:
+        searcher = ParallelSearcher(workers, time_limit=args.seconds)
+        board = Game.create_board()
+        move = searcher.search(board, Constants.PLAYER_COLOR)
+        print(f'workers {workers:3}  depth {searcher.depth:3}  nodes {searcher.nodes:10}  move {move}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
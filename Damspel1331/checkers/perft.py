@@ -0,0 +1,229 @@
+"""
+Perft (performance test) of the move generator. Counts the positions reached after every sequence of complete
+turns of a given length, which both measures the speed of the move generator and, compared with stored node
+counts, checks its correctness.
+
+Run from the Damspel1331 directory, e.g.
+
+    python -m checkers.perft --position start10 --depth 5 --divide
+    python -m checkers.perft --check
+
+The check also makes and unmakes a capture sequence that ends in a promotion and checks that the position is
+restored exactly.
+"""
+import argparse
+import time
+
+from .constants import Constants, get_other_color
+from .game import Game
+
+# Stored positions in format name: (board size, side to move, layout, {depth: nodes}). A layout of None is the
+# starting position. See the create_board() method of the Board class for the layout format.
+TEST_POSITIONS = {
+    'start8': ((8, 8), 'player', None, {1: 7, 2: 49, 3: 302, 4: 1469, 5: 7361}),
+    'start10': ((10, 10), 'player', None, {1: 9, 2: 81, 3: 658, 4: 4265, 5: 26875}),
+    'start12': ((12, 12), 'player', None, {1: 11, 2: 121, 3: 1222, 4: 10053, 5: 78629}),
+    'kings8': ((8, 8), 'player', [
+        '.o.P...o',
+        '....o...',
+        '.....o..',
+        '........',
+        '.....o.p',
+        '......p.',
+        '...p.p.p',
+        'O.......',
+    ], {1: 1, 2: 1, 3: 7, 4: 32, 5: 122, 6: 574, 7: 2669}),
+    'captures10': ((10, 10), 'opponent', [
+        '...o......',
+        'o.o.....o.',
+        '.....o...o',
+        '......o.o.',
+        '.....o.o..',
+        '....p...o.',
+        '...p...p.p',
+        '....p.....',
+        '...p.p.p.p',
+        'O.......p.',
+    ], {1: 1, 2: 7, 3: 59, 4: 383, 5: 3091}),
+    'endgame12': ((12, 12), 'player', [
+        '............',
+        '............',
+        '.........p..',
+        'p...........',
+        '............',
+        '............',
+        '...........p',
+        'p.P.......o.',
+        '............',
+        'p...........',
+        '............',
+        '..O.......O.',
+    ], {1: 10, 2: 60, 3: 570, 4: 3783}),
+}
+
+# Position in which the player's man on b4 captures twice and is promoted on f8, see check_unmake_move().
+PROMOTION_CAPTURE_LAYOUT = [
+    '........',
+    '....o...',
+    '.......o',
+    '..o.....',
+    '.p......',
+    '........',
+    '........',
+    '........',
+]
+
+
+def perft(board, color, depth) -> int:
+    """
+    Counts the positions reached after every sequence of depth complete turns, starting with the participant
+    of the given color. A position where the participant to move has no move ends its sequence early and is
+    not counted.
+
+    Parameters:
+        board: Board type object
+            Position to start from. It is modified with make_move() and restored with unmake_move().
+        color: tuple
+            Color of the participant to move.
+        depth: int
+            Amount of turns.
+
+    Output:
+        nodes: int
+            Amount of positions reached.
+    """
+    if depth == 0:
+        return 1
+    moves = board.get_all_moves(color)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    other_color = get_other_color(color)
+    for move in moves:
+        board.make_move(move)
+        nodes += perft(board, other_color, depth - 1)
+        board.unmake_move()
+    return nodes
+
+
+def divide(board, color, depth) -> list:
+    """
+    Runs perft() below every move of the participant to move, to find which move a wrong node count comes
+    from.
+
+    Output:
+        results: list
+            List of tuples (move, nodes) with one tuple per move.
+    """
+    results = []
+    for move in board.get_all_moves(color):
+        board.make_move(move)
+        results.append((move, perft(board, get_other_color(color), depth - 1)))
+        board.unmake_move()
+    return results
+
+
+def set_up_position(name):
+    """
+    Sets the board size of a stored position in Constants and returns a new board and the color to move.
+
+    Parameters:
+        name: str
+            Key of TEST_POSITIONS.
+
+    Output:
+        board, color: Board type object, tuple
+    """
+    board_size, side, layout, _ = TEST_POSITIONS[name]
+    Constants.set_board_size(board_size)
+    color = Constants.PLAYER_COLOR if side == 'player' else Constants.OPPONENT_COLOR
+    return Game.create_board(layout), color
+
+
+def check_positions():
+    """
+    Runs perft on every stored position to every stored depth and compares the node counts with the stored
+    ones.
+
+    Output:
+        bool
+            True if all node counts are equal to the stored ones.
+    """
+    all_equal = True
+    for name, (_, _, _, expected_nodes) in TEST_POSITIONS.items():
+        board, color = set_up_position(name)
+        for depth, expected in expected_nodes.items():
+            nodes = perft(board, color, depth)
+            status = 'ok' if nodes == expected else f'FAILED, expected {expected}'
+            all_equal = all_equal and nodes == expected
+            print(f'{name:12} depth {depth}: {nodes:10} {status}')
+    return all_equal
+
+
+def get_snapshot(board):
+    """
+    Returns everything that unmake_move() has to restore: the layout, the squares of the pieces of both colors,
+    the piece counts, the hash and the size of the undo stack.
+    """
+    piece_squares = {color: set(squares) for color, squares in board.piece_squares.items()}
+    return board.get_layout(), piece_squares, board.player_left, board.opponent_left, board.hash, len(board.undo_stack)
+
+
+def check_unmake_move():
+    """
+    Makes and unmakes the capture sequence of PROMOTION_CAPTURE_LAYOUT with its UndoRecord and compares the
+    position with the one before the move. Unmaking with a record that is no longer on top of the undo stack
+    has to raise ValueError.
+
+    Output:
+        bool
+            True if the position was restored exactly and the stale record was refused.
+    """
+    Constants.set_board_size((8, 8))
+    board = Game.create_board(PROMOTION_CAPTURE_LAYOUT)
+    before = get_snapshot(board)
+    move, = board.get_all_moves(Constants.PLAYER_COLOR)
+    record = board.make_move(move)
+    promoted = board.get_piece(*move.target).king and not record.was_king and len(record.captured_pieces) == 2
+    board.unmake_move(record)
+    restored = get_snapshot(board) == before and not board.get_piece(*move.origin).king
+    try:
+        board.unmake_move(record)
+        refused = False
+    except ValueError:
+        refused = True
+    ok = promoted and restored and refused
+    print(f'{"unmake":12} {str(move):18} {"ok" if ok else "FAILED"}')
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Count leaf nodes of the move generator.')
+    parser.add_argument('--position', default='start8', choices=sorted(TEST_POSITIONS), help='stored position to start from')
+    parser.add_argument('--depth', type=int, default=4, help='amount of turns to search')
+    parser.add_argument('--divide', action='store_true', help='print the node count below every root move')
+    parser.add_argument('--backend', default=Constants.BOARD_BACKEND, choices=['matrix', 'bitboard', 'compact'], help='board implementation')
+    parser.add_argument('--check', action='store_true', help='compare all stored positions with their stored node counts')
+    args = parser.parse_args(argv)
+    Constants.BOARD_BACKEND = args.backend
+
+    if args.check:
+        positions_ok = check_positions()
+        return 0 if check_unmake_move() and positions_ok else 1
+
+    board, color = set_up_position(args.position)
+    start_time = time.perf_counter()
+    if args.divide:
+        nodes = 0
+        for move, move_nodes in divide(board, color, args.depth):
+            print(f'{str(move):24} {move_nodes}')
+            nodes += move_nodes
+    else:
+        nodes = perft(board, color, args.depth)
+    seconds = time.perf_counter() - start_time
+    print(f'nodes: {nodes}  time: {seconds:.3f} s  nodes/s: {nodes / max(seconds, 1e-9):.0f}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,4 +1,3 @@
-import pygame
 from .constants import Constants
 
 class Piece():
@@ -6,82 +5,77 @@ class Piece():
     Piece instances are initialized in create_board() method of the board class.
 
     Piece objects are the value of elements of the matrix representation of the board that
-    contain pieces.
+    contain pieces. The class uses __slots__ instead of an instance dictionary, which keeps the
+    memory of a piece down to its five attributes.
     """
-    def __init__(self, row, col, color):
+    __slots__ = ('row', 'col', 'color', 'king', 'direction')
+
+    def __init__(self, row, col, color, king=False):
         """
         Instance variables initialized in the constructor:
             self.row, self.col: int, int
                 row and col represent the position of the piece on the checker board.
             self.color: tuple
-                Tuple representing color of the piece in RGB-format. All colors in 
+                Tuple representing color of the piece in RGB-format. All colors in
                 this program are passed from the checkers.constants module.
             self.king: bool
                 A piece being a king or not rules whether a piece is allowed to move
-                in one or both directions on the board. 
+                in one or both directions on the board. OPTIONAL parameter, default value False.
         """
         self.row = row
         self.col = col
         self.color = color
-        self.king = False
+        self.king = king
         self.set_direction()
-        self.calc_pos()
 
     def set_direction(self):
         """
         Sets which direction piece is to step or skip on the board. Is used in
-        the board method explore_valid_paths(). 
+        the board method explore_valid_paths().
         """
         if self.color == Constants.PLAYER_COLOR:
             self.direction = -1
         else:
             self.direction = 1
 
-    def calc_pos(self):
+    @property
+    def x(self):
         """
-        Inverse function of get_row_col_from_mouse function in main function in main file. 
+        Inverse function of get_row_col_from_mouse function in main function in main file.
         Drawing circles with Pygame requires the x- and y-coordinates on the Pygame window
-        where a piece is to be drawn.
+        where a piece is to be drawn, see the draw_piece() method of the Renderer class.
+        The coordinates are only calculated when they are asked for, which means that
+        moving pieces while evaluating moves does not calculate any.
+
+        x-coordinate corresponding to center of the square containing the Piece object on
+        the Pygame window.
+        """
+        return Constants.SQUARE_SIZE * self.col + Constants.SQUARE_SIZE // 2
 
-        Instance variables initialized/modified:
-            self.x, self.y: int, int
-                x- and y-coordinates corresponding to center of the square containing
-                the Piece object on the Pygame window.
+    @property
+    def y(self):
+        """
+        y-coordinate corresponding to center of the square containing the Piece object on
+        the Pygame window. See self.x.
         """
-        self.x = Constants.SQUARE_SIZE * self.col + Constants.SQUARE_SIZE // 2
-        self.y = Constants.SQUARE_SIZE * self.row + Constants.SQUARE_SIZE // 2
+        return Constants.SQUARE_SIZE * self.row + Constants.SQUARE_SIZE // 2
 
     def make_king(self):
         """
-        A piece is promoted to king when it reaches the last row of the opposite side of 
-        the board. This method is called in the move method of the class Board.
-        
+        A piece is promoted to king when it reaches the last row of the opposite side of
+        the board. This method is called in the move method of the class Board, which updates
+        the hash of the board for the promotion by placing the piece after promoting it.
+
         Instance variables modified:
             self.king: bool
         """
         self.king = True
 
-    def draw(self, window):
-        """
-        Method responsible for drawing the pieces on the Pygame window. If a Piece object
-        has been promoted to king, a crown is drawn on top of its circle representation in 
-        Pygame. The radius of the circle is calculated to properly scale as the size of the
-        board is changed.
-        
-        Parameters:
-            window: Pygame Surface object
-                Pygame window to draw piece representation on.
-        """
-        radius = int(Constants.SQUARE_SIZE//2 * 0.7)
-        pygame.draw.circle(window, self.color, (self.x, self.y), radius=radius)
-        if self.king:
-            window.blit(Constants.CROWN, (self.x - Constants.CROWN.get_width()//2, self.y - Constants.CROWN.get_height()//2))
-
     def update_position(self, row, col):
         """
-        This method updates the row and column as well as the x and y salues of the Piece instance such that the 
-        corresponding circle is drawn in the position where the piece object moved.
-            
+        This method updates the row and column of the Piece instance such that the corresponding
+        circle is drawn in the position where the piece object moved.
+
         Parameters:
             row: int
                 Row of destination square the piece is moving to.
@@ -90,5 +84,13 @@ class Piece():
         """
         self.row = row
         self.col = col
-        self.calc_pos()
-        
\ No newline at end of file
+
+    def get_code(self) -> int:
+        """
+        Returns the piece as a small integer, the form pieces are stored in by the CompactBoard class.
+        1 is a man and 2 a king of the player's color, 3 is a man and 4 a king of the opponent's color.
+        0 is left for empty squares.
+        """
+        if self.color == Constants.PLAYER_COLOR:
+            return 2 if self.king else 1
+        return 4 if self.king else 3
@@ -0,0 +1,151 @@
+import concurrent.futures
+import threading
+import time
+
+from .constants import get_other_color
+from .search import Searcher
+
+
+class Ponderer:
+    """
+    Initialized by the BotWorker class.
+
+    The Ponderer class lets the bot think on the human's time. While the human chooses a move, every reply the
+    human can make is searched in a background thread, a little deeper each round, and the best answer of the
+    bot is kept keyed by the hash of the position after the reply. When the human's move arrives, pondering is
+    stopped and the bot can answer at once if the position was searched with at least the budget of the bot.
+    """
+    def __init__(self):
+        """
+        Instance variables initialized:
+            self.executor: ThreadPoolExecutor object
+                Runs the pondering in a single background thread.
+            self.future: Future object or NoneType
+                Future of the running pondering, None if not pondering.
+            self.stop_event: threading.Event or NoneType
+                Set to stop the running pondering.
+            self.key: tuple or NoneType
+                Generation of the game and hash of the board of the position pondered on, see self.start().
+            self.results: dictionary
+                Key is the hash of a position after a reply of the human and value is a tuple (move, depth,
+                seconds, nodes) of the best move of the bot found there, the depth it was searched to and the
+                seconds spent and positions visited searching it.
+        """
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='ponder')
+        self.future = None
+        self.stop_event = None
+        self.key = None
+        self.results = {}
+
+    def is_running(self):
+        """
+        Returns True if the ponderer is thinking.
+        """
+        return self.future is not None and not self.future.done()
+
+    def start(self, game):
+        """
+        Starts pondering on the position of the game, where it is the human's turn. Does nothing if the ponderer
+        is already thinking or has already pondered on the position.
+
+        Parameters:
+            game: Game object
+                Game to ponder on. Only a copy of it is used by the background thread.
+        """
+        key = (game.generation, game.board.hash)
+        if self.is_running() or key == self.key:
+            return
+        self.stop()
+        self.key = key
+        self.results = {}
+        self.stop_event = threading.Event()
+        game_copy = game.copy()
+        self.future = self.executor.submit(self.ponder, game_copy.board, game_copy.turn, self.stop_event, self.results)
+
+    def stop(self):
+        """
+        Stops the pondering and waits for the background thread to finish its search, such that it does not
+        take any more CPU time. The results found so far are kept.
+        """
+        if self.stop_event is not None:
+            self.stop_event.set()
+        if self.future is not None:
+            concurrent.futures.wait([self.future])
+        self.future = None
+        self.stop_event = None
+
+    def get_result(self, game, min_seconds, min_nodes=None):
+        """
+        Returns the move pondered for the current position of the game, or None if the position was neither
+        pondered on for at least min_seconds nor for at least min_nodes, as the search of the bot ends on
+        whichever of its budgets runs out first. If both are None the bot has no budget to compare with, as it
+        searches as deep as the Searcher class goes, and None is returned as well.
+
+        Parameters:
+            game: Game object
+                Game in which it is the bot's turn.
+            min_seconds: float or NoneType
+                Least seconds the position has to have been searched, usually the time budget of the bot. None
+                for no least amount of seconds.
+            min_nodes: int
+                OPTIONAL. Default value: None. Least amount of positions that have to have been visited
+                searching the position, usually the node budget of the bot. None for no least amount of
+                positions.
+
+        Output:
+            move: Move or NoneType
+        """
+        if self.key is None or self.key[0] != game.generation:
+            return None
+        if min_seconds is None and min_nodes is None:
+            return None
+        result = self.results.get(game.board.hash)
+        if result is None:
+            return None
+        if min_seconds is not None and result[2] >= min_seconds:
+            return result[0]
+        if min_nodes is not None and result[3] >= min_nodes:
+            return result[0]
+        return None
+
+    @staticmethod
+    def ponder(board, color, stop_event, results):
+        """
+        Searches the bot's answer to every reply of the human, one depth deeper per round, until stop_event is
+        set or the answers have been searched as deep as the Searcher class goes. Run in the background thread.
+
+        Parameters:
+            board: Board type object
+                Copy of the position, where it is the human's turn.
+            color: tuple
+                Color of the human.
+            stop_event: threading.Event
+                Set to stop pondering.
+            results: dictionary
+                Dictionary to store the answers in, see self.results.
+        """
+        bot_color = get_other_color(color)
+        searchers = {}
+        seconds = {}
+        nodes = {}
+        reply_searcher = Searcher(time_limit=None)
+        replies = reply_searcher.order_moves(board.get_all_moves(color))
+        for depth in range(1, reply_searcher.max_depth + 1):
+            for reply in replies:
+                if stop_event.is_set():
+                    return
+                board.make_move(reply)
+                key = board.hash
+                if key not in searchers:
+                    searchers[key] = Searcher(time_limit=None, stop_event=stop_event)
+                    seconds[key] = 0
+                    nodes[key] = 0
+                searcher = searchers[key]
+                searcher.max_depth = depth
+                start_time = time.perf_counter()
+                move = searcher.search(board, bot_color)
+                seconds[key] += time.perf_counter() - start_time
+                nodes[key] += searcher.nodes
+                board.unmake_move()
+                if move is not None:
+                    results[key] = (move, searcher.depth, seconds[key], nodes[key])
@@ -1,5 +1,5 @@
-import pygame
 from .constants import Constants
+from .textcache import TextCache
 
 class RadioButtons:
     """
@@ -45,20 +45,26 @@ class RadioButtons:
         """
         Draws caption and options for a RadioButton object. If an option is selected, 
         its background is highlighted in yellow.
+
+        Output:
+            rect: Pygame Rect object
+                Area drawn on, the caption and every option.
         """
-        radio_font = pygame.font.SysFont(None, 22)
-        caption_text = radio_font.render(self.caption, 1, Constants.GRAY, Constants.BLACK)
+        caption_text = TextCache.render(self.caption, None, 22, Constants.GRAY, Constants.BLACK)
         caption_rect = caption_text.get_rect(topleft=self.top_left)
         self.window.blit(caption_text, caption_rect)
+        rect = caption_rect.copy()
         for i, opt in enumerate(self.options):
             if self.selected == self.options[opt]:
                 txt_color, bkgrnd_color = Constants.DARK_GRAY, Constants.YELLOW
             else:
                 txt_color, bkgrnd_color = Constants.GRAY, Constants.BLACK
-            option_text = radio_font.render(opt, 1, txt_color, bkgrnd_color)
+            option_text = TextCache.render(opt, None, 22, txt_color, bkgrnd_color)
             option_rect = option_text.get_rect(topleft=(caption_rect.right+5, caption_rect.top+caption_rect.height*i))
             self.button_meas[opt] = [option_rect.topleft[0], option_rect.topleft[1], option_rect.bottomright[0], option_rect.bottomright[1]]
             self.window.blit(option_text, option_rect)
+            rect.union_ip(option_rect)
+        return rect
 
     def get_clicked_button(self, x, y):
         """
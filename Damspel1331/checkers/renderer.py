@@ -0,0 +1,257 @@
+import collections
+import os
+import pygame
+
+from .constants import Constants
+from .textcache import TextCache
+
+CROWN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'assets', 'crown.png')
+
+
+class Renderer:
+    """
+    Initialized in the main function of the main file.
+
+    The Renderer class draws a Game instance on the Pygame window. All drawing of the board, the pieces, the
+    valid moves and the winner text is done here, which means that the board, piece and game modules can be
+    imported and used without Pygame.
+
+    Only what changed since the previous frame is drawn: the squares whose piece changed, was captured or
+    promoted and the squares where a valid move marker appeared or disappeared. The whole board is only drawn
+    after the game has been restarted, when the board size or the colors may have changed. The rectangles
+    drawn on are returned by self.draw() so that only they are pushed to the display.
+
+    The empty board is drawn once per board size, square colors and square size to an off-screen surface, see
+    self.get_background(), which is then blitted in a single call instead of drawing every square. Likewise
+    every kind of piece is drawn once per square size, see self.get_sprite().
+    """
+    BACKGROUND_CACHE_SIZE = 4
+    SPRITE_SCALE = 4  # Sprites are drawn this many times larger and scaled down, which anti-aliases their edges.
+    _backgrounds = collections.OrderedDict()
+    _sprites = {}
+    _crown = None
+
+    def __init__(self, window, game):
+        """
+        Parameters:
+            window: Pygame Surface object
+                Pygame window to draw valid moves, board and pieces on.
+            game: Game object
+                Game instance to draw.
+
+        Instance variables initialized:
+            self.window: see window parameter
+            self.game: see game parameter
+            self.drawn_key: tuple or NoneType
+                Generation of the game, board size and player color of the board on the window, None before the
+                first frame. The whole board is drawn when it changes.
+            self.drawn_pieces: dictionary
+                Key is the square of a piece on the window and value is a tuple (color, king) of the piece.
+            self.drawn_moves: set
+                Squares of the valid move markers on the window.
+            self.drawn_winner: str or NoneType
+                Winner text on the window, None if there is none.
+            self.background: Pygame Surface object or NoneType
+                Empty board of the board on the window, None before the first frame.
+        """
+        self.window = window
+        self.game = game
+        self.drawn_key = None
+        self.drawn_pieces = {}
+        self.drawn_moves = set()
+        self.drawn_winner = None
+        self.background = None
+
+    def update(self):
+        """
+        Draws what changed of the current state of the game on the Pygame window and pushes it to the display.
+        Used by the BotMover class between the skips of a move, the main function calls self.draw() instead.
+        """
+        dirty_rects = self.draw()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+
+    def draw(self):
+        """
+        Draws the squares of the board that changed since the previous call, or the whole board if the game has
+        been restarted since, and the winner text once the game has a winner.
+
+        Output:
+            dirty_rects: list
+                Pygame Rect objects of the areas drawn on, empty if nothing changed.
+        """
+        pieces = {}
+        board = self.game.board
+        for color in board.piece_squares:
+            for piece in board.get_pieces(color):
+                pieces[(piece.row, piece.col)] = (piece.color, piece.king)
+        moves = set(self.game.valid_moves)
+        winner = self.game.board.winner()
+        key = (self.game.generation, Constants.BOARD_SIZE, Constants.PLAYER_COLOR)
+
+        dirty_rects = []
+        if key != self.drawn_key:
+            self.background = self.get_background()
+            self.draw_board()
+            self.draw_valid_moves(moves)
+            dirty_rects.append(pygame.Rect(0, 0, Constants.COLS * Constants.SQUARE_SIZE, Constants.ROWS * Constants.SQUARE_SIZE))
+        else:
+            changed = {square for square in pieces.keys() | self.drawn_pieces.keys() if pieces.get(square) != self.drawn_pieces.get(square)}
+            changed |= moves ^ self.drawn_moves
+            for (row, col) in changed:
+                dirty_rects.append(self.draw_square(row, col, pieces.get((row, col)), (row, col) in moves))
+        if winner and (winner != self.drawn_winner or dirty_rects):
+            dirty_rects.append(self.print_winner())
+
+        self.drawn_key, self.drawn_pieces, self.drawn_moves, self.drawn_winner = key, pieces, moves, winner
+        return dirty_rects
+
+    def pause(self, milliseconds):
+        """
+        Pauses the program for the given amount of milliseconds. Used by the BotMover class between the skips of
+        a move such that they can be followed on the window.
+        """
+        pygame.time.delay(milliseconds)
+
+    @classmethod
+    def get_background(cls):
+        """
+        Returns a surface with the empty board of the current board size. The surfaces of the latest
+        cls.BACKGROUND_CACHE_SIZE combinations of board size, square colors and square size are kept, so the
+        squares are only drawn the first time a combination is used.
+
+        Output:
+            background: Pygame Surface object
+        """
+        key = (Constants.BOARD_SIZE, Constants.RED, Constants.BLACK, Constants.SQUARE_SIZE)
+        if key in cls._backgrounds:
+            cls._backgrounds.move_to_end(key)
+            return cls._backgrounds[key]
+        background = pygame.Surface((Constants.COLS * Constants.SQUARE_SIZE, Constants.ROWS * Constants.SQUARE_SIZE))
+        background.fill(Constants.BLACK)
+        for row in range(Constants.ROWS):
+            for col in range(row % 2, Constants.COLS, 2):
+                pygame.draw.rect(background, Constants.RED, (col * Constants.SQUARE_SIZE, row * Constants.SQUARE_SIZE, Constants.SQUARE_SIZE, Constants.SQUARE_SIZE))
+        cls._backgrounds[key] = background
+        if len(cls._backgrounds) > cls.BACKGROUND_CACHE_SIZE:
+            cls._backgrounds.popitem(last=False)
+        return background
+
+    @classmethod
+    def get_crown(cls):
+        """
+        Returns the image printed on top of pieces when they are promoted to king, at its original size. Loaded
+        the first time from a path relative to this file, which means that the game does not have to be started
+        from a certain directory.
+        """
+        if cls._crown is None:
+            cls._crown = pygame.image.load(CROWN_PATH).convert_alpha()
+        return cls._crown
+
+    @classmethod
+    def get_sprite(cls, color, king):
+        """
+        Returns a transparent surface of the size of a square with a piece of the given color in its middle,
+        with a crown on top if it is a king. The radius of the circle and the size of the crown are calculated
+        from the square size, so that the piece is proportioned the same on every board size. The sprite of a
+        square size, color and king status is only drawn the first time it is asked for.
+
+        Output:
+            sprite: Pygame Surface object
+        """
+        key = (Constants.SQUARE_SIZE, color, king)
+        if key not in cls._sprites:
+            size, scale = Constants.SQUARE_SIZE, cls.SPRITE_SCALE
+            radius = int(size//2 * 0.7)
+            large = pygame.Surface((size * scale, size * scale), pygame.SRCALPHA)
+            pygame.draw.circle(large, color, (size * scale // 2, size * scale // 2), radius * scale)
+            sprite = pygame.transform.smoothscale(large, (size, size))
+            if king:
+                crown = cls.get_crown()
+                width = round(1.5 * radius)  # 45 pixels on the 8x8 board, as the crown was drawn before.
+                height = round(width * crown.get_height() / crown.get_width())
+                crown = pygame.transform.smoothscale(crown, (width, height))
+                sprite.blit(crown, crown.get_rect(center=(size // 2, size // 2)))
+            cls._sprites[key] = sprite
+        return cls._sprites[key]
+
+    def draw_squares(self):
+        """
+        Draws the squares of the checker board on the Pygame window by blitting the empty board.
+        """
+        self.window.blit(self.background, (0, 0))
+
+    def draw_square(self, row, col, piece, has_marker):
+        """
+        Draws a single square of the board with its content over whatever was drawn there before.
+
+        Parameters:
+            row, col: int, int
+                Square to draw.
+            piece: tuple or NoneType
+                Tuple (color, king) of the piece on the square, None if it is empty.
+            has_marker: bool
+                Whether a valid move marker is drawn on the square.
+
+        Output:
+            rect: Pygame Rect object
+                Area of the square on the window.
+        """
+        rect = pygame.Rect(col * Constants.SQUARE_SIZE, row * Constants.SQUARE_SIZE, Constants.SQUARE_SIZE, Constants.SQUARE_SIZE)
+        self.window.blit(self.background, rect, rect)
+        if piece is not None:
+            self.draw_piece_at(rect.centerx, rect.centery, *piece)
+        if has_marker:
+            self.draw_valid_moves([(row, col)])
+        return rect
+
+    def draw_board(self):
+        """
+        Draws the board by calling self.draw_squares() and the pieces by iterating over the pieces of
+        both colors and calling self.draw_piece() for every piece.
+        """
+        self.draw_squares()
+        board = self.game.board
+        for color in board.piece_squares:
+            for piece in board.get_pieces(color):
+                self.draw_piece(piece)
+
+    def draw_piece(self, piece):
+        """
+        Draws a piece on the Pygame window, see self.draw_piece_at().
+
+        Parameters:
+            piece: Piece object
+                Piece to draw.
+        """
+        self.draw_piece_at(piece.x, piece.y, piece.color, piece.king)
+
+    def draw_piece_at(self, x, y, color, king):
+        """
+        Draws a piece centered on (x, y) of the Pygame window by blitting its sprite, see self.get_sprite().
+        """
+        self.window.blit(self.get_sprite(color, king), (x - Constants.SQUARE_SIZE//2, y - Constants.SQUARE_SIZE//2))
+
+    def draw_valid_moves(self, moves):
+        """
+        Retrieves row and column of a valid move stored as key in the game.valid_moves dictionary.
+        Draws a blue circle at the corresponding location on the Pygame window.
+
+        Parameters:
+            moves: dictionary
+                Dictionary of valid moves (game.valid_moves).
+        """
+        for move in moves:
+            row, col = move
+            radius = int(Constants.SQUARE_SIZE//2 * .4)
+            pygame.draw.circle(self.window, Constants.BLUE, (col * Constants.SQUARE_SIZE + Constants.SQUARE_SIZE // 2, row * Constants.SQUARE_SIZE + Constants.SQUARE_SIZE // 2), radius=radius)
+
+    def print_winner(self):
+        """
+        Prints the winner on the middle of the Pygame window and returns the Pygame Rect object of the text.
+        """
+        text = TextCache.render(self.game.board.winner(), 'freesansbold.ttf', 60, Constants.YELLOW)
+        textRect = text.get_rect()
+        textRect.center = (Constants.WIDTH//2, Constants.HEIGHT//2)
+        self.window.blit(text, textRect)
+        return textRect
@@ -0,0 +1,78 @@
+import time
+
+import pygame
+
+from .constants import Constants
+
+
+class Scheduler:
+    """
+    Initialized in the main function of the main file.
+
+    The Scheduler class lets the while-loop of the main function sleep until there is something to do, instead of
+    spinning. self.wait() blocks until an input event arrives, the bot has chosen its move, the bot's next hop is
+    due or the timer shows the next second, whichever comes first, and never returns more than Constants.FPS
+    times per second. An idle game therefore wakes up about once per second.
+    """
+    # Events the game does not react to, which would otherwise wake the while-loop.
+    IGNORED_EVENTS = [pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT]
+
+    def __init__(self, timer, bot_worker, fps=None):
+        """
+        Parameters:
+            timer: Timer object
+                Timer drawn in the menu, whose next second wakes the while-loop.
+            bot_worker: BotWorker object
+                Bot whose chosen move and hops wake the while-loop.
+            fps: int
+                OPTIONAL. Default value: None. Most frames per second, None for Constants.FPS.
+
+        Instance variables initialized:
+            self.timer, self.bot_worker: see parameters.
+            self.fps: see fps parameter.
+            self.clock: Pygame Clock object
+                Keeps the frames per second under self.fps.
+            self.wake_event: int
+                Type of the event posted by self.wake().
+        """
+        self.timer = timer
+        self.bot_worker = bot_worker
+        self.fps = fps or Constants.FPS
+        self.clock = pygame.time.Clock()
+        self.wake_event = pygame.event.custom_type()
+        pygame.event.set_blocked(self.IGNORED_EVENTS)
+
+    def wake(self, *args):
+        """
+        Wakes the while-loop from another thread by posting an event. Passed as the done callback of the future
+        returned by BotWorker.start(), which is called with the future as argument.
+        """
+        pygame.event.post(pygame.event.Event(self.wake_event))
+
+    def get_timeout(self) -> int:
+        """
+        Returns the milliseconds until the while-loop has to run even without an event: until the timer shows
+        the next second or, if the bot is making its move, until its next hop. At least 1, also when the hop is
+        overdue, as pygame.event.wait() waits without a time limit for a timeout of 0.
+        """
+        timeout = self.timer.get_time_to_next_second()
+        if self.bot_worker.chosen_move is not None:
+            hop_timeout = int(1000 * (self.bot_worker.next_hop_time - time.monotonic())) + 1
+            timeout = min(timeout, hop_timeout)
+        return max(timeout, 1)
+
+    def wait(self):
+        """
+        Waits for the next frame, see the class description, and returns the events that arrived. The timeout is
+        computed after the frame rate cap has slept, so that the sleep does not make a due hop overdue.
+
+        Output:
+            events: list
+                Pygame Event objects, empty if the timeout ran out first.
+        """
+        self.clock.tick(self.fps)
+        timeout = self.get_timeout()
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
@@ -0,0 +1,368 @@
+import time
+
+from .book import OpeningBook
+from .bot import BotMover
+from .constants import Constants, get_other_color
+from .evaluation import Evaluator
+from .move import Move
+from .stats import SearchStats
+from .tablebase import EndgameTablebase
+
+# Bounds of the transposition table entries, see Searcher.store().
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the time or node budget of the Searcher is used up. Caught by
+    Searcher.search(), which then returns the best move of the deepest search it finished.
+    """
+
+
+class Searcher:
+    """
+    Initialized by the SearchMover class, or directly to analyse a position without the game.
+
+    The Searcher class finds the best move of a position with a negamax search with alpha-beta pruning. The
+    search is iteratively deepened one turn at a time until the time or node budget is used up, and the best
+    move of the deepest finished iteration is returned. Positions are made and unmade in place on the board
+    with the make_move() and unmake_move() methods of the Board class and stored in a transposition table
+    keyed by the hash of the board.
+
+    A turn is a complete move as returned by Board.get_all_moves(), so a skip sequence is a single move. As a
+    participant who can skip has to skip, the search is extended past its depth for as long as the participant
+    to move can skip (quiescence search), which means that a position is never evaluated in the middle of an
+    exchange of pieces.
+    """
+    WIN_SCORE = 100000
+    CHECK_INTERVAL = 1024  # Amount of nodes between checks of the time budget.
+
+    def __init__(self, time_limit=1.0, node_limit=None, max_depth=64, stop_event=None):
+        """
+        Parameters:
+            time_limit: float
+                OPTIONAL. Default value: 1.0. Seconds the search may take, None for no time limit.
+            node_limit: int
+                OPTIONAL. Default value: None. Amount of positions the search may visit, None for no
+                node limit.
+            max_depth: int
+                OPTIONAL. Default value: 64. Depth in turns at which iterative deepening stops even if
+                there is budget left.
+            stop_event: threading.Event
+                OPTIONAL. Default value: None. If given, the search stops as if the budget was used up when it
+                is set.
+
+        Instance variables initialized:
+            self.time_limit, self.node_limit, self.max_depth, self.stop_event: see parameters.
+            self.transpositions: dictionary
+                Key is the hash of a position and value is a tuple (depth, score, bound, move), see
+                self.store().
+            self.nodes: int
+                Amount of positions visited by the latest search.
+            self.depth: int
+                Depth of the deepest iteration finished by the latest search.
+            self.score: int
+                Score of the best move found by the latest search, from the point of view of the
+                participant to move.
+            self.deadline: float or NoneType
+                Value of time.perf_counter() at which the running search stops.
+            self.stats: SearchStats object
+                Statistics of the latest search, see the stats module.
+            self.evaluator: Evaluator object
+                Scores the positions at the leaves of the search, see the evaluation module.
+        """
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.max_depth = max_depth
+        self.stop_event = stop_event
+        self.transpositions = {}
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self.deadline = None
+        self.stats = SearchStats()
+        self.evaluator = Evaluator.for_size(Constants.BOARD_SIZE)
+
+    def search(self, board, color) -> Move:
+        """
+        Searches the position with iterative deepening and returns the best move found for the participant of
+        the given color. The board is left in the position it had before the search. A single valid move is
+        returned without searching, with the source of self.stats set to 'forced'.
+
+        Parameters:
+            board: Board type object
+                Position to search. Its hash has to have the side to move of color.
+            color: tuple
+                Color of the participant to move.
+
+        Output:
+            best_move: Move or NoneType
+                Best move found, None if the participant has no valid move.
+        """
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self.stats = SearchStats()
+        start_time = time.perf_counter()
+        self.deadline = None if self.time_limit is None else start_time + self.time_limit
+        moves = board.get_all_moves(color)
+        if len(moves) <= 1:
+            if moves:
+                self.stats.source = 'forced'
+            self.stats.seconds = time.perf_counter() - start_time
+            return moves[0] if moves else None
+
+        best_move = self.order_moves(moves)[0]
+        undo_depth = len(board.undo_stack)
+        for depth in range(1, self.max_depth + 1):
+            try:
+                self.score, best_move = self.search_root(board, color, depth, moves, best_move)
+            except SearchTimeout:
+                while len(board.undo_stack) > undo_depth:
+                    board.unmake_move()
+                break
+            self.depth = depth
+            self.stats.iteration_nodes.append(self.nodes)
+            if abs(self.score) >= self.WIN_SCORE - self.max_depth:
+                break
+        self.stats.nodes, self.stats.depth, self.stats.score = self.nodes, self.depth, self.score
+        self.stats.seconds = time.perf_counter() - start_time
+        return best_move
+
+    def search_root(self, board, color, depth, moves, previous_best):
+        """
+        Searches every move of the root position to the given depth. The best move of the previous
+        iteration is searched first, as it is most likely to still be the best.
+
+        Output:
+            best_score, best_move: int, Move
+        """
+        alpha, beta = -self.WIN_SCORE - 1, self.WIN_SCORE + 1
+        best_score, best_move = alpha, previous_best
+        other_color = get_other_color(color)
+        for move in self.order_moves(moves, previous_best):
+            board.make_move(move)
+            score = -self.negamax(board, other_color, depth - 1, -beta, -alpha, 1)
+            board.unmake_move()
+            if score > best_score:
+                best_score, best_move = score, move
+            alpha = max(alpha, score)
+        self.store(board.hash, depth, best_score, EXACT, best_move, 0)
+        return best_score, best_move
+
+    def negamax(self, board, color, depth, alpha, beta, ply) -> int:
+        """
+        Returns the score of the position from the point of view of the participant of the given color,
+        searched to the given depth in turns with alpha-beta pruning. Scores outside the window
+        (alpha, beta) are only bounds of the exact score.
+
+        Parameters:
+            board: Board type object
+                Position to search. It is modified with make_move() and restored with unmake_move().
+            color: tuple
+                Color of the participant to move.
+            depth: int
+                Remaining depth in turns. At depth 0 the search continues with self.quiescence().
+            alpha, beta: int, int
+                Lower and upper bound of the scores that are of interest.
+            ply: int
+                Amount of turns from the root position, used to prefer faster wins and slower losses.
+
+        Output:
+            score: int
+        """
+        self.count_node()
+        if depth <= 0:
+            return self.quiescence(board, color, alpha, beta, ply)
+
+        original_alpha = alpha
+        entry = self.transpositions.get(board.hash)
+        table_move = None
+        if entry is None:
+            self.stats.table_misses += 1
+        else:
+            self.stats.table_hits += 1
+            entry_depth, entry_score, bound, table_move = entry
+            if entry_depth >= depth:
+                entry_score = self.score_from_table(entry_score, ply)
+                if bound == EXACT:
+                    return entry_score
+                if bound == LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+
+        moves = self.generate_moves(board, color)
+        if not moves:
+            return -self.WIN_SCORE + ply
+
+        self.stats.interior_nodes += 1
+        best_score, best_move = -self.WIN_SCORE - 1, None
+        other_color = get_other_color(color)
+        for idx, move in enumerate(self.order_moves(moves, table_move)):
+            board.make_move(move)
+            score = -self.negamax(board, other_color, depth - 1, -beta, -alpha, ply + 1)
+            board.unmake_move()
+            if score > best_score:
+                best_score, best_move = score, move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                self.stats.cutoffs += 1
+                self.stats.first_move_cutoffs += idx == 0
+                break
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.store(board.hash, depth, best_score, bound, best_move, ply)
+        return best_score
+
+    def quiescence(self, board, color, alpha, beta, ply) -> int:
+        """
+        Returns the evaluation of the position if the participant to move cannot skip. Otherwise every skip
+        sequence is searched, as the participant has to make one of them, until a position without skips is
+        reached. The search ends as every skip removes a piece. Parameters and output as in self.negamax().
+        """
+        moves = self.generate_moves(board, color)
+        if not moves:
+            return -self.WIN_SCORE + ply
+        if not moves[0].captured:
+            start_time = time.perf_counter()
+            score = self.evaluate(board, color)
+            self.stats.evaluation_seconds += time.perf_counter() - start_time
+            self.stats.evaluations += 1
+            return score
+
+        best_score = -self.WIN_SCORE - 1
+        other_color = get_other_color(color)
+        for move in self.order_moves(moves):
+            self.count_node()
+            board.make_move(move)
+            score = -self.quiescence(board, other_color, -beta, -alpha, ply + 1)
+            board.unmake_move()
+            best_score = max(best_score, score)
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+        return best_score
+
+    def evaluate(self, board, color) -> int:
+        """
+        Returns the static score of the position from the point of view of the participant of the given color,
+        see the Evaluator class.
+        """
+        return self.evaluator.evaluate(board, color)
+
+    def generate_moves(self, board, color) -> list[Move]:
+        """
+        Returns board.get_all_moves(color) and adds the time it took to self.stats.
+        """
+        start_time = time.perf_counter()
+        moves = board.get_all_moves(color)
+        self.stats.move_generation_seconds += time.perf_counter() - start_time
+        return moves
+
+    def order_moves(self, moves, first_move=None) -> list[Move]:
+        """
+        Returns the moves in the order they are searched in: first_move, usually the best move found for the
+        position by an earlier search, then the moves that skip the most pieces and then moves that promote a
+        man. Searching the likely best moves first makes alpha-beta pruning cut off more of the tree.
+        """
+        def priority(move):
+            if move == first_move:
+                return 1000
+            return 10 * len(move.captured) + (move.target[0] in (0, Constants.ROWS - 1))
+        return sorted(moves, key=priority, reverse=True)
+
+    def store(self, key, depth, score, bound, move, ply):
+        """
+        Stores the result of a search in the transposition table. Winning and losing scores are stored
+        relative to the stored position instead of to the root position, so that they stay correct when the
+        position is reached at another ply.
+
+        Parameters:
+            key: int
+                Hash of the position.
+            depth: int
+                Depth the position was searched to.
+            score: int
+                Score of the position.
+            bound: int
+                EXACT if score is the exact score, LOWER_BOUND or UPPER_BOUND if it is a bound of it.
+            move: Move or NoneType
+                Best move found in the position.
+            ply: int
+                Amount of turns from the root position to the stored position.
+        """
+        if score >= self.WIN_SCORE - self.max_depth:
+            score += ply
+        elif score <= -self.WIN_SCORE + self.max_depth:
+            score -= ply
+        self.transpositions[key] = (depth, score, bound, move)
+
+    def score_from_table(self, score, ply):
+        """
+        Converts a score stored by self.store() back to a score relative to the root position.
+        """
+        if score >= self.WIN_SCORE - self.max_depth:
+            return score - ply
+        if score <= -self.WIN_SCORE + self.max_depth:
+            return score + ply
+        return score
+
+    def count_node(self):
+        """
+        Counts a visited position and raises SearchTimeout if the node budget is used up or, checked every
+        self.CHECK_INTERVAL nodes, the time budget is used up or self.stop_event is set.
+        """
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            raise SearchTimeout
+        if self.nodes % self.CHECK_INTERVAL == 0:
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SearchTimeout
+            if self.stop_event is not None and self.stop_event.is_set():
+                raise SearchTimeout
+
+
+class SearchMover(BotMover):
+    """
+    Initialized instead of BotMover when the search bot is selected in the in-game menu, see the movers module.
+
+    SearchMover looks ahead with the Searcher class within the budget set by Constants.SEARCH_TIME and
+    Constants.SEARCH_NODES and executes the best move it finds. The statistics of the search are kept in
+    self.stats and appended to the log file Constants.STATS_LOG if it is set.
+    """
+    PONDERS = True  # Whether the bot thinks during the human's turn if Constants.PONDER is True.
+
+    def choose_move(self) -> Move:
+        """
+        Returns the move of the current position in the opening book or the endgame tablebase if there is one,
+        see the book and tablebase modules. Otherwise searches the current position and returns the best move
+        found, None if the bot cannot move.
+        """
+        chosen_move = None
+        if Constants.OPENING_BOOK:
+            chosen_move = OpeningBook.for_size(Constants.BOARD_SIZE).probe(self.game.board, self.game.turn)
+            self.stats = SearchStats('book')
+        if chosen_move is None and Constants.ENDGAME_TABLEBASE:
+            chosen_move = EndgameTablebase.for_size(Constants.BOARD_SIZE).best_move(self.game.board, self.game.turn)
+            self.stats = SearchStats('tablebase')
+        if chosen_move is None:
+            searcher = self.create_searcher()
+            chosen_move = searcher.search(self.game.board, self.game.turn)
+            self.stats = searcher.stats
+        if Constants.STATS_LOG:
+            self.stats.log(Constants.STATS_LOG, board_size=Constants.BOARD_SIZE[0], engine=type(self).__name__)
+        return chosen_move
+
+    def create_searcher(self) -> Searcher:
+        """
+        Returns the searcher used to choose the move.
+        """
+        return Searcher(time_limit=Constants.SEARCH_TIME, node_limit=Constants.SEARCH_NODES, stop_event=self.stop_event)
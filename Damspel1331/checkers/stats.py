@@ -0,0 +1,151 @@
+import json
+import time
+
+
+class SearchStats:
+    """
+    Initialized by the Searcher class at the start of every search, and by the bots for moves that were not
+    searched.
+
+    The SearchStats class collects the statistics of the search of a single move, to find out where the time
+    of the bot goes and to tune its budget. It is exposed by the bots as their stats attribute, can be appended
+    to a JSON lines log with self.log() and is drawn in the menu if Constants.SHOW_STATS is True.
+    """
+    COUNTERS = ['nodes', 'interior_nodes', 'cutoffs', 'first_move_cutoffs', 'table_hits', 'table_misses', 'evaluations', 'move_generation_seconds', 'evaluation_seconds', 'playouts', 'reused_visits']
+
+    def __init__(self, source='search'):
+        """
+        Parameters:
+            source: str
+                OPTIONAL. Default value: 'search'. Where the move came from: 'search', 'mcts', 'book',
+                'tablebase', 'ponder' or 'forced', for the only valid move, which is played without searching.
+
+        Instance variables initialized:
+            self.source: see source parameter.
+            self.nodes: int
+                Positions visited.
+            self.seconds: float
+                Time the move took.
+            self.depth: int
+                Depth in turns of the deepest finished iteration.
+            self.score: int
+                Score of the chosen move. For 'mcts' the percentage of the playouts through the move it won.
+            self.iteration_nodes: list
+                Element i is the amount of positions visited when iteration i + 1 was finished.
+            self.interior_nodes: int
+                Positions where moves were searched, as opposed to positions answered by the transposition
+                table or evaluated.
+            self.cutoffs: int
+                Interior positions where a move was good enough to leave the other moves unsearched.
+            self.first_move_cutoffs: int
+                Cutoffs made by the first move searched, a measure of the move ordering.
+            self.table_hits, self.table_misses: int, int
+                Lookups in the transposition table that found respectively did not find the position.
+            self.evaluations: int
+                Calls of the evaluation.
+            self.move_generation_seconds, self.evaluation_seconds: float, float
+                Time spent generating moves and evaluating positions.
+            self.playouts: int
+                Random games played out by the MCTSSearcher class.
+            self.reused_visits: int
+                Playouts of the tree kept from the previous move of the MCTSSearcher class.
+        """
+        self.source = source
+        self.seconds = 0
+        self.depth = 0
+        self.score = 0
+        self.iteration_nodes = []
+        for counter in self.COUNTERS:
+            setattr(self, counter, 0)
+
+    @property
+    def nodes_per_second(self):
+        """
+        Positions visited per second.
+        """
+        return self.nodes / self.seconds if self.seconds else 0
+
+    @property
+    def branching_factor(self):
+        """
+        Effective branching factor: how many times more positions the last finished iteration visited than the
+        one before it. 0 if fewer than two iterations were finished.
+        """
+        if len(self.iteration_nodes) < 2:
+            return 0
+        last = self.iteration_nodes[-1] - self.iteration_nodes[-2]
+        previous = self.iteration_nodes[-2] - (self.iteration_nodes[-3] if len(self.iteration_nodes) > 2 else 0)
+        return last / previous if previous else 0
+
+    @property
+    def cutoff_rate(self):
+        """
+        Share of the interior positions that were cut off.
+        """
+        return self.cutoffs / self.interior_nodes if self.interior_nodes else 0
+
+    @property
+    def first_move_cutoff_rate(self):
+        """
+        Share of the cutoffs made by the first move searched.
+        """
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0
+
+    @property
+    def table_hit_rate(self):
+        """
+        Share of the lookups in the transposition table that found the position.
+        """
+        lookups = self.table_hits + self.table_misses
+        return self.table_hits / lookups if lookups else 0
+
+    def merge(self, other):
+        """
+        Adds the counters of other, the statistics of a part of the same search made elsewhere, e.g. by a worker
+        process of the ParallelSearcher class.
+        """
+        for counter in self.COUNTERS:
+            setattr(self, counter, getattr(self, counter) + getattr(other, counter))
+
+    def to_dict(self):
+        """
+        Returns the statistics, the derived rates included, as a dictionary.
+        """
+        stats = {'source': self.source, 'seconds': round(self.seconds, 4), 'depth': self.depth, 'score': self.score}
+        stats.update({counter: getattr(self, counter) for counter in self.COUNTERS})
+        stats['move_generation_seconds'] = round(self.move_generation_seconds, 4)
+        stats['evaluation_seconds'] = round(self.evaluation_seconds, 4)
+        stats.update({
+            'nodes_per_second': round(self.nodes_per_second),
+            'branching_factor': round(self.branching_factor, 2),
+            'cutoff_rate': round(self.cutoff_rate, 3),
+            'first_move_cutoff_rate': round(self.first_move_cutoff_rate, 3),
+            'table_hit_rate': round(self.table_hit_rate, 3),
+        })
+        return stats
+
+    def log(self, path, **fields):
+        """
+        Appends the statistics as a line of JSON to the file at path.
+
+        Parameters:
+            path: str
+                Path of the log file.
+            fields: keyword arguments
+                OPTIONAL. Further fields to write on the line, e.g. the board size.
+        """
+        line = {'time': round(time.time(), 3)}
+        line.update(fields)
+        line.update(self.to_dict())
+        with open(path, 'a') as log_file:
+            log_file.write(json.dumps(line) + '\n')
+
+    def __str__(self):
+        """
+        Returns a short summary to draw in the menu.
+        """
+        if self.source == 'mcts':
+            return f'{self.playouts} playouts  {self.playouts / max(self.seconds, 1e-9) / 1000:.1f}k p/s  reused {self.reused_visits}  won {self.score}%'
+        if self.source != 'search':
+            return f'{self.source} move'
+        return f'depth {self.depth}  {self.nodes_per_second / 1000:.0f}k n/s  bf {self.branching_factor:.1f}  tt {self.table_hit_rate:.0%}'
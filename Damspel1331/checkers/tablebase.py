@@ -0,0 +1,347 @@
+"""
+Endgame tablebase. Every position with at most a given amount of pieces on a board size is solved offline with
+retrograde analysis, and the result (win, loss or draw for the participant to move, and the amount of turns to
+the end of the game with best play) is written to a tablebase file per board size. The SearchMover class plays
+these endings from the tablebase instead of searching them.
+
+A tablebase file is a header followed by one 16-bit value per position. Positions are numbered by the
+EndgameTablebase.get_index() method, so a probe reads a single value from the memory mapped file.
+
+Run from the Damspel1331 directory to generate a tablebase, e.g.
+
+    python -m checkers.tablebase --size 8 --pieces 3
+"""
+import argparse
+import itertools
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+
+from .constants import Constants, get_other_color
+from .game import Game
+
+TABLEBASE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tablebases')
+MAGIC = b'CKTB'
+VERSION = 1
+HEADER = struct.Struct('<4sHBBBI')  # magic, version, rows, cols, pieces, amount of positions
+VALUE = struct.Struct('<H')
+
+WIN, LOSS, DRAW = 'WIN', 'LOSS', 'DRAW'
+# Stored values: 0 for positions that cannot occur, 1 for a draw, 2 * turns + 2 for a win and 2 * turns + 3 for a
+# loss in the given amount of turns.
+INVALID_VALUE, DRAW_VALUE = 0, 1
+LAYOUT_CHARACTERS = 'pPoO'  # Piece types 0 to 3 as characters of a layout, see the Board class.
+
+
+def get_tablebase_path(board_size):
+    """
+    Returns the path of the tablebase file of the given board size.
+    """
+    rows, cols = board_size
+    return os.path.join(TABLEBASE_DIRECTORY, f'{rows}x{cols}.tb')
+
+
+def encode_value(result, turns):
+    """
+    Returns the stored value of a result and its amount of turns.
+    """
+    if result == DRAW:
+        return DRAW_VALUE
+    return 2 * turns + (2 if result == WIN else 3)
+
+
+def decode_value(value):
+    """
+    Returns the result and the amount of turns of a stored value, or None for INVALID_VALUE.
+    """
+    if value == INVALID_VALUE:
+        return None
+    if value == DRAW_VALUE:
+        return DRAW, None
+    return (WIN if value % 2 == 0 else LOSS), (value - 2) // 2
+
+
+class EndgameTablebase:
+    """
+    Initialized through EndgameTablebase.for_size(), or by generate_tablebase().
+
+    The EndgameTablebase class numbers the positions with at most self.pieces pieces and looks them up in the
+    tablebase file of a board size. A position is numbered by the set of dark squares that hold pieces, the type
+    of the piece on every one of them (man or king of either color) and the participant to move. If there is no
+    tablebase file for the board size, every probe returns None.
+    """
+    _tablebases = {}
+
+    def __init__(self, board_size, pieces, data=None):
+        """
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+            pieces: int
+                Largest amount of pieces of the positions in the tablebase.
+            data: mmap object
+                OPTIONAL. Default value: None. Memory map of the tablebase file.
+
+        Instance variables initialized:
+            self.board_size, self.pieces, self.data: see parameters.
+            self.dark_squares: list
+                Squares (row, col) pieces can stand on, in the order they are numbered in.
+            self.square_numbers: dictionary
+                Key is a square (row, col) and value is its index in self.dark_squares.
+            self.offsets: list
+                Element n is the number of the first position with n pieces.
+            self.size: int
+                Amount of numbered positions.
+        """
+        self.board_size = tuple(board_size)
+        self.pieces = pieces
+        self.data = data
+        rows, cols = board_size
+        self.dark_squares = [(row, col) for row in range(rows) for col in range(cols) if col % 2 == (row + 1) % 2]
+        self.square_numbers = {square: idx for idx, square in enumerate(self.dark_squares)}
+        self.offsets = [0, 0]
+        for amount in range(1, pieces + 1):
+            self.offsets.append(self.offsets[-1] + math.comb(len(self.dark_squares), amount) * 4 ** amount * 2)
+        self.size = self.offsets[pieces + 1]
+
+    @classmethod
+    def for_size(cls, board_size):
+        """
+        Returns the tablebase of the given board size. The tablebase file is only opened the first time it is
+        used. Without a tablebase file, the returned tablebase has no positions.
+
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Output:
+            tablebase: EndgameTablebase object
+        """
+        if board_size not in cls._tablebases:
+            path = get_tablebase_path(board_size)
+            if os.path.exists(path):
+                with open(path, 'rb') as tablebase_file:
+                    data = mmap.mmap(tablebase_file.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, version, rows, cols, pieces, size = HEADER.unpack_from(data, 0)
+                if magic != MAGIC or version != VERSION or (rows, cols) != tuple(board_size):
+                    raise ValueError(f'{path} is not a version {VERSION} tablebase of size {board_size}')
+                cls._tablebases[board_size] = cls(board_size, pieces, data)
+            else:
+                cls._tablebases[board_size] = cls(board_size, 0)
+        return cls._tablebases[board_size]
+
+    def get_index(self, pieces, player_to_move):
+        """
+        Returns the number of a position.
+
+        Parameters:
+            pieces: list
+                Tuples (square number, piece type) of every piece, where the square number is an index of
+                self.dark_squares and the piece type is the code of the piece minus 1, see the get_code() method
+                of the Piece class. At least 1 and at most self.pieces tuples.
+            player_to_move: bool
+                True if it is the player's turn and False if it is the opponent's.
+
+        Output:
+            index: int
+        """
+        pieces = sorted(pieces)
+        square_rank, type_rank = 0, 0
+        for idx, (square, piece_type) in enumerate(pieces):
+            square_rank += math.comb(square, idx + 1)
+            type_rank += piece_type * 4 ** idx
+        return self.offsets[len(pieces)] + (square_rank * 4 ** len(pieces) + type_rank) * 2 + (0 if player_to_move else 1)
+
+    def get_board_index(self, board, color):
+        """
+        Returns the number of the position on the board with the participant of the given color to move, or None
+        if it has more pieces than the tablebase.
+        """
+        if len(board.piece_squares[Constants.PLAYER_COLOR]) + len(board.piece_squares[Constants.OPPONENT_COLOR]) > self.pieces:
+            return None
+        pieces = [(self.square_numbers[square], board.get_piece(*square).get_code() - 1) for squares in board.piece_squares.values() for square in squares]
+        return self.get_index(pieces, color == Constants.PLAYER_COLOR)
+
+    def probe(self, board, color):
+        """
+        Looks the position up in the tablebase.
+
+        Parameters:
+            board: Board type object
+                Position to look up.
+            color: tuple
+                Color of the participant to move.
+
+        Output:
+            result, turns: str, int or NoneType
+                WIN, LOSS or DRAW for the participant to move, and the amount of turns to the end of the game
+                with best play, None for a draw. None is returned instead if the position is not in the
+                tablebase.
+        """
+        if self.data is None:
+            return None
+        index = self.get_board_index(board, color)
+        if index is None:
+            return None
+        return decode_value(VALUE.unpack_from(self.data, HEADER.size + VALUE.size * index)[0])
+
+    def best_move(self, board, color):
+        """
+        Returns the move that keeps the best result of the position: the fastest win, a draw, or the slowest
+        loss. None if the position is not in the tablebase or the participant cannot move.
+        """
+        if self.probe(board, color) is None:
+            return None
+        other_color = get_other_color(color)
+        best_key, best_move = None, None
+        for move in board.get_all_moves(color):
+            board.make_move(move)
+            if not board.piece_squares[other_color]:
+                key = (2, 0)
+            else:
+                result, turns = self.probe(board, other_color)
+                if result == LOSS:
+                    key = (2, -turns)
+                elif result == DRAW:
+                    key = (1, 0)
+                else:
+                    key = (0, turns)
+            board.unmake_move()
+            if best_key is None or key > best_key:
+                best_key, best_move = key, move
+        return best_move
+
+
+def enumerate_positions(tablebase):
+    """
+    Yields every position that can occur in the tablebase as a tuple (layout, pieces), where pieces is in the
+    format of EndgameTablebase.get_index(). Both participants have at least one piece, and no man stands on the
+    row where it would have been promoted.
+    """
+    rows, cols = tablebase.board_size
+    for amount in range(2, tablebase.pieces + 1):
+        for squares in itertools.combinations(range(len(tablebase.dark_squares)), amount):
+            for piece_types in itertools.product(range(4), repeat=amount):
+                if all(piece_type < 2 for piece_type in piece_types) or all(piece_type >= 2 for piece_type in piece_types):
+                    continue
+                layout = [['.'] * cols for _ in range(rows)]
+                for square, piece_type in zip(squares, piece_types):
+                    row, col = tablebase.dark_squares[square]
+                    if (piece_type == 0 and row == 0) or (piece_type == 2 and row == rows - 1):
+                        break
+                    layout[row][col] = LAYOUT_CHARACTERS[piece_type]
+                else:
+                    yield [''.join(row) for row in layout], list(zip(squares, piece_types))
+
+
+def generate_tablebase(board_size, pieces, path=None, verbose=False):
+    """
+    Solves every position with at most the given amount of pieces with retrograde analysis and writes the
+    results to a tablebase file. A participant who cannot move, or has no pieces left, has lost. The positions
+    where the participant to move has lost, or wins by taking the last piece of the other participant, are
+    resolved first. From them the results are propagated backwards one turn at a time: a position is won as
+    soon as one of its moves leads to a lost position, and lost once every one of its moves leads to a won
+    position. The positions left unresolved are draws.
+
+    Parameters:
+        board_size: tuple
+            Board size in format (ROWS, COLUMNS).
+        pieces: int
+            Largest amount of pieces of the positions to solve.
+        path: str
+            OPTIONAL. Default value: None. Path to write to, None for the path returned by get_tablebase_path().
+        verbose: bool
+            OPTIONAL. Default value: False. Print progress.
+
+    Output:
+        counts: dictionary
+            Amount of positions per result.
+    """
+    Constants.set_board_size(board_size)
+    tablebase = EndgameTablebase(board_size, pieces)
+    start_time = time.perf_counter()
+    values = array('H', [INVALID_VALUE]) * tablebase.size
+    remaining = array('H', [0]) * tablebase.size
+    predecessors = {}
+    resolved = {0: [], 1: []}  # Key is an amount of turns and value is the positions resolved with it.
+    rows, cols = board_size
+    board = Game.create_board(['.' * cols] * rows)
+    for layout, position_pieces in enumerate_positions(tablebase):
+        board.create_board(layout)
+        for color in [Constants.PLAYER_COLOR, Constants.OPPONENT_COLOR]:
+            index = tablebase.get_index(position_pieces, color == Constants.PLAYER_COLOR)
+            other_color = get_other_color(color)
+            moves = board.get_all_moves(color)
+            values[index] = DRAW_VALUE
+            for move in moves:
+                board.make_move(move)
+                if not board.piece_squares[other_color]:
+                    values[index] = encode_value(WIN, 1)
+                else:
+                    child = tablebase.get_board_index(board, other_color)
+                    predecessors.setdefault(child, []).append(index)
+                    remaining[index] += 1
+                board.unmake_move()
+            if not moves:
+                values[index] = encode_value(LOSS, 0)
+                resolved[0].append(index)
+            elif values[index] != DRAW_VALUE:
+                resolved[1].append(index)
+    if verbose:
+        print(f'moves generated in {time.perf_counter() - start_time:.0f} s')
+
+    turns = 0
+    # The captures of the last piece are resolved with 1 turn, so there may be positions left after 0 turns.
+    while resolved.get(turns) or resolved.get(turns + 1):
+        resolved.setdefault(turns + 1, [])
+        for index in resolved[turns]:
+            is_loss = decode_value(values[index])[0] == LOSS
+            for predecessor in predecessors.get(index, ()):
+                if values[predecessor] != DRAW_VALUE:
+                    continue
+                if is_loss:
+                    values[predecessor] = encode_value(WIN, turns + 1)
+                    resolved[turns + 1].append(predecessor)
+                else:
+                    remaining[predecessor] -= 1
+                    if remaining[predecessor] == 0:
+                        values[predecessor] = encode_value(LOSS, turns + 1)
+                        resolved[turns + 1].append(predecessor)
+        turns += 1
+    if verbose:
+        print(f'solved in {time.perf_counter() - start_time:.0f} s, longest ending {turns - 1} turns')
+
+    if sys.byteorder == 'big':
+        values.byteswap()
+    path = get_tablebase_path(board_size) if path is None else path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as tablebase_file:
+        tablebase_file.write(HEADER.pack(MAGIC, VERSION, board_size[0], board_size[1], pieces, tablebase.size))
+        values.tofile(tablebase_file)
+    EndgameTablebase._tablebases.pop(tuple(board_size), None)
+
+    counts = {WIN: 0, LOSS: 0, DRAW: 0}
+    for value in values:
+        if value != INVALID_VALUE:
+            counts[decode_value(value)[0]] += 1
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate the endgame tablebase of a board size.')
+    parser.add_argument('--size', type=int, default=8, choices=[8, 10, 12], help='board size')
+    parser.add_argument('--pieces', type=int, default=3, help='largest amount of pieces of the positions to solve')
+    args = parser.parse_args(argv)
+
+    board_size = (args.size, args.size)
+    counts = generate_tablebase(board_size, args.pieces, verbose=True)
+    print(f'{get_tablebase_path(board_size)}: ' + ', '.join(f'{count} {result.lower()}s' for result, count in counts.items()))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,66 @@
+import collections
+
+import pygame
+
+
+class TextCache:
+    """
+    Used through its class methods by the Menu, RadioButtons and Renderer classes.
+
+    The TextCache class loads every font once per face and size, as looking system fonts up is slow, and keeps the
+    surfaces of the latest rendered texts, so that a text that is drawn again is not rendered again. The texts
+    are evicted least recently used first once there are more than MAX_TEXTS of them.
+    """
+    MAX_TEXTS = 128
+    _fonts = {}
+    _texts = collections.OrderedDict()
+
+    @classmethod
+    def get_font(cls, face, size):
+        """
+        Returns the font of the given face and size, loaded the first time it is asked for.
+
+        Parameters:
+            face: str or NoneType
+                File name of a font file ending in '.ttf', e.g. 'freesansbold.ttf', name of a system font, or None
+                for the default font of Pygame.
+            size: int
+                Size of the font.
+
+        Output:
+            font: Pygame Font object
+        """
+        key = (face, size)
+        if key not in cls._fonts:
+            if face is not None and face.endswith('.ttf'):
+                cls._fonts[key] = pygame.font.Font(face, size)
+            else:
+                cls._fonts[key] = pygame.font.SysFont(face, size)
+        return cls._fonts[key]
+
+    @classmethod
+    def render(cls, text, face, size, color, background=None):
+        """
+        Returns the anti-aliased surface of the text, rendered the first time it is asked for.
+
+        Parameters:
+            text: str
+                Text to render.
+            face, size: see self.get_font().
+            color: tuple
+                Color of the text.
+            background: tuple
+                OPTIONAL. Default value: None. Color behind the text, None for a transparent background.
+
+        Output:
+            surface: Pygame Surface object
+        """
+        key = (text, face, size, color, background)
+        if key in cls._texts:
+            cls._texts.move_to_end(key)
+            return cls._texts[key]
+        surface = cls.get_font(face, size).render(text, True, color, background)
+        cls._texts[key] = surface
+        if len(cls._texts) > cls.MAX_TEXTS:
+            cls._texts.popitem(last=False)
+        return surface
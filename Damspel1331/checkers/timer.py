@@ -26,6 +26,12 @@ class Timer:
         self.t1 = pygame.time.get_ticks()
         self.dt = self.t1 - self.t0
 
+    def get_time_to_next_second(self):
+        """
+        Returns the milliseconds until the time shown on the Pygame window changes to the next second.
+        """
+        return 1000 - (pygame.time.get_ticks() - self.t0) % 1000
+
     def set_winner_time(self):
         """
         Sets winner time.
@@ -0,0 +1,201 @@
+"""
+Bot tournament. Two bots of the movers module play a match of games against each other on a ProcessPoolExecutor,
+without Pygame and without any delay between the hops of a move. The bots swap colors every game and a game that
+is not decided within a maximum amount of turns is a draw. The result is reported as wins, draws and losses of the
+first bot, the Elo difference between the bots with its 95% confidence interval, and the speed of the match.
+
+A participant wins when the other one has no pieces left, as in the game, or cannot move, as in the search.
+
+Run from the Damspel1331 directory, e.g.
+
+    python -m checkers.tournament search greedy --size 10 --games 40 --seconds 0.5
+"""
+import argparse
+import concurrent.futures
+import math
+import os
+import random
+import time
+
+from .constants import Constants
+from .game import Game
+from .movers import MOVERS
+
+
+def _apply_settings(settings):
+    """
+    Sets the attributes of Constants given in the dictionary settings in a worker process.
+    """
+    for name, value in settings.items():
+        if name == 'BOARD_SIZE':
+            Constants.set_board_size(value)
+        else:
+            setattr(Constants, name, value)
+
+
+def play_game(engines, max_turns, seed):
+    """
+    Plays a single game between two bots.
+
+    Parameters:
+        engines: tuple
+            Keys of MOVERS of the bot playing the player's pieces, which starts, and of the bot playing the
+            opponent's pieces.
+        max_turns: int
+            Amount of turns after which the game is a draw.
+        seed: int
+            Seed of the random choices of the bots.
+
+    Output:
+        result: dictionary
+            'winner' is the index in engines of the winning bot, None for a draw, 'turns' is the amount of turns
+            played, and 'seconds' and 'moves' are lists of the seconds each bot spent choosing its moves and the
+            amount of moves it made.
+    """
+    random.seed(seed)
+    game = Game()
+    seconds, moves = [0.0, 0.0], [0, 0]
+    winner = None
+    for turn in range(max_turns):
+        idx = 0 if game.turn == Constants.PLAYER_COLOR else 1
+        start_time = time.perf_counter()
+        mover = MOVERS[engines[idx]](game)
+        seconds[idx] += time.perf_counter() - start_time
+        if mover.chosen_move is None:
+            winner = 1 - idx
+            break
+        moves[idx] += 1
+        game.change_turn()
+        if game.board.winner() is not None:
+            winner = idx
+            break
+    return {'winner': winner, 'turns': turn + 1, 'seconds': seconds, 'moves': moves}
+
+
+def elo_difference(wins, draws, losses):
+    """
+    Returns the Elo difference of a bot over its opponent estimated from its results, and the half width of the
+    95% confidence interval of the estimate. Both are infinite if the bot won or lost every game.
+
+    Output:
+        elo, margin: float, float
+    """
+    games = wins + draws + losses
+    score = (wins + 0.5 * draws) / games
+    if score <= 0 or score >= 1:
+        return math.copysign(math.inf, score - 0.5), math.inf
+    elo = -400 * math.log10(1 / score - 1)
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+    # Standard error of the score, converted to Elo with the derivative of the logistic curve at the score.
+    margin = 1.96 * math.sqrt(variance / games) * 400 / (math.log(10) * score * (1 - score))
+    return elo, margin
+
+
+def run_tournament(engines, games, board_size, workers=None, max_turns=200, seed=0, settings=None, verbose=False):
+    """
+    Plays a match between two bots on a process pool. The first bot has the player's pieces, and so starts, in
+    the even games and the opponent's pieces in the odd games.
+
+    Parameters:
+        engines: tuple
+            Keys of MOVERS of the two bots.
+        games: int
+            Amount of games to play.
+        board_size: tuple
+            Board size in format (ROWS, COLUMNS).
+        workers: int
+            OPTIONAL. Default value: None. Amount of worker processes, None for the amount of CPUs.
+        max_turns: int
+            OPTIONAL. Default value: 200. Amount of turns after which a game is a draw.
+        seed: int
+            OPTIONAL. Default value: 0. Seed of the first game, game i is played with seed + i.
+        settings: dictionary
+            OPTIONAL. Default value: None. Further attributes of Constants to set in the workers, e.g.
+            {'SEARCH_TIME': 0.5}.
+        verbose: bool
+            OPTIONAL. Default value: False. Print the result of every game.
+
+    Output:
+        report: dictionary
+            'wins', 'draws' and 'losses' of the first bot, 'elo' and 'elo_margin' as returned by
+            elo_difference(), 'seconds' of the whole match, 'games_per_second', 'turns' played, and
+            'seconds_per_move', the average seconds per move of each bot.
+    """
+    # The workers of the match are the parallelism, so a parallel search bot searches in its own process only.
+    worker_settings = {'BOARD_SIZE': tuple(board_size), 'SEARCH_WORKERS': 1, 'STATS_LOG': None}
+    worker_settings.update(settings or {})
+    wins = draws = losses = turns = 0
+    seconds, moves = [0.0, 0.0], [0, 0]
+    start_time = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(workers or os.cpu_count() or 1, initializer=_apply_settings, initargs=(worker_settings,)) as executor:
+        futures = {}
+        for idx in range(games):
+            order = engines if idx % 2 == 0 else engines[::-1]
+            futures[executor.submit(play_game, order, max_turns, seed + idx)] = idx
+        for future in concurrent.futures.as_completed(futures):
+            idx, result = futures[future], future.result()
+            first = idx % 2  # Index of the first bot in the order of the game.
+            if result['winner'] is None:
+                draws += 1
+                outcome = 'draw'
+            elif result['winner'] == first:
+                wins += 1
+                outcome = 'win'
+            else:
+                losses += 1
+                outcome = 'loss'
+            turns += result['turns']
+            for engine_idx in range(2):
+                order_idx = engine_idx if first == 0 else 1 - engine_idx
+                seconds[engine_idx] += result['seconds'][order_idx]
+                moves[engine_idx] += result['moves'][order_idx]
+            if verbose:
+                print(f'game {idx + 1:4}: {engines[idx % 2]} starts, {outcome} of {engines[0]} after {result["turns"]} turns')
+    elapsed = time.perf_counter() - start_time
+    elo, margin = elo_difference(wins, draws, losses)
+    return {
+        'wins': wins, 'draws': draws, 'losses': losses,
+        'elo': elo, 'elo_margin': margin,
+        'seconds': elapsed, 'games_per_second': games / elapsed, 'turns': turns,
+        'seconds_per_move': [seconds[idx] / moves[idx] if moves[idx] else 0 for idx in range(2)],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Play a match between two bots without the window.')
+    parser.add_argument('engines', nargs=2, choices=sorted(MOVERS), help='the two bots')
+    parser.add_argument('--games', type=int, default=20, help='amount of games')
+    parser.add_argument('--size', type=int, default=8, choices=[8, 10, 12], help='board size')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='amount of worker processes')
+    parser.add_argument('--max-turns', type=int, default=200, help='amount of turns after which a game is a draw')
+    parser.add_argument('--seconds', type=float, default=Constants.SEARCH_TIME, help='time budget per move of the bots that search')
+    parser.add_argument('--nodes', type=int, default=None, help='node budget per move of the alpha-beta bots')
+    parser.add_argument('--playouts', type=int, default=None, help='playout budget per move of the MCTS bot')
+    parser.add_argument('--no-book', action='store_true', help='do not play the moves of the opening book')
+    parser.add_argument('--no-tablebase', action='store_true', help='do not play the moves of the endgame tablebase')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game')
+    parser.add_argument('--verbose', action='store_true', help='print the result of every game')
+    args = parser.parse_args(argv)
+    for name in ['games', 'workers', 'max_turns']:
+        if getattr(args, name) < 1:
+            parser.error(f'--{name.replace("_", "-")} has to be at least 1')
+
+    engines = tuple(args.engines)
+    settings = {
+        'SEARCH_TIME': args.seconds, 'SEARCH_NODES': args.nodes, 'MCTS_PLAYOUTS': args.playouts,
+        'OPENING_BOOK': not args.no_book, 'ENDGAME_TABLEBASE': not args.no_tablebase,
+    }
+    print(f'{engines[0]} vs {engines[1]} on {args.size}x{args.size}, {args.games} games, {args.workers} workers')
+    report = run_tournament(engines, args.games, (args.size, args.size), args.workers, args.max_turns, args.seed, settings, args.verbose)
+    games = report['wins'] + report['draws'] + report['losses']
+    score = (report['wins'] + 0.5 * report['draws']) / games
+    print(f'{engines[0]}: {report["wins"]} wins, {report["draws"]} draws, {report["losses"]} losses, score {score:.1%}')
+    print(f'Elo difference: {report["elo"]:+.0f} +/- {report["elo_margin"]:.0f} (95%)')
+    print(f'{report["games_per_second"]:.2f} games/s, {report["seconds"]:.1f} s, {report["turns"] / games:.0f} turns per game')
+    for engine, seconds in zip(engines, report['seconds_per_move']):
+        print(f'{engine}: {1000 * seconds:.1f} ms per move')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
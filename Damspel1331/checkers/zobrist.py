@@ -0,0 +1,73 @@
+import random
+
+from .constants import Constants
+
+
+class ZobristKeys:
+    """
+    Initialized through ZobristKeys.for_size() from the create_board() method of the Board class.
+
+    The ZobristKeys class holds the random 64-bit keys the hash of a board position is built from. The hash of a
+    position is the exclusive or of the key of every piece on the board, plus self.side_to_move_key when it is the
+    opponent's turn. As exclusive or is its own inverse, a piece leaving or entering a square changes the hash
+    with a single operation.
+
+    Keys are generated from a random generator seeded with the board size, which means that the same position
+    gets the same hash in every run of the program.
+    """
+    _keys = {}
+
+    def __init__(self, board_size):
+        """
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Instance variables initialized:
+            self.piece_keys: dictionary
+                Key is a tuple (is_player, king) and value is a matrix of size ROWS x COLUMNS with the key of
+                such a piece standing on each square. is_player is True for pieces of the player's color.
+                Keys do not depend on the colors chosen in the menu, only on which participant a piece
+                belongs to.
+            self.side_to_move_key: int
+                Key included in the hash when it is the opponent's turn.
+        """
+        rows, cols = board_size
+        generator = random.Random(f'zobrist {rows}x{cols}')
+        self.piece_keys = {}
+        for is_player in [True, False]:
+            for king in [False, True]:
+                self.piece_keys[is_player, king] = [[generator.getrandbits(64) for _ in range(cols)] for _ in range(rows)]
+        self.side_to_move_key = generator.getrandbits(64)
+
+    @classmethod
+    def for_size(cls, board_size):
+        """
+        Returns the keys of the given board size. Keys are only generated the first time a board size is used
+        and are then reused by every following board of that size.
+
+        Parameters:
+            board_size: tuple
+                Board size in format (ROWS, COLUMNS).
+
+        Output:
+            keys: ZobristKeys object
+        """
+        if board_size not in cls._keys:
+            cls._keys[board_size] = cls(board_size)
+        return cls._keys[board_size]
+
+    def get_key(self, piece, row, col):
+        """
+        Returns the key of a piece standing on the square (row, col).
+
+        Parameters:
+            piece: Piece object
+            row, col: int, int
+                Row and column of the square.
+
+        Output:
+            int
+                64-bit key.
+        """
+        return self.piece_keys[piece.color == Constants.PLAYER_COLOR, piece.king][row][col]
@@ -3,36 +3,47 @@ from checkers.constants import Constants
 from checkers.game import Game
 from checkers.menu import Menu
 from checkers.timer import Timer
-from checkers.bot import BotMover
+from checkers.movers import MOVERS
+from checkers.botworker import BotWorker
+from checkers.renderer import Renderer
+from checkers.scheduler import Scheduler
 
 def main():
     """
     Main function of the game. The pygame workspace is defined and instances of the 
-    game-necessary classes Game, Timer and Menu are initialized. The main function also
-    contains the while-loop of the game.
+    game-necessary classes Game, Renderer, Timer and Menu are initialized. The main function also
+    contains the while-loop of the game. The bot thinks in the background through a BotWorker instance, so the
+    window keeps responding while it does. Every iteration, only the areas of the window that the renderer and
+    the menu drew on are pushed to the display, in a single update. Between iterations the while-loop sleeps
+    until there is an event, a bot move or a new second to show, see the Scheduler class.
     """
     pygame.init()
     WINDOW = pygame.display.set_mode((Constants.WIDTH, Constants.HEIGHT))
     pygame.display.set_caption('Checkers DD1331')
 
     timer = Timer()    
-    game = Game(WINDOW)
-    menu = Menu(WINDOW, game=game, timer=timer)
+    game = Game()
+    renderer = Renderer(WINDOW, game)
+    bot_worker = BotWorker(game)
+    menu = Menu(WINDOW, game=game, timer=timer, bot_worker=bot_worker)
+    scheduler = Scheduler(timer, bot_worker)
 
     run = True
+    events = []
     while run:
         timer.update_time()
 
-        if Constants.BOT_ACTIVE and game.turn == Constants.OPPONENT_COLOR and not game.board.winner():
-            BotMover(game)
-            game.change_turn()
-
-        for event in pygame.event.get():
+        redraw_all = False
+        for event in events:
             if event.type == pygame.QUIT:
                 run = False
+            if event.type == pygame.WINDOWEXPOSED:
+                redraw_all = True
             if event.type == pygame.MOUSEBUTTONDOWN:
                 pos = pygame.mouse.get_pos()
                 if board_is_clicked(pos):
+                    if bot_worker.is_busy():
+                        continue
                     row, col = get_row_col_from_mouse(pos)
                     if not game.selected_piece:
                         game.select_piece(row, col)
@@ -47,9 +58,21 @@ def main():
                 else:
                     menu.select(pos)
 
-        game.update()
-        menu.update() 
+        bot_worker.update()
+        if Constants.BOT_ACTIVE and not game.board.winner() and not bot_worker.is_busy():
+            if game.turn == Constants.OPPONENT_COLOR:
+                bot_worker.start(MOVERS[Constants.BOT_ENGINE]).add_done_callback(scheduler.wake)
+            else:
+                bot_worker.ponder(MOVERS[Constants.BOT_ENGINE])
+
+        dirty_rects = renderer.draw() + menu.update()
+        if redraw_all:
+            pygame.display.update()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+        events = scheduler.wait()
 
+    bot_worker.cancel()
     pygame.quit()
 
 